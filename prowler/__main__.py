@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
+import functools
 import os
 import sys
 
+from colorama import Fore, Style
+
+from prowler.config.config import output_file_timestamp
 from prowler.lib.banner import print_banner
 from prowler.lib.check.check import (
     bulk_load_checks_metadata,
@@ -25,16 +30,36 @@ from prowler.lib.check.check import (
 from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.cli.parser import ProwlerArgumentParser
+from prowler.lib.incremental_scan.incremental_scan import (
+    get_audit_identity,
+    incremental_scan,
+)
 from prowler.lib.logger import logger, set_logging_config
 from prowler.lib.outputs.compliance import display_compliance_table
-from prowler.lib.outputs.html import add_html_footer, fill_html_overview_statistics
+from prowler.lib.outputs.file_descriptors import close_output_session
+from prowler.lib.outputs.html import add_html_footer
 from prowler.lib.outputs.json import close_json
-from prowler.lib.outputs.outputs import extract_findings_statistics, send_to_s3_bucket
+from prowler.lib.outputs.outputs import (
+    Findings_Aggregator,
+    extract_findings_statistics,
+    send_to_s3_bucket,
+)
 from prowler.lib.outputs.slack import send_slack_message
 from prowler.lib.outputs.summary_table import display_summary_table
+from prowler.lib.profiler.profiler import scan_profiler
+from prowler.providers.aws.lib.organizations_scan.organizations_scan import (
+    default_parallel_accounts,
+    get_organization_account_role_arn,
+    get_organization_accounts,
+    merge_organization_outputs,
+    scan_organization_accounts,
+)
 from prowler.providers.aws.lib.security_hub.security_hub import (
     resolve_security_hub_previous_findings,
 )
+from prowler.providers.aws.services.awslambda.lib.code_fetcher import (
+    lambda_code_fetcher,
+)
 from prowler.providers.common.allowlist import set_provider_allowlist
 from prowler.providers.common.audit_info import (
     set_provider_audit_info,
@@ -51,14 +76,7 @@ def prowler():
 
     # Save Arguments
     provider = args.provider
-    checks = args.checks
-    excluded_checks = args.excluded_checks
-    excluded_services = args.excluded_services
-    services = args.services
-    categories = args.categories
-    checks_file = args.checks_file
     checks_folder = args.checks_folder
-    severities = args.severity
     compliance_framework = args.compliance
 
     if not args.no_banner:
@@ -71,6 +89,10 @@ def prowler():
     # Set Logger configuration
     set_logging_config(args.log_level, args.log_file, args.only_logs)
 
+    # Measure the scan if --profiling
+    if args.profiling:
+        scan_profiler.enable()
+
     if args.list_services:
         print_services(list_services(provider))
         sys.exit()
@@ -113,6 +135,42 @@ def prowler():
     if checks_folder:
         parse_checks_from_folder(audit_info, checks_folder, provider)
 
+    # Scan every account of the AWS Organization or only the audited one
+    if provider == "aws" and args.scan_organization:
+        stats = scan_organization(
+            args, audit_info, bulk_checks_metadata, bulk_compliance_frameworks
+        )
+    else:
+        stats, _ = scan(
+            provider, args, audit_info, bulk_checks_metadata, bulk_compliance_frameworks
+        )
+
+    # If custom checks were passed, remove the modules
+    if checks_folder:
+        remove_custom_checks_module(checks_folder, provider)
+
+    # If there are failed findings exit code 3, except if -z is input
+    if not args.ignore_exit_code_3 and stats["total_fail"] > 0:
+        sys.exit(3)
+
+
+def scan(
+    provider: str,
+    args,
+    audit_info,
+    bulk_checks_metadata: dict,
+    bulk_compliance_frameworks: dict,
+) -> tuple:
+    """scan executes the checks in the audited account writing the outputs, and returns the findings statistics and the outputs filename"""
+    checks = args.checks
+    excluded_checks = args.excluded_checks
+    excluded_services = args.excluded_services
+    services = args.services
+    categories = args.categories
+    checks_file = args.checks_file
+    severities = args.severity
+    compliance_framework = args.compliance
+
     # Load checks to execute
     checks_to_execute = load_checks_to_execute(
         bulk_checks_metadata,
@@ -157,19 +215,45 @@ def prowler():
         run_provider_quick_inventory(provider, audit_info, args.output_directory)
         sys.exit()
 
-    # Execute checks
-    findings = []
+    # Reuse the results of the previous scan of the account if --incremental
+    if args.incremental:
+        incremental_scan.enable(
+            args.incremental, provider, get_audit_identity(provider, audit_info)
+        )
+
+    # Execute checks, their findings are aggregated while they are reported
+    findings_aggregator = Findings_Aggregator()
     if len(checks_to_execute):
-        findings = execute_checks(
-            checks_to_execute, provider, audit_info, audit_output_options
+        findings_aggregator = execute_checks(
+            checks_to_execute,
+            provider,
+            audit_info,
+            audit_output_options,
+            args.parallel_checks,
+            args.prefetch_services,
         )
     else:
         logger.error(
             "There are no checks to execute. Please, check your input arguments"
         )
 
+    # Remove the Lambda code packages downloaded for the checks
+    if provider == "aws":
+        lambda_code_fetcher.shutdown()
+
+    # Close the output files to complete them
+    close_output_session(audit_output_options)
+
+    # Write the findings count of every requirement of the compliance frameworks
+    if findings_aggregator.compliance_aggregator:
+        findings_aggregator.compliance_aggregator.write_summaries(
+            audit_output_options.output_filename,
+            audit_output_options.output_directory,
+            get_audit_identity(provider, audit_info),
+        )
+
     # Extract findings stats
-    stats = extract_findings_statistics(findings)
+    stats = extract_findings_statistics(findings_aggregator)
 
     if args.slack:
         if "SLACK_API_TOKEN" in os.environ and "SLACK_CHANNEL_ID" in os.environ:
@@ -195,10 +279,7 @@ def prowler():
                 )
             if mode == "html":
                 add_html_footer(
-                    audit_output_options.output_filename, args.output_directory
-                )
-                fill_html_overview_statistics(
-                    stats, audit_output_options.output_filename, args.output_directory
+                    audit_output_options.output_filename, args.output_directory, stats
                 )
             # Send output to S3 if needed (-B / -D)
             if provider == "aws" and (
@@ -218,6 +299,19 @@ def prowler():
                     bucket_session,
                 )
 
+    # Send the remaining findings to Security Hub
+    if provider == "aws" and args.security_hub:
+        security_hub_exporter = audit_output_options.security_hub_exporter
+        success_count = security_hub_exporter.close()
+        failed_count = security_hub_exporter.failed_count
+        if not args.only_logs and (success_count or failed_count):
+            print("\nSecurity Hub findings by region:")
+            for region in sorted(success_count.keys() | failed_count.keys()):
+                print(
+                    f" - {region}: {success_count.get(region, 0)} sent and {failed_count.get(region, 0)} failed"
+                )
+            print()
+
     # Resolve previous fails of Security Hub
     if provider == "aws" and args.security_hub and not args.skip_sh_update:
         resolve_security_hub_previous_findings(args.output_directory, audit_info)
@@ -225,30 +319,124 @@ def prowler():
     # Display summary table
     if not args.only_logs:
         display_summary_table(
-            findings,
+            findings_aggregator,
             audit_info,
             audit_output_options,
             provider,
         )
 
-        if compliance_framework and findings:
+        if compliance_framework and findings_aggregator:
             for compliance in compliance_framework:
                 # Display compliance table
                 display_compliance_table(
-                    findings,
-                    bulk_checks_metadata,
+                    findings_aggregator.compliance_aggregator,
                     compliance,
                     audit_output_options.output_filename,
                     audit_output_options.output_directory,
                 )
 
-    # If custom checks were passed, remove the modules
-    if checks_folder:
-        remove_custom_checks_module(checks_folder, provider)
+    # Write the profiling report
+    if args.profiling:
+        profiling_report = scan_profiler.write_report(
+            audit_output_options.output_directory, audit_output_options.output_filename
+        )
+        if not args.only_logs:
+            print(f"\nProfiling report: {profiling_report}\n")
+
+    # Store the results to be reused by the next incremental scan
+    if args.incremental:
+        resources_changes = incremental_scan.write()
+        if not args.only_logs:
+            print(
+                f"\nIncremental scan: {incremental_scan.reused_checks} checks reused and {incremental_scan.evaluated_checks} evaluated, "
+                f"{resources_changes['new']} new, {resources_changes['changed']} changed and {resources_changes['deleted']} deleted resources since the previous scan\n"
+            )
 
-    # If there are failed findings exit code 3, except if -z is input
-    if not args.ignore_exit_code_3 and stats["total_fail"] > 0:
-        sys.exit(3)
+    return stats, audit_output_options.output_filename
+
+
+def scan_organization_account(
+    account: dict,
+    partition: str,
+    args,
+    bulk_checks_metadata: dict,
+    bulk_compliance_frameworks: dict,
+) -> tuple:
+    """scan_organization_account scans an account of the AWS Organization assuming the organization scan role"""
+    account_args = copy.deepcopy(args)
+    account_args.role = get_organization_account_role_arn(
+        partition, account["Id"], args.scan_organization
+    )
+    account_args.no_banner = True
+    # Every account has its own outputs, named after the account by default
+    if args.output_filename:
+        account_args.output_filename = f"{args.output_filename}-{account['Id']}"
+    audit_info = set_provider_audit_info("aws", account_args.__dict__)
+    return scan(
+        "aws",
+        account_args,
+        audit_info,
+        bulk_checks_metadata,
+        bulk_compliance_frameworks,
+    )
+
+
+def scan_organization(
+    args, audit_info, bulk_checks_metadata: dict, bulk_compliance_frameworks: dict
+) -> dict:
+    """scan_organization scans the accounts of the AWS Organization concurrently and returns the findings statistics of all of them"""
+    accounts = get_organization_accounts(audit_info, args.organizations_role)
+    parallel_accounts = args.parallel_accounts or default_parallel_accounts
+    if not args.only_logs:
+        print(
+            f"Scanning {Fore.YELLOW}{len(accounts)}{Style.RESET_ALL} accounts of the AWS Organization, {parallel_accounts} at a time, assuming the role {Fore.YELLOW}{args.scan_organization}{Style.RESET_ALL}\n"
+        )
+    scanner = functools.partial(
+        scan_organization_account,
+        partition=audit_info.audited_partition,
+        args=args,
+        bulk_checks_metadata=bulk_checks_metadata,
+        bulk_compliance_frameworks=bulk_compliance_frameworks,
+    )
+    stats = {
+        "total_pass": 0,
+        "total_fail": 0,
+        "resources_count": 0,
+        "findings_count": 0,
+    }
+    accounts_output_filenames = []
+    for result in scan_organization_accounts(accounts, scanner, parallel_accounts):
+        if result["stats"]:
+            for stat in stats:
+                stats[stat] += result["stats"].get(stat, 0)
+            accounts_output_filenames.append(result["output_filename"])
+        if not args.only_logs:
+            if result["error"]:
+                account_status = f"{Fore.RED}{result['error']}{Style.RESET_ALL}"
+            else:
+                account_status = f"{Fore.RED}{result['stats']['total_fail']} FAIL{Style.RESET_ALL}, {Fore.GREEN}{result['stats']['total_pass']} PASS{Style.RESET_ALL}"
+            print(
+                f"Account {Fore.YELLOW}{result['account']}{Style.RESET_ALL} {result['name']}: {account_status} ({result['duration']}s)"
+            )
+
+    # Merge the outputs of the accounts
+    if args.merge_outputs and args.output_modes:
+        merged_files = merge_organization_outputs(
+            args.output_directory,
+            accounts_output_filenames,
+            args.output_filename
+            or f"prowler-output-organization-{audit_info.audited_account}-{output_file_timestamp}",
+        )
+        if not args.only_logs:
+            print("\nMerged outputs:")
+            for merged_file in merged_files:
+                print(f" - {merged_file}")
+
+    if not args.only_logs:
+        print(
+            f"\nOrganization scan: {Fore.RED}{stats['total_fail']} FAIL{Style.RESET_ALL}, {Fore.GREEN}{stats['total_pass']} PASS{Style.RESET_ALL} in {len(accounts_output_filenames)} of {len(accounts)} accounts\n"
+        )
+    return stats
 
 
 if __name__ == "__main__":
@@ -41,12 +41,19 @@ aws_services_json_file = "aws_regions_by_service.json"
 
 default_output_directory = getcwd() + "/output"
 
+# Default number of workers of --parallel-checks and --prefetch-services without a value
+default_parallel_checks = 4
+default_prefetch_services = 4
+
 output_file_timestamp = timestamp.strftime("%Y%m%d%H%M%S")
 timestamp_iso = timestamp.isoformat(sep=" ", timespec="seconds")
 csv_file_suffix = ".csv"
 json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 html_file_suffix = ".html"
+parquet_file_suffix = ".parquet"
+ndjson_file_suffix = ".ndjson"
+ndjson_asff_file_suffix = ".asff.ndjson"
 config_yaml = f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 
 
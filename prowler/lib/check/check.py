@@ -1,20 +1,38 @@
+import ast
 import functools
 import importlib
+import importlib.util
 import os
 import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pkgutil import walk_packages
 from types import ModuleType
-from typing import Any
+from typing import Any, Optional
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
 
-from prowler.config.config import orange_color
+from prowler.config.config import (
+    available_compliance_frameworks,
+    orange_color,
+    prowler_version,
+)
+from prowler.lib.check.checks_manifest import (
+    checks_manifest_version,
+    generate_checks_fingerprint,
+    load_checks_manifest,
+    write_checks_manifest,
+)
 from prowler.lib.check.compliance_models import load_compliance_framework
-from prowler.lib.check.models import Check, load_check_metadata
+from prowler.lib.check.models import (
+    Check,
+    load_check_metadata,
+    register_check_metadata,
+    unregister_check_metadata,
+)
 from prowler.lib.logger import logger
 
 try:
@@ -27,6 +45,11 @@ except Exception:
     sys.exit(1)
 
 import prowler
+from prowler.lib.incremental_scan.incremental_scan import incremental_scan
+from prowler.lib.outputs.compliance import Compliance_Aggregator
+from prowler.lib.outputs.outputs import Findings_Aggregator
+from prowler.lib.profiler.profiler import scan_profiler
+from prowler.lib.secrets_scanner.secrets_scanner import secrets_scanner
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.outputs import Provider_Output_Options
@@ -35,6 +58,7 @@ from prowler.providers.common.outputs import Provider_Output_Options
 # Load all checks metadata
 def bulk_load_checks_metadata(provider: str) -> dict:
     bulk_check_metadata = {}
+    checks_manifest = get_checks_manifest(provider)
     checks = recover_checks_from_provider(provider)
     # Build list of check's metadata files
     for check_info in checks:
@@ -43,9 +67,14 @@ def bulk_load_checks_metadata(provider: str) -> dict:
         check_path = check_info[1]
         # Append metadata file extension
         metadata_file = f"{check_path}/{check_name}.metadata.json"
-        # Load metadata
-        check_metadata = load_check_metadata(metadata_file)
+        # Load metadata, already validated if it is in the checks manifest
+        if checks_manifest and check_name in checks_manifest["checks"]:
+            check_metadata = checks_manifest["checks"][check_name]["metadata"]
+        else:
+            check_metadata = load_check_metadata(metadata_file)
         bulk_check_metadata[check_metadata.CheckID] = check_metadata
+        # Share the metadata with the checks and their findings
+        register_check_metadata(metadata_file, check_metadata)
 
     return bulk_check_metadata
 
@@ -149,6 +178,10 @@ def parse_checks_from_folder(audit_info, input_folder: str, provider: str) -> in
                     if os.path.exists(prowler_module):
                         shutil.rmtree(prowler_module)
                     shutil.copytree(check_module, prowler_module)
+                    # The check's metadata must be loaded from the custom check
+                    unregister_check_metadata(
+                        f"{prowler_module}/{check.name}.metadata.json"
+                    )
                     imported_checks += 1
         return imported_checks
     except Exception as error:
@@ -331,6 +364,25 @@ def recover_checks_from_provider(provider: str, service: str = None) -> list[tup
     """
     Recover all checks from the selected provider and service
 
+    Returns a list of tuples with the following format (check_name, check_path)
+    """
+    checks_manifest = get_checks_manifest(provider)
+    if checks_manifest:
+        checks = [
+            (check_name, check["path"])
+            for check_name, check in checks_manifest["checks"].items()
+            if not service or check["service"] == service
+        ]
+        if checks:
+            return checks
+    # The services without checks are reported by the discovery
+    return discover_checks_from_provider(provider, service)
+
+
+def discover_checks_from_provider(provider: str, service: str = None) -> list[tuple]:
+    """
+    discover_checks_from_provider looks for the checks modules of the selected provider and service
+
     Returns a list of tuples with the following format (check_name, check_path)
     """
     try:
@@ -356,6 +408,52 @@ def recover_checks_from_provider(provider: str, service: str = None) -> list[tup
         return checks
 
 
+# Checks manifest of each provider loaded in this execution
+checks_manifests = {}
+
+
+def get_checks_manifest(provider: str) -> Optional[dict]:
+    """
+    get_checks_manifest returns the provider's checks with their path, service and metadata
+
+    The manifest is stored after discovering the checks and validating their metadata,
+    and loaded in one read by the next executions while the checks are not modified.
+    """
+    try:
+        fingerprint = generate_checks_fingerprint(provider)
+        checks_manifest = checks_manifests.get(provider)
+        if not checks_manifest or checks_manifest["fingerprint"] != fingerprint:
+            checks_manifest = load_checks_manifest(provider, fingerprint)
+            if not checks_manifest:
+                checks_manifest = generate_checks_manifest(provider, fingerprint)
+                write_checks_manifest(provider, checks_manifest)
+            checks_manifests[provider] = checks_manifest
+        return checks_manifest
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def generate_checks_manifest(provider: str, fingerprint: str) -> dict:
+    """generate_checks_manifest discovers the provider's checks and loads their metadata"""
+    checks = {}
+    for check_name, check_path in discover_checks_from_provider(provider):
+        # Format: /absolute_path/prowler/providers/{provider}/services/{service_name}/{check_name}
+        checks[check_name] = {
+            "path": check_path,
+            "service": os.path.basename(os.path.dirname(check_path)),
+            "metadata": load_check_metadata(f"{check_path}/{check_name}.metadata.json"),
+        }
+    return {
+        "version": checks_manifest_version,
+        "prowler_version": prowler_version,
+        "fingerprint": fingerprint,
+        "checks": checks,
+    }
+
+
 def list_compliance_modules():
     """
     list_compliance_modules returns the available compliance frameworks and returns their path
@@ -386,35 +484,234 @@ def import_check(check_path: str) -> ModuleType:
     return lib
 
 
+@functools.lru_cache(maxsize=None)
+def parse_check_source(check_name: str, provider: str) -> Optional[ast.Module]:
+    """
+    parse_check_source returns the parsed source code of the check, or None if it is not found
+
+    The check's source code is parsed instead of imported since importing it builds the service clients.
+    """
+    # Recover service from check name
+    service = check_name.split("_")[0]
+    check_module_path = (
+        f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+    )
+    try:
+        check_spec = importlib.util.find_spec(check_module_path)
+        if not check_spec or not check_spec.origin:
+            return None
+        with open_file(check_spec.origin) as f:
+            return ast.parse(f.read())
+    # If check does not exists it will be reported during its execution
+    except ModuleNotFoundError:
+        return None
+    except Exception as error:
+        logger.error(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def recover_service_clients_from_checks(checks_to_execute: list, provider: str) -> list:
+    """recover_service_clients_from_checks returns the service client modules imported by the given checks"""
+    service_clients = set()
+    services_module_path = f"prowler.providers.{provider}.services."
+    for check_name in checks_to_execute:
+        check_source = parse_check_source(check_name, provider)
+        if not check_source:
+            continue
+        for node in ast.walk(check_source):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.module
+                and node.module.startswith(services_module_path)
+                and node.module.endswith("_client")
+            ):
+                service_clients.add(node.module)
+    return sorted(service_clients)
+
+
+@functools.lru_cache(maxsize=None)
+def recover_client_attributes_from_check(check_name: str, provider: str) -> dict:
+    """
+    recover_client_attributes_from_check returns the attributes of each service client used by the check
+
+    The format is {"<service>_client": {"<attribute>", ...}}, with None instead of the attributes
+    if the client is used as a whole (e.g. passed to a function) or the check is not found.
+    """
+    check_source = parse_check_source(check_name, provider)
+    if not check_source:
+        return None
+    services_module_path = f"prowler.providers.{provider}.services."
+    client_names = {}
+    for node in ast.walk(check_source):
+        if (
+            isinstance(node, ast.ImportFrom)
+            and node.module
+            and node.module.startswith(services_module_path)
+            and node.module.endswith("_client")
+        ):
+            for alias in node.names:
+                client_names[alias.asname or alias.name] = alias.name
+    client_attributes = {client: set() for client in client_names.values()}
+    attribute_values = set()
+    for node in ast.walk(check_source):
+        if (
+            isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in client_names
+        ):
+            attribute_values.add(id(node.value))
+            client = client_names[node.value.id]
+            if client_attributes[client] is not None:
+                client_attributes[client].add(node.attr)
+    for node in ast.walk(check_source):
+        if (
+            isinstance(node, ast.Name)
+            and node.id in client_names
+            and id(node) not in attribute_values
+        ):
+            client_attributes[client_names[node.id]] = None
+    return client_attributes
+
+
+@functools.lru_cache(maxsize=None)
+def is_time_dependent_check(check_name: str, provider: str) -> bool:
+    """is_time_dependent_check returns True if the check's results can change over time with the same resources, e.g. the unused credentials"""
+    check_source = parse_check_source(check_name, provider)
+    if not check_source:
+        return True
+    for node in ast.walk(check_source):
+        if isinstance(node, ast.Import) and any(
+            alias.name.split(".")[0] in ("datetime", "time") for alias in node.names
+        ):
+            return True
+        if isinstance(node, ast.ImportFrom) and node.module in ("datetime", "time"):
+            return True
+    return False
+
+
+def get_check_fingerprint(check: Check) -> Optional[str]:
+    """
+    get_check_fingerprint returns a hash of the check and the resources it evaluates
+
+    None is returned if the check's results cannot be reused, since it depends on the current time
+    or it uses a whole service client.
+    """
+    # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+    check_module = sys.modules[check.__module__]
+    provider = check.__module__.split(".")[2]
+    check_name = check.__module__.split(".")[-1]
+    client_attributes = recover_client_attributes_from_check(check_name, provider)
+    if not client_attributes or is_time_dependent_check(check_name, provider):
+        return None
+    clients = {}
+    for client, attributes in client_attributes.items():
+        service_client = getattr(check_module, client, None)
+        if attributes is None or service_client is None:
+            return None
+        clients[client] = (service_client, attributes)
+    return incremental_scan.get_check_fingerprint(check_module.__file__, clients)
+
+
+def execute_check(check: Check) -> list:
+    """execute_check returns the check's findings, reusing the ones of the previous scan if --incremental and its resources did not change"""
+    if not incremental_scan.enabled:
+        return scan_profiler.measure("checks", check.CheckID, check.execute)
+    check_fingerprint = get_check_fingerprint(check)
+    findings = incremental_scan.get_check_findings(check, check_fingerprint)
+    reused = findings is not None
+    if not reused:
+        findings = scan_profiler.measure("checks", check.CheckID, check.execute)
+    incremental_scan.set_check_findings(check, check_fingerprint, findings, reused)
+    return findings
+
+
+def prefetch_service_clients(
+    checks_to_execute: list, provider: str, prefetch_services: int
+):
+    """
+    prefetch_service_clients builds in parallel the service clients needed by the checks to execute
+
+    Each service client gathers its resources when its module is imported, so importing them
+    concurrently overlaps the API calls of the different services.
+    """
+    service_clients = recover_service_clients_from_checks(checks_to_execute, provider)
+    logger.info(
+        f"Prefetching {len(service_clients)} service clients with {prefetch_services} workers ..."
+    )
+    with ThreadPoolExecutor(
+        max_workers=prefetch_services, thread_name_prefix="prowler-service"
+    ) as executor:
+        futures = {
+            executor.submit(
+                scan_profiler.measure,
+                "services",
+                service_client.split(".")[-1],
+                importlib.import_module,
+                service_client,
+            ): service_client
+            for service_client in service_clients
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            # The error will be raised again while executing the checks of that service
+            except Exception as error:
+                logger.error(
+                    f"{futures[future]} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+
 def run_check(check: Check, output_options: Provider_Output_Options) -> list:
     findings = []
     if output_options.verbose:
-        print(
-            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
-        )
+        print_check_header(check)
     logger.debug(f"Executing check: {check.CheckID}")
     try:
-        findings = check.execute()
+        findings = execute_check(check)
     except Exception as error:
-        if not output_options.only_logs:
-            print(
-                f"Something went wrong in {check.CheckID}, please use --log-level ERROR"
-            )
-        logger.error(
-            f"{check.CheckID} -- {error.__class__.__name__}[{traceback.extract_tb(error.__traceback__)[-1].lineno}]: {error}"
-        )
+        report_check_error(check, error, output_options)
     finally:
         return findings
 
 
+def print_check_header(check: Check):
+    print(
+        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
+    )
+
+
+def report_check_error(
+    check: Check, error: Exception, output_options: Provider_Output_Options
+):
+    if not output_options.only_logs:
+        print(f"Something went wrong in {check.CheckID}, please use --log-level ERROR")
+    logger.error(
+        f"{check.CheckID} -- {error.__class__.__name__}[{traceback.extract_tb(error.__traceback__)[-1].lineno}]: {error}"
+    )
+
+
 def execute_checks(
     checks_to_execute: list,
     provider: str,
     audit_info: Any,
     audit_output_options: Provider_Output_Options,
-) -> list:
-    # List to store all the check's findings
-    all_findings = []
+    parallel_checks: int = None,
+    prefetch_services: int = None,
+) -> Findings_Aggregator:
+    """execute_checks runs the checks reporting their findings, which are aggregated but not retained"""
+    compliance_aggregator = None
+    compliance_frameworks = [
+        output_mode
+        for output_mode in audit_output_options.output_modes or []
+        if output_mode in available_compliance_frameworks
+    ]
+    if compliance_frameworks:
+        compliance_aggregator = Compliance_Aggregator(
+            audit_output_options.bulk_checks_metadata, compliance_frameworks
+        )
+    findings_aggregator = Findings_Aggregator(compliance_aggregator)
     # Services and checks executed for the Audit Status
     services_executed = set()
     checks_executed = set()
@@ -443,59 +740,30 @@ def execute_checks(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    # Build the required service clients concurrently before executing the checks,
+    # also one by one when profiling to measure each of them
+    if prefetch_services or scan_profiler.enabled:
+        prefetch_service_clients(checks_to_execute, provider, prefetch_services or 1)
+
     # Execution with the --only-logs flag
     if audit_output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                check_findings = execute(
-                    service,
-                    check_name,
-                    provider,
-                    audit_output_options,
-                    audit_info,
-                    services_executed,
-                    checks_executed,
-                )
-                all_findings.extend(check_findings)
-
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.critical(
-                    f"Check '{check_name}' was not found for the {provider.upper()} provider"
-                )
-                sys.exit(1)
-            except Exception as error:
-                logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-    else:
-        # Default execution
-        checks_num = len(checks_to_execute)
-        plural_string = "checks"
-        singular_string = "check"
-
-        check_noun = plural_string if checks_num > 1 else singular_string
-        print(
-            f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}\n"
-        )
-        with alive_bar(
-            total=len(checks_to_execute),
-            ctrl_c=False,
-            bar="blocks",
-            spinner="classic",
-            stats=False,
-            enrich_print=False,
-        ) as bar:
+        if parallel_checks:
+            execute_checks_in_parallel(
+                checks_to_execute,
+                provider,
+                audit_output_options,
+                audit_info,
+                services_executed,
+                checks_executed,
+                parallel_checks,
+                findings_aggregator,
+            )
+        else:
             for check_name in checks_to_execute:
                 # Recover service from check name
                 service = check_name.split("_")[0]
-                bar.title = (
-                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
-                )
                 try:
-                    check_findings = execute(
+                    execute(
                         service,
                         check_name,
                         provider,
@@ -503,34 +771,194 @@ def execute_checks(
                         audit_info,
                         services_executed,
                         checks_executed,
+                        findings_aggregator,
                     )
-                    all_findings.extend(check_findings)
-                    bar()
 
                 # If check does not exists in the provider or is from another provider
                 except ModuleNotFoundError:
                     logger.critical(
                         f"Check '{check_name}' was not found for the {provider.upper()} provider"
                     )
-                    bar.title = f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
                     sys.exit(1)
                 except Exception as error:
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
+    else:
+        # Default execution
+        checks_num = len(checks_to_execute)
+        plural_string = "checks"
+        singular_string = "check"
+
+        check_noun = plural_string if checks_num > 1 else singular_string
+        print(
+            f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}\n"
+        )
+        with alive_bar(
+            total=len(checks_to_execute),
+            ctrl_c=False,
+            bar="blocks",
+            spinner="classic",
+            stats=False,
+            enrich_print=False,
+        ) as bar:
+            if parallel_checks:
+                execute_checks_in_parallel(
+                    checks_to_execute,
+                    provider,
+                    audit_output_options,
+                    audit_info,
+                    services_executed,
+                    checks_executed,
+                    parallel_checks,
+                    findings_aggregator,
+                    bar,
+                )
+            else:
+                for check_name in checks_to_execute:
+                    # Recover service from check name
+                    service = check_name.split("_")[0]
+                    bar.title = (
+                        f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                    )
+                    try:
+                        execute(
+                            service,
+                            check_name,
+                            provider,
+                            audit_output_options,
+                            audit_info,
+                            services_executed,
+                            checks_executed,
+                            findings_aggregator,
+                        )
+                        bar()
+
+                    # If check does not exists in the provider or is from another provider
+                    except ModuleNotFoundError:
+                        logger.critical(
+                            f"Check '{check_name}' was not found for the {provider.upper()} provider"
+                        )
+                        bar.title = f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
+                        sys.exit(1)
+                    except Exception as error:
+                        logger.error(
+                            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
-    return all_findings
 
+    # Stop the secrets scanner workers shared by the checks
+    secrets_scanner.close()
+    return findings_aggregator
 
-def execute(
-    service: str,
-    check_name: str,
+
+def execute_checks_in_parallel(
+    checks_to_execute: list,
     provider: str,
     audit_output_options: Provider_Output_Options,
     audit_info: Any,
     services_executed: set,
     checks_executed: set,
+    parallel_checks: int,
+    findings_aggregator: Findings_Aggregator,
+    bar=None,
+):
+    """execute_checks_in_parallel runs the checks in a pool of parallel_checks workers
+
+    The checks are grouped by service and each group is run by a single worker, so every
+    service client is built once. The results are reported from the calling thread following
+    the checks_to_execute order, so the outputs, the Audit_Metadata and the progress bar are
+    the same as in the sequential execution.
+    """
+    # Group the checks by service keeping the execution order
+    checks_by_service = {}
+    for check_name in checks_to_execute:
+        service = check_name.split("_")[0]
+        checks_by_service.setdefault(service, []).append(check_name)
+    # One future per check to consume the results in order
+    checks_results = {check_name: Future() for check_name in checks_to_execute}
+
+    executor = ThreadPoolExecutor(
+        max_workers=parallel_checks, thread_name_prefix="prowler-check"
+    )
+    try:
+        for service, service_checks in checks_by_service.items():
+            executor.submit(
+                execute_service_checks,
+                service,
+                service_checks,
+                provider,
+                checks_results,
+            )
+
+        for check_name in checks_to_execute:
+            # Recover service from check name
+            service = check_name.split("_")[0]
+            if bar:
+                bar.title = (
+                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                )
+            try:
+                check, check_findings, check_error = checks_results[check_name].result()
+                # Release the findings once they are reported
+                del checks_results[check_name]
+                if audit_output_options.verbose:
+                    print_check_header(check)
+                if check_error:
+                    report_check_error(check, check_error, audit_output_options)
+
+                report_check_execution(
+                    service,
+                    check_name,
+                    check_findings,
+                    audit_output_options,
+                    audit_info,
+                    services_executed,
+                    checks_executed,
+                    findings_aggregator,
+                )
+                if bar:
+                    bar()
+
+            # If check does not exists in the provider or is from another provider
+            except ModuleNotFoundError:
+                logger.critical(
+                    f"Check '{check_name}' was not found for the {provider.upper()} provider"
+                )
+                if bar:
+                    bar.title = f"-> {Fore.RED}Scan was aborted!{Style.RESET_ALL}"
+                executor.shutdown(wait=False, cancel_futures=True)
+                sys.exit(1)
+            except Exception as error:
+                logger.error(
+                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+    finally:
+        executor.shutdown(wait=True)
+
+
+def execute_service_checks(
+    service: str, service_checks: list, provider: str, checks_results: dict
 ):
+    """execute_service_checks runs the given checks of a service, storing the result of each one in its future"""
+    for check_name in service_checks:
+        try:
+            check = load_check(service, check_name, provider)
+            logger.debug(f"Executing check: {check.CheckID}")
+            try:
+                check_findings = execute_check(check)
+                check_error = None
+            except Exception as error:
+                check_findings = []
+                check_error = error
+            checks_results[check_name].set_result((check, check_findings, check_error))
+        # Every future must be set, even if the check exits, or the reporting thread waits forever
+        except BaseException as error:
+            checks_results[check_name].set_exception(error)
+
+
+def load_check(service: str, check_name: str, provider: str) -> Check:
+    """load_check imports the check module and returns the check instance"""
     # Import check module
     check_module_path = (
         f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
@@ -538,11 +966,49 @@ def execute(
     lib = import_check(check_module_path)
     # Recover functions from check
     check_to_execute = getattr(lib, check_name)
-    c = check_to_execute()
+    return check_to_execute()
+
+
+def execute(
+    service: str,
+    check_name: str,
+    provider: str,
+    audit_output_options: Provider_Output_Options,
+    audit_info: Any,
+    services_executed: set,
+    checks_executed: set,
+    findings_aggregator: Findings_Aggregator = None,
+):
+    c = load_check(service, check_name, provider)
 
     # Run check
     check_findings = run_check(c, audit_output_options)
 
+    report_check_execution(
+        service,
+        check_name,
+        check_findings,
+        audit_output_options,
+        audit_info,
+        services_executed,
+        checks_executed,
+        findings_aggregator,
+    )
+
+    return check_findings
+
+
+def report_check_execution(
+    service: str,
+    check_name: str,
+    check_findings: list,
+    audit_output_options: Provider_Output_Options,
+    audit_info: Any,
+    services_executed: set,
+    checks_executed: set,
+    findings_aggregator: Findings_Aggregator = None,
+):
+    """report_check_execution updates the Audit Status, reports the check's findings and aggregates them"""
     # Update Audit Status
     services_executed.add(service)
     checks_executed.add(check_name)
@@ -552,8 +1018,8 @@ def execute(
 
     # Report the check's findings
     report(check_findings, audit_output_options, audit_info)
-
-    return check_findings
+    if findings_aggregator is not None:
+        findings_aggregator.add(check_findings)
 
 
 def update_audit_metadata(
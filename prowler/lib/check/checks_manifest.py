@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from typing import Optional
+
+import prowler
+from prowler.config.config import prowler_version
+from prowler.lib.check.models import (
+    Check_Metadata_Model,
+    Code,
+    Recommendation,
+    Remediation,
+)
+from prowler.lib.logger import logger
+
+# Format of the checks manifest, it must be increased when its content changes
+checks_manifest_version = 1
+# Default directory to store the checks manifests
+default_checks_manifest_directory = f"{pathlib.Path.home()}/.prowler/checks_manifest"
+
+
+def get_services_directory(provider: str) -> str:
+    return os.path.join(prowler.__path__[0], "providers", provider, "services")
+
+
+def generate_checks_fingerprint(provider: str) -> str:
+    """
+    generate_checks_fingerprint returns a hash of the provider's checks files
+
+    Any check added, removed or modified (e.g. custom checks copied with -x/--checks-folder)
+    changes the fingerprint, so the stored manifest is not used anymore.
+    """
+    services_directory = get_services_directory(provider)
+    fingerprint = hashlib.sha256(
+        f"{checks_manifest_version}:{prowler_version}:{services_directory}".encode()
+    )
+    for service in sorted(os.scandir(services_directory), key=lambda s: s.name):
+        if not service.is_dir() or service.name.startswith("__"):
+            continue
+        fingerprint.update(f"/{service.name}".encode())
+        for check in sorted(os.scandir(service.path), key=lambda c: c.name):
+            if not check.is_dir() or check.name.startswith("__"):
+                continue
+            fingerprint.update(f"/{check.name}".encode())
+            for extension in (".py", ".metadata.json"):
+                try:
+                    check_file = os.stat(f"{check.path}/{check.name}{extension}")
+                    fingerprint.update(
+                        f"{extension}:{check_file.st_mtime_ns}:{check_file.st_size}".encode()
+                    )
+                except FileNotFoundError:
+                    pass
+    return fingerprint.hexdigest()
+
+
+def parse_check_metadata(check_metadata: dict) -> Check_Metadata_Model:
+    """parse_check_metadata builds the Check's metadata stored in the manifest, already validated when it was generated"""
+    remediation = check_metadata["Remediation"]
+    return Check_Metadata_Model.construct(
+        **{
+            **check_metadata,
+            "Remediation": Remediation.construct(
+                Code=Code.construct(**remediation["Code"]),
+                Recommendation=Recommendation.construct(
+                    **remediation["Recommendation"]
+                ),
+            ),
+        }
+    )
+
+
+def load_checks_manifest(
+    provider: str,
+    fingerprint: str,
+    manifest_directory: str = default_checks_manifest_directory,
+) -> Optional[dict]:
+    """load_checks_manifest returns the stored checks manifest, or None if it is missing or outdated"""
+    manifest_file = f"{manifest_directory}/{provider}.json"
+    try:
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        if manifest.get("fingerprint") != fingerprint:
+            return None
+        for check in manifest["checks"].values():
+            check["metadata"] = parse_check_metadata(check["metadata"])
+        return manifest
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.warning(
+            f"{manifest_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def write_checks_manifest(
+    provider: str,
+    manifest: dict,
+    manifest_directory: str = default_checks_manifest_directory,
+):
+    """write_checks_manifest stores the checks manifest to be loaded by the next executions"""
+    manifest_file = f"{manifest_directory}/{provider}.json"
+    try:
+        stored_manifest = {
+            **manifest,
+            "checks": {
+                check_name: {**check, "metadata": check["metadata"].dict()}
+                for check_name, check in manifest["checks"].items()
+            },
+        }
+        os.makedirs(manifest_directory, exist_ok=True)
+        # Write it atomically since several executions can generate it at the same time
+        with tempfile.NamedTemporaryFile(
+            "w", dir=manifest_directory, delete=False
+        ) as f:
+            json.dump(stored_manifest, f)
+        os.replace(f.name, manifest_file)
+    except Exception as error:
+        logger.warning(
+            f"{manifest_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
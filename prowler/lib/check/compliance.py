@@ -10,59 +10,62 @@ from prowler.lib.check.models import Check_Metadata_Model
 from prowler.lib.logger import logger
 
 
+def index_compliance_frameworks(bulk_compliance_frameworks: dict) -> dict:
+    """
+    index_compliance_frameworks returns the compliance of each check, built in one pass over the frameworks
+
+    The format is {"<check>": [Compliance_Base_Model, ...]}, with one Compliance_Base_Model per
+    framework requirement including the check. The requirements without checks, the manual
+    controls, are indexed under None.
+    """
+    compliance_index = {None: []}
+    for framework in bulk_compliance_frameworks.values():
+        for requirement in framework.Requirements:
+            # Verify if requirement is Manual
+            if not requirement.Checks:
+                compliance_index[None].append(
+                    Compliance_Base_Model.construct(
+                        Framework=framework.Framework,
+                        Provider=framework.Provider,
+                        Version=framework.Version,
+                        Description=framework.Description,
+                        Requirements=[requirement],
+                    )
+                )
+                continue
+            # For the check metadata we don't need the "Checks" key, the
+            # requirement was already validated when the framework was loaded
+            compliance = Compliance_Base_Model.construct(
+                Framework=framework.Framework,
+                Provider=framework.Provider,
+                Version=framework.Version,
+                Description=framework.Description,
+                Requirements=[
+                    Compliance_Requirement.construct(
+                        Id=requirement.Id,
+                        Description=requirement.Description,
+                        Attributes=requirement.Attributes,
+                    )
+                ],
+            )
+            # The same compliance is shared by all the requirement's checks
+            for check in dict.fromkeys(requirement.Checks):
+                compliance_index.setdefault(check, []).append(compliance)
+    return compliance_index
+
+
 def update_checks_metadata_with_compliance(
     bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
 ):
     """Update the check metadata model with the compliance framework"""
     try:
+        compliance_index = index_compliance_frameworks(bulk_compliance_frameworks)
         for check in bulk_checks_metadata:
-            check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Create the Compliance_Requirement
-                        requirement = Compliance_Requirement(
-                            Id=requirement.Id,
-                            Description=requirement.Description,
-                            Attributes=requirement.Attributes,
-                            Checks=requirement.Checks,
-                        )
-                        # For the check metadata we don't need the "Checks" key
-                        delattr(requirement, "Checks")
-                        # Include the requirment into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance_Model
-                        compliance = Compliance_Base_Model(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
             # Save it into the check's metadata
-            bulk_checks_metadata[check].Compliance = check_compliance
+            bulk_checks_metadata[check].Compliance = compliance_index.get(check, [])
 
         # Add requirements of Manual Controls
-        for framework in bulk_compliance_frameworks.values():
-            for requirement in framework.Requirements:
-                compliance_requirements = []
-                # Verify if requirement is Manual
-                if not requirement.Checks:
-                    compliance_requirements.append(requirement)
-                    # Create the Compliance_Model
-                    compliance = Compliance_Base_Model(
-                        Framework=framework.Framework,
-                        Provider=framework.Provider,
-                        Version=framework.Version,
-                        Description=framework.Description,
-                        Requirements=compliance_requirements,
-                    )
-                    # Include the compliance framework for the check
-                    check_compliance.append(compliance)
+        if compliance_index[None]:
             # Create metadata for Manual Control
             manual_check_metadata = {
                 "Provider": "aws",
@@ -90,7 +93,7 @@ def update_checks_metadata_with_compliance(
             manual_check = parse_obj_as(Check_Metadata_Model, manual_check_metadata)
             # Save it into the check's metadata
             bulk_checks_metadata["manual_check"] = manual_check
-            bulk_checks_metadata["manual_check"].Compliance = check_compliance
+            bulk_checks_metadata["manual_check"].Compliance = compliance_index[None]
 
         return bulk_checks_metadata
     except Exception as e:
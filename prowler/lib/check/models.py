@@ -3,7 +3,7 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
 from prowler.lib.logger import logger
 
@@ -59,21 +59,24 @@ class Check_Metadata_Model(BaseModel):
 class Check(ABC, Check_Metadata_Model):
     """Prowler Check"""
 
+    # Shared metadata referenced by the check's findings
+    _metadata: Check_Metadata_Model = PrivateAttr()
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
-        # Parse the Check's metadata file
+        # Recover the Check's metadata, already validated with Pydantic
         metadata_file = (
             os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
             + ".metadata.json"
         )
-        # Store it to validate them with Pydantic
-        data = Check_Metadata_Model.parse_file(metadata_file).dict()
+        metadata = get_check_metadata(metadata_file)
         # Calls parents init function
-        super().__init__(**data)
+        super().__init__(**metadata.dict(exclude={"Compliance"}))
+        self._metadata = metadata
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def metadata(self) -> Check_Metadata_Model:
+        """Return the check's metadata shared by all its findings"""
+        return self._metadata
 
     @abstractmethod
     def execute(self):
@@ -92,7 +95,11 @@ class Check_Report:
 
     def __init__(self, metadata):
         self.status = ""
-        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        # The check's metadata is shared, the JSON representation is parsed
+        if isinstance(metadata, Check_Metadata_Model):
+            self.check_metadata = metadata
+        else:
+            self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
@@ -155,3 +162,27 @@ def load_check_metadata(metadata_file: str) -> Check_Metadata_Model:
         sys.exit(1)
     else:
         return check_metadata
+
+
+# Checks' metadata indexed by the absolute path of their metadata file
+checks_metadata = {}
+
+
+def register_check_metadata(metadata_file: str, check_metadata: Check_Metadata_Model):
+    """register_check_metadata shares a Check's metadata with the checks and their findings"""
+    checks_metadata[os.path.abspath(metadata_file)] = check_metadata
+
+
+def unregister_check_metadata(metadata_file: str):
+    """unregister_check_metadata removes a Check's metadata, e.g. if its file has been replaced"""
+    checks_metadata.pop(os.path.abspath(metadata_file), None)
+
+
+def get_check_metadata(metadata_file: str) -> Check_Metadata_Model:
+    """get_check_metadata returns the shared Check's metadata, loading it if it was not registered"""
+    metadata_file = os.path.abspath(metadata_file)
+    check_metadata = checks_metadata.get(metadata_file)
+    if not check_metadata:
+        check_metadata = load_check_metadata(metadata_file)
+        register_check_metadata(metadata_file, check_metadata)
+    return check_metadata
@@ -6,9 +6,22 @@ from prowler.config.config import (
     available_compliance_frameworks,
     check_current_version,
     default_output_directory,
+    default_parallel_checks,
+    default_prefetch_services,
 )
+from prowler.lib.incremental_scan.incremental_scan import (
+    default_incremental_scan_directory,
+)
+from prowler.lib.outputs.parquet import is_parquet_available
 from prowler.providers.aws.aws_provider import get_aws_available_regions
+from prowler.providers.aws.lib.api_cache.api_cache import (
+    default_api_cache_directory,
+    default_api_cache_ttl,
+)
 from prowler.providers.aws.lib.arn.arn import is_valid_arn
+from prowler.providers.aws.lib.organizations_scan.organizations_scan import (
+    default_parallel_accounts,
+)
 
 
 def arn_type(arn: str) -> bool:
@@ -98,6 +111,41 @@ Detailed documentation at https://docs.prowler.cloud
         if args.only_logs:
             args.no_banner = True
 
+        # The parquet output needs the optional pyarrow dependency
+        if (
+            args.output_modes
+            and "parquet" in args.output_modes
+            and not is_parquet_available()
+        ):
+            self.parser.error(
+                "The parquet output mode requires pyarrow, install it with: pip install pyarrow"
+            )
+
+        # The parallel checks execution needs at least one worker
+        if args.parallel_checks is not None and args.parallel_checks < 1:
+            self.parser.error("--parallel-checks must be greater than 0")
+        if args.prefetch_services is not None and args.prefetch_services < 1:
+            self.parser.error("--prefetch-services must be greater than 0")
+        for worker_pool_argument in ("aws_max_workers", "aws_max_workers_per_region"):
+            if getattr(args, worker_pool_argument, None) is not None:
+                if getattr(args, worker_pool_argument) < 1:
+                    self.parser.error(
+                        f"--{worker_pool_argument.replace('_', '-')} must be greater than 0"
+                    )
+
+        # The AWS Organization scan assumes its own role in every account
+        if getattr(args, "scan_organization", None):
+            if args.role:
+                self.parser.error("-R/--role cannot be used with --scan-organization")
+            if args.parallel_accounts is not None and args.parallel_accounts < 1:
+                self.parser.error("--parallel-accounts must be greater than 0")
+        elif getattr(args, "parallel_accounts", None) or getattr(
+            args, "merge_outputs", None
+        ):
+            self.parser.error(
+                "--parallel-accounts and --merge-outputs require --scan-organization"
+            )
+
         return args
 
     def __set_default_provider__(self, args: list) -> list:
@@ -125,7 +173,15 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="+",
             help="Output modes, by default csv, html and json",
             default=["csv", "json", "html"],
-            choices=["csv", "json", "json-asff", "html"],
+            choices=[
+                "csv",
+                "json",
+                "json-asff",
+                "ndjson",
+                "ndjson-asff",
+                "html",
+                "parquet",
+            ],
         )
         common_outputs_parser.add_argument(
             "-F",
@@ -140,6 +196,11 @@ Detailed documentation at https://docs.prowler.cloud
             help="Custom output directory, by default the folder where Prowler is stored",
             default=default_output_directory,
         )
+        common_outputs_parser.add_argument(
+            "--compress-html",
+            action="store_true",
+            help="Compress the findings embedded in the HTML report, it needs a browser supporting DecompressionStream",
+        )
         common_outputs_parser.add_argument(
             "--verbose",
             action="store_true",
@@ -154,6 +215,11 @@ Detailed documentation at https://docs.prowler.cloud
         common_outputs_parser.add_argument(
             "-b", "--no-banner", action="store_true", help="Hide Prowler banner"
         )
+        common_outputs_parser.add_argument(
+            "--profiling",
+            action="store_true",
+            help="Write a report next to the outputs ranking the time spent by the services, the checks and the API calls",
+        )
         common_outputs_parser.add_argument(
             "--slack",
             action="store_true",
@@ -239,6 +305,32 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="?",
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
+        common_checks_parser.add_argument(
+            "--parallel-checks",
+            nargs="?",
+            const=default_parallel_checks,
+            default=None,
+            type=int,
+            metavar="N",
+            help=f"Execute the checks in parallel using a pool of N workers ({default_parallel_checks} by default). Checks of the same service are executed by the same worker.",
+        )
+        common_checks_parser.add_argument(
+            "--prefetch-services",
+            nargs="?",
+            const=default_prefetch_services,
+            default=None,
+            type=int,
+            metavar="N",
+            help=f"Gather the resources of the services required by the checks before executing them, using N parallel workers ({default_prefetch_services} by default).",
+        )
+        common_checks_parser.add_argument(
+            "--incremental",
+            nargs="?",
+            const=default_incremental_scan_directory,
+            default=None,
+            metavar="DIRECTORY",
+            help=f"Reuse the findings of the previous scan of the same account for the checks whose resources did not change (Default directory: {default_incremental_scan_directory})",
+        )
 
     def __init_list_checks_parser__(self):
         # List checks options
@@ -323,6 +415,26 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="?",
             help="Specify AWS Organizations management role ARN to be assumed, to get Organization metadata",
         )
+        aws_orgs_subparser.add_argument(
+            "--scan-organization",
+            nargs="?",
+            default=None,
+            metavar="ROLE_NAME",
+            help="Scan every active account of the AWS Organization assuming the given role name in each of them. The accounts are listed with the -O/--organizations-role or with the current credentials",
+        )
+        aws_orgs_subparser.add_argument(
+            "--parallel-accounts",
+            nargs="?",
+            default=None,
+            type=int,
+            metavar="N",
+            help=f"Scan N accounts of the AWS Organization concurrently, each one in its own process (Default: {default_parallel_accounts})",
+        )
+        aws_orgs_subparser.add_argument(
+            "--merge-outputs",
+            action="store_true",
+            help="Merge the CSV and JSON outputs of the AWS Organization accounts into a single file per output mode",
+        )
         # AWS Security Hub
         aws_security_hub_subparser = aws_parser.add_argument_group("AWS Security Hub")
         aws_security_hub_subparser.add_argument(
@@ -408,6 +520,49 @@ Detailed documentation at https://docs.prowler.cloud
             type=int,
             help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
         )
+        boto3_config_subparser.add_argument(
+            "--aws-max-workers",
+            nargs="?",
+            default=None,
+            type=int,
+            help="Set the maximum number of concurrent API calls used to gather the AWS resources (Default: 32)",
+        )
+        boto3_config_subparser.add_argument(
+            "--aws-max-workers-per-region",
+            nargs="?",
+            default=None,
+            type=int,
+            help="Set the maximum number of concurrent API calls against the same AWS region (Default: 10)",
+        )
+        boto3_config_subparser.add_argument(
+            "--no-aws-rate-limiter",
+            action="store_true",
+            help="Disable the adaptive rate limit of the AWS API calls, relying only on the Boto3 retrier",
+        )
+
+        # API Cache
+        api_cache_subparser = aws_parser.add_argument_group("API Cache")
+        api_cache_subparser.add_argument(
+            "--api-cache",
+            nargs="?",
+            const=default_api_cache_directory,
+            default=None,
+            metavar="DIRECTORY",
+            help=f"Store the AWS API responses to reuse them in later scans (Default directory: {default_api_cache_directory})",
+        )
+        api_cache_subparser.add_argument(
+            "--api-cache-ttl",
+            nargs="?",
+            default=None,
+            type=int,
+            metavar="SECONDS",
+            help=f"Seconds the stored AWS API responses are reused (Default: {default_api_cache_ttl})",
+        )
+        api_cache_subparser.add_argument(
+            "--api-cache-replay",
+            action="store_true",
+            help="Only use the stored AWS API responses, regardless of their age, calling AWS only to identify the credentials",
+        )
 
     def __init_azure_parser__(self):
         """Init the Azure Provider CLI parser"""
@@ -0,0 +1,301 @@
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from prowler.config.config import config_yaml, prowler_version
+from prowler.lib.check import models
+from prowler.lib.logger import logger
+
+# Format of the incremental scan state, it must be increased when its content changes
+incremental_scan_state_version = 1
+# Default directory to store the incremental scan states
+default_incremental_scan_directory = f"{pathlib.Path.home()}/.prowler/incremental_scan"
+# Attributes identifying the resources of the service clients, by preference
+resource_key_attributes = ("arn", "id", "name")
+
+
+def encode_resource(value: Any):
+    """encode_resource returns the JSON representation of the resources' types not supported by JSON"""
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    # Resources defined as plain classes
+    if type(value).__module__.startswith("prowler.") and hasattr(value, "__dict__"):
+        return vars(value)
+    # Anything else, e.g. the API clients, changes every scan
+    return str(value)
+
+
+def fingerprint(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=encode_resource).encode()
+    ).hexdigest()
+
+
+def get_resource_key(resource: Any, index: int) -> str:
+    for attribute in resource_key_attributes:
+        key = getattr(resource, attribute, None)
+        if isinstance(key, str) and key:
+            return key
+    return str(index)
+
+
+def fingerprint_resources(value: Any) -> dict:
+    """fingerprint_resources returns the fingerprint of every resource of a service client's attribute by its key"""
+    if isinstance(value, dict):
+        resources = ((str(key), resource) for key, resource in value.items())
+    elif isinstance(value, (list, tuple)):
+        resources = (
+            (get_resource_key(resource, index), resource)
+            for index, resource in enumerate(value)
+        )
+    else:
+        resources = [("", value)]
+    resources_fingerprints = {}
+    for key, resource in resources:
+        # Resources with the same key, e.g. in different regions
+        if key in resources_fingerprints:
+            key = f"{key}#{len(resources_fingerprints)}"
+        resources_fingerprints[key] = fingerprint(resource)
+    return resources_fingerprints
+
+
+def get_audit_identity(provider: str, audit_info: Any) -> str:
+    """get_audit_identity returns the identifier of the audited account, subscriptions or project"""
+    if provider == "aws":
+        return str(audit_info.audited_account)
+    if provider == "azure":
+        return "-".join(audit_info.identity.tenant_ids)
+    return str(audit_info.project_id)
+
+
+def generate_state_fingerprint() -> str:
+    """generate_state_fingerprint returns a hash of what makes the whole state outdated, e.g. the configuration"""
+    state_fingerprint = hashlib.sha256(
+        f"{incremental_scan_state_version}:{prowler_version}".encode()
+    )
+    try:
+        with open(config_yaml, "rb") as f:
+            state_fingerprint.update(f.read())
+    except Exception as error:
+        logger.warning(
+            f"{config_yaml} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return state_fingerprint.hexdigest()
+
+
+class Incremental_Scan:
+    """
+    Incremental_Scan reuses the results of the previous scan of the same account for the checks whose resources did not change.
+
+    The state stores the fingerprint of every resource gathered by the service clients, the findings
+    of every check along with the fingerprint of the resources it evaluates, and the details of the
+    resources that never change once created (e.g. the documents of the IAM policy versions), so the
+    services do not request them again.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.state_file = None
+        self.previous_state = new_state()
+        self.state = new_state()
+        self.attributes_fingerprints = {}
+        self.reused_checks = 0
+        self.evaluated_checks = 0
+
+    def enable(self, state_directory: str, provider: str, identity: str):
+        """enable loads the state of the previous scan of the provider's account"""
+        self.enabled = True
+        self.state_file = f"{state_directory}/{provider}-{identity}.json"
+        state_fingerprint = generate_state_fingerprint()
+        self.previous_state = load_state(self.state_file, state_fingerprint)
+        self.state = new_state(state_fingerprint)
+        self.attributes_fingerprints = {}
+        self.reused_checks = 0
+        self.evaluated_checks = 0
+
+    def get_check_fingerprint(self, check_file: str, clients: dict) -> Optional[str]:
+        """
+        get_check_fingerprint returns a hash of the check and the resources it evaluates
+
+        The clients are in the format {"<service>_client": (<service client>, {"<attribute>", ...})}.
+        None is returned if any of the resources cannot be fingerprinted.
+        """
+        try:
+            check_stat = os.stat(check_file)
+            check_fingerprint = hashlib.sha256(
+                f"{check_file}:{check_stat.st_mtime_ns}:{check_stat.st_size}".encode()
+            )
+            for client in sorted(clients):
+                service_client, attributes = clients[client]
+                for attribute in sorted(attributes):
+                    attribute_fingerprint = self.__get_attribute_fingerprint__(
+                        client, service_client, attribute
+                    )
+                    if not attribute_fingerprint:
+                        return None
+                    check_fingerprint.update(
+                        f"{client}.{attribute}:{attribute_fingerprint}".encode()
+                    )
+            return check_fingerprint.hexdigest()
+        except Exception as error:
+            logger.warning(
+                f"{check_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    def get_check_findings(self, check: models.Check, check_fingerprint: str):
+        """get_check_findings returns the findings of the check in the previous scan, or None if its resources changed"""
+        previous_check = self.previous_state["checks"].get(check.CheckID)
+        if (
+            not check_fingerprint
+            or not previous_check
+            or previous_check["fingerprint"] != check_fingerprint
+        ):
+            return None
+        findings = []
+        for previous_finding in previous_check["findings"]:
+            finding_class = getattr(models, previous_finding["class"])
+            finding = finding_class(check.metadata())
+            for field, value in previous_finding.items():
+                if field != "class":
+                    setattr(finding, field, value)
+            findings.append(finding)
+        return findings
+
+    def set_check_findings(
+        self, check: models.Check, check_fingerprint: str, findings: list, reused: bool
+    ):
+        """set_check_findings stores the findings of the check before they are reported, e.g. allowlisted"""
+        with self._lock:
+            if reused:
+                self.reused_checks += 1
+            else:
+                self.evaluated_checks += 1
+            if check_fingerprint:
+                self.state["checks"][check.CheckID] = {
+                    "fingerprint": check_fingerprint,
+                    "findings": [
+                        {
+                            "class": type(finding).__name__,
+                            **{
+                                field: value
+                                for field, value in vars(finding).items()
+                                if field != "check_metadata"
+                            },
+                        }
+                        for finding in findings
+                    ],
+                }
+
+    def get_resource_detail(self, service: str, key: str) -> Optional[Any]:
+        """get_resource_detail returns the detail of a resource stored by the previous scan, or None if it was not stored"""
+        if not self.enabled:
+            return None
+        detail = self.previous_state["details"].get(service, {}).get(key)
+        if detail is not None:
+            self.set_resource_detail(service, key, detail)
+        return detail
+
+    def set_resource_detail(self, service: str, key: str, detail: Any):
+        """set_resource_detail stores the detail of a resource that does not change while its key is the same"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.state["details"].setdefault(service, {})[key] = detail
+
+    def write(self) -> dict:
+        """write stores the state to be reused by the next scan and returns how many resources changed"""
+        previous_resources = self.previous_state["resources"]
+        changes = {"new": 0, "changed": 0, "deleted": 0}
+        for attribute, resources in self.state["resources"].items():
+            previous_attribute_resources = previous_resources.get(attribute, {})
+            for key, resource_fingerprint in resources.items():
+                if key not in previous_attribute_resources:
+                    changes["new"] += 1
+                elif previous_attribute_resources[key] != resource_fingerprint:
+                    changes["changed"] += 1
+            changes["deleted"] += len(previous_attribute_resources.keys() - resources)
+        # The results of the services and checks not executed are kept, but only the details read
+        # by this scan, so the details of the resources deleted or recreated are not reused
+        for section in ("resources", "checks"):
+            self.state[section] = {
+                **self.previous_state[section],
+                **self.state[section],
+            }
+        try:
+            state_directory = os.path.dirname(self.state_file)
+            os.makedirs(state_directory, exist_ok=True)
+            # Write it atomically since the scan can be interrupted
+            with tempfile.NamedTemporaryFile(
+                "w", dir=state_directory, delete=False
+            ) as f:
+                json.dump(self.state, f, default=encode_resource)
+            os.replace(f.name, self.state_file)
+        except Exception as error:
+            logger.error(
+                f"{self.state_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return changes
+
+    def __get_attribute_fingerprint__(
+        self, client: str, service_client: Any, attribute: str
+    ) -> Optional[str]:
+        # Every attribute is fingerprinted once, the first time a check uses it
+        key = f"{client}.{attribute}"
+        if key not in self.attributes_fingerprints:
+            value = getattr(service_client, attribute)
+            if callable(value):
+                return None
+            resources_fingerprints = fingerprint_resources(value)
+            with self._lock:
+                self.state["resources"][key] = resources_fingerprints
+                self.attributes_fingerprints[key] = fingerprint(resources_fingerprints)
+        return self.attributes_fingerprints[key]
+
+
+def new_state(state_fingerprint: str = None) -> dict:
+    return {
+        "fingerprint": state_fingerprint,
+        "resources": {},
+        "checks": {},
+        "details": {},
+    }
+
+
+def load_state(state_file: str, state_fingerprint: str) -> dict:
+    """load_state returns the state stored by the previous scan, or an empty one if it is missing or outdated"""
+    state = new_state(state_fingerprint)
+    try:
+        with open(state_file) as f:
+            previous_state = json.load(f)
+        if previous_state.get("fingerprint") == state_fingerprint:
+            return previous_state
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"{state_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return state
+
+
+# Incremental scan shared by the whole scan, enabled with --incremental
+incremental_scan = Incremental_Scan()
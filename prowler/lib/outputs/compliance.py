@@ -1,179 +1,289 @@
 import sys
-from csv import DictWriter
+from csv import writer
+from dataclasses import dataclass
+from typing import Any
 
 from colorama import Fore, Style
 from tabulate import tabulate
 
-from prowler.config.config import orange_color, timestamp
+from prowler.config.config import (
+    available_compliance_frameworks,
+    csv_file_suffix,
+    orange_color,
+    timestamp,
+)
 from prowler.lib.check.models import Check_Report
 from prowler.lib.logger import logger
 from prowler.lib.outputs.models import (
     Check_Output_CSV_CIS,
+    Check_Output_CSV_Compliance_Summary,
     Check_Output_CSV_ENS_RD2022,
     Check_Output_CSV_Generic_Compliance,
     generate_csv_fields,
 )
+from prowler.lib.utils.utils import open_file
 
+# Columns of the compliance outputs filled by every finding, the rest are rendered once per check
+compliance_finding_columns = ("Region", "Status", "StatusExtended", "ResourceId")
+# Prefix of the columns with the attributes of the requirements
+compliance_attributes_prefix = "Requirements_Attributes_"
 
-def add_manual_controls(output_options, audit_info, file_descriptors):
-    try:
-        # Check if MANUAL control was already added to output
-        if "manual_check" in output_options.bulk_checks_metadata:
-            manual_finding = Check_Report(
-                output_options.bulk_checks_metadata["manual_check"].json()
+
+def get_compliance_output_mode(compliance) -> str:
+    """get_compliance_output_mode returns the output mode of the compliance framework, e.g. cis_1.5_aws"""
+    compliance_output = compliance.Framework
+    if compliance.Version != "":
+        compliance_output += "_" + compliance.Version
+    if compliance.Provider != "":
+        compliance_output += "_" + compliance.Provider
+    return compliance_output.lower().replace("-", "_")
+
+
+def get_compliance_output_model(compliance) -> Any:
+    """get_compliance_output_model returns the CSV format of the compliance framework"""
+    if compliance.Framework == "ENS" and compliance.Version == "RD2022":
+        return Check_Output_CSV_ENS_RD2022
+    if compliance.Framework == "CIS":
+        return Check_Output_CSV_CIS
+    return Check_Output_CSV_Generic_Compliance
+
+
+@dataclass
+class Compliance_Row_Template:
+    """Compliance_Row_Template is a row of a compliance output with every column rendered but the finding's ones"""
+
+    output_mode: str
+    columns: list
+    # Position of the compliance_finding_columns in the row
+    finding_columns: tuple
+
+    def render(self, finding) -> list:
+        row = self.columns.copy()
+        region, status, status_extended, resource_id = self.finding_columns
+        row[region] = finding.region
+        row[status] = finding.status
+        row[status_extended] = finding.status_extended
+        row[resource_id] = finding.resource_id
+        return row
+
+
+def generate_compliance_templates(
+    check_metadata, audit_info, output_modes
+) -> list[Compliance_Row_Template]:
+    """generate_compliance_templates returns a row per requirement attribute of the check in the selected compliance outputs"""
+    templates = []
+    for compliance in check_metadata.Compliance:
+        output_mode = get_compliance_output_mode(compliance)
+        if output_mode not in output_modes:
+            continue
+        output_model = get_compliance_output_model(compliance)
+        fields = generate_csv_fields(output_model)
+        finding_columns = tuple(
+            fields.index(column) for column in compliance_finding_columns
+        )
+        for requirement in compliance.Requirements:
+            for attribute in requirement.Attributes:
+                attributes_columns = {}
+                for field in fields:
+                    if field.startswith(compliance_attributes_prefix):
+                        value = getattr(
+                            attribute, field.removeprefix(compliance_attributes_prefix)
+                        )
+                        if isinstance(value, list):
+                            value = ",".join(value)
+                        attributes_columns[field] = value
+                compliance_row = output_model(
+                    Provider=check_metadata.Provider,
+                    Description=compliance.Description,
+                    AccountId=audit_info.audited_account,
+                    Region="",
+                    AssessmentDate=timestamp.isoformat(),
+                    Requirements_Id=requirement.Id,
+                    Requirements_Description=requirement.Description,
+                    **attributes_columns,
+                    Status="",
+                    StatusExtended="",
+                    ResourceId="",
+                    CheckId=check_metadata.CheckID,
+                )
+                templates.append(
+                    Compliance_Row_Template(
+                        output_mode,
+                        list(compliance_row.dict().values()),
+                        finding_columns,
+                    )
+                )
+    return templates
+
+
+class Compliance_Output:
+    """
+    Compliance_Output writes the findings to the selected compliance outputs, e.g. cis_1.5_aws.
+
+    The rows of every check's requirements are rendered once, when the output files are opened,
+    so every finding only fills in its region, status and resource. The manual controls, the
+    requirements without checks, are written once per framework with the first reported finding.
+    """
+
+    def __init__(self, bulk_checks_metadata: dict, audit_info, file_descriptors: dict):
+        self.writers = {
+            output_mode: writer(file_descriptor, delimiter=";")
+            for output_mode, file_descriptor in file_descriptors.items()
+            if output_mode in available_compliance_frameworks
+        }
+        self.templates = {}
+        for check_id, check_metadata in bulk_checks_metadata.items():
+            try:
+                templates = generate_compliance_templates(
+                    check_metadata, audit_info, self.writers
+                )
+                if templates:
+                    self.templates[check_id] = templates
+            except Exception as error:
+                logger.error(
+                    f"{check_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        self.manual_check_metadata = bulk_checks_metadata.get("manual_check")
+
+    def add_manual_controls(self):
+        try:
+            manual_templates = self.templates.pop("manual_check", ())
+            if manual_templates:
+                manual_finding = Check_Report(self.manual_check_metadata.json())
+                manual_finding.status = "INFO"
+                manual_finding.status_extended = "Manual check"
+                manual_finding.resource_id = "manual_check"
+                manual_finding.region = ""
+                for template in manual_templates:
+                    self.writers[template.output_mode].writerow(
+                        template.render(manual_finding)
+                    )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-            manual_finding.status = "INFO"
-            manual_finding.status_extended = "Manual check"
-            manual_finding.resource_id = "manual_check"
-            manual_finding.region = ""
-            fill_compliance(
-                output_options, manual_finding, audit_info, file_descriptors
+
+    def write(self, finding):
+        try:
+            for template in self.templates.get(finding.check_metadata.CheckID, ()):
+                self.writers[template.output_mode].writerow(template.render(finding))
+            # The manual controls are only written if any finding is reported
+            if "manual_check" in self.templates:
+                self.add_manual_controls()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-            del output_options.bulk_checks_metadata["manual_check"]
-    except Exception as error:
-        logger.error(
-            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-        )
 
 
-def fill_compliance(output_options, finding, audit_info, file_descriptors):
-    try:
-        # We have to retrieve all the check's compliance requirements
-        check_compliance = output_options.bulk_checks_metadata[
-            finding.check_metadata.CheckID
-        ].Compliance
-        for compliance in check_compliance:
-            csv_header = compliance_row = compliance_output = None
-            if (
-                compliance.Framework == "ENS"
-                and compliance.Version == "RD2022"
-                and "ens_rd2022_aws" in output_options.output_modes
-            ):
-                compliance_output = "ens_rd2022_aws"
-                for requirement in compliance.Requirements:
-                    requirement_description = requirement.Description
-                    requirement_id = requirement.Id
-                    for attribute in requirement.Attributes:
-                        compliance_row = Check_Output_CSV_ENS_RD2022(
-                            Provider=finding.check_metadata.Provider,
-                            Description=compliance.Description,
-                            AccountId=audit_info.audited_account,
-                            Region=finding.region,
-                            AssessmentDate=timestamp.isoformat(),
-                            Requirements_Id=requirement_id,
-                            Requirements_Description=requirement_description,
-                            Requirements_Attributes_IdGrupoControl=attribute.IdGrupoControl,
-                            Requirements_Attributes_Marco=attribute.Marco,
-                            Requirements_Attributes_Categoria=attribute.Categoria,
-                            Requirements_Attributes_DescripcionControl=attribute.DescripcionControl,
-                            Requirements_Attributes_Nivel=attribute.Nivel,
-                            Requirements_Attributes_Tipo=attribute.Tipo,
-                            Requirements_Attributes_Dimensiones=",".join(
-                                attribute.Dimensiones
-                            ),
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_id,
-                            CheckId=finding.check_metadata.CheckID,
-                        )
+@dataclass
+class Requirement_Status:
+    """Requirement_Status counts the findings of the checks of a compliance requirement"""
 
-                csv_header = generate_csv_fields(Check_Output_CSV_ENS_RD2022)
-
-            elif compliance.Framework == "CIS" and "cis_" in str(
-                output_options.output_modes
-            ):
-                # Only with the version of CIS that was selected
-                if "cis_" + compliance.Version + "_aws" in str(
-                    output_options.output_modes
-                ):
-                    compliance_output = "cis_" + compliance.Version + "_aws"
-                    for requirement in compliance.Requirements:
-                        requirement_description = requirement.Description
-                        requirement_id = requirement.Id
-                        for attribute in requirement.Attributes:
-                            compliance_row = Check_Output_CSV_CIS(
-                                Provider=finding.check_metadata.Provider,
-                                Description=compliance.Description,
-                                AccountId=audit_info.audited_account,
-                                Region=finding.region,
-                                AssessmentDate=timestamp.isoformat(),
-                                Requirements_Id=requirement_id,
-                                Requirements_Description=requirement_description,
-                                Requirements_Attributes_Section=attribute.Section,
-                                Requirements_Attributes_Profile=attribute.Profile,
-                                Requirements_Attributes_AssessmentStatus=attribute.AssessmentStatus,
-                                Requirements_Attributes_Description=attribute.Description,
-                                Requirements_Attributes_RationaleStatement=attribute.RationaleStatement,
-                                Requirements_Attributes_ImpactStatement=attribute.ImpactStatement,
-                                Requirements_Attributes_RemediationProcedure=attribute.RemediationProcedure,
-                                Requirements_Attributes_AuditProcedure=attribute.AuditProcedure,
-                                Requirements_Attributes_AdditionalInformation=attribute.AdditionalInformation,
-                                Requirements_Attributes_References=attribute.References,
-                                Status=finding.status,
-                                StatusExtended=finding.status_extended,
-                                ResourceId=finding.resource_id,
-                                CheckId=finding.check_metadata.CheckID,
-                            )
+    compliance: Any
+    requirement: Any
+    passed: int = 0
+    failed: int = 0
+    total: int = 0
 
-                    csv_header = generate_csv_fields(Check_Output_CSV_CIS)
 
-            else:
-                compliance_output = compliance.Framework
-                if compliance.Version != "":
-                    compliance_output += "_" + compliance.Version
-                if compliance.Provider != "":
-                    compliance_output += "_" + compliance.Provider
-
-                compliance_output = compliance_output.lower().replace("-", "_")
-                if compliance_output in output_options.output_modes:
-                    for requirement in compliance.Requirements:
-                        requirement_description = requirement.Description
-                        requirement_id = requirement.Id
-                        for attribute in requirement.Attributes:
-                            compliance_row = Check_Output_CSV_Generic_Compliance(
-                                Provider=finding.check_metadata.Provider,
-                                Description=compliance.Description,
-                                AccountId=audit_info.audited_account,
-                                Region=finding.region,
-                                AssessmentDate=timestamp.isoformat(),
-                                Requirements_Id=requirement_id,
-                                Requirements_Description=requirement_description,
-                                Requirements_Attributes_Section=attribute.Section,
-                                Requirements_Attributes_SubSection=attribute.SubSection,
-                                Requirements_Attributes_SubGroup=attribute.SubGroup,
-                                Requirements_Attributes_Service=attribute.Service,
-                                Requirements_Attributes_Soc_Type=attribute.Soc_Type,
-                                Status=finding.status,
-                                StatusExtended=finding.status_extended,
-                                ResourceId=finding.resource_id,
-                                CheckId=finding.check_metadata.CheckID,
-                            )
+class Compliance_Aggregator:
+    """
+    Compliance_Aggregator counts the findings of every requirement of the selected compliance frameworks while they are reported.
+
+    The requirements of every check are indexed once, so the findings are only added to the
+    counters of their check's requirements, and every compliance table and its CSV summary are
+    produced from the counters at the end of the scan, however many frameworks are selected.
+    """
 
-                    csv_header = generate_csv_fields(
-                        Check_Output_CSV_Generic_Compliance
+    def __init__(self, bulk_checks_metadata: dict, compliance_frameworks: list):
+        # Compliance of every framework, to name it even if it has no findings
+        self.frameworks = {}
+        # Requirements with findings of every framework, in the order they are reported
+        self.requirements = {framework: [] for framework in compliance_frameworks}
+        # Requirements of the selected frameworks of every check
+        self.checks_requirements = {}
+        requirements_status = {}
+        for check_id, check_metadata in bulk_checks_metadata.items():
+            for compliance in check_metadata.Compliance or []:
+                framework = get_compliance_output_mode(compliance)
+                if framework not in self.requirements:
+                    continue
+                self.frameworks.setdefault(framework, compliance)
+                for requirement in compliance.Requirements:
+                    # The requirements are shared by all their checks
+                    requirement_status = requirements_status.setdefault(
+                        id(requirement), Requirement_Status(compliance, requirement)
                     )
+                    self.checks_requirements.setdefault(check_id, []).append(
+                        (framework, requirement_status)
+                    )
+
+    def add(self, check_id: str, check_status: dict):
+        """add updates the counters of the check's requirements with its findings count by status"""
+        for framework, requirement_status in self.checks_requirements.get(check_id, ()):
+            if not requirement_status.total:
+                self.requirements[framework].append(requirement_status)
+            requirement_status.passed += check_status.get("PASS", 0)
+            requirement_status.failed += check_status.get("FAIL", 0)
+            requirement_status.total += sum(check_status.values())
 
-            if compliance_row:
-                csv_writer = DictWriter(
-                    file_descriptors[compliance_output],
-                    fieldnames=csv_header,
-                    delimiter=";",
+    def write_summaries(
+        self, output_filename: str, output_directory: str, account_id: str
+    ) -> list:
+        """write_summaries writes the findings count of every requirement of each framework and returns the files written"""
+        summary_files = []
+        for framework, requirements in self.requirements.items():
+            filename = f"{output_directory}/{output_filename}_{framework}_summary{csv_file_suffix}"
+            try:
+                with open_file(filename, "w") as summary_file:
+                    csv_writer = writer(summary_file, delimiter=";")
+                    csv_writer.writerow(
+                        [
+                            field.upper()
+                            for field in generate_csv_fields(
+                                Check_Output_CSV_Compliance_Summary
+                            )
+                        ]
+                    )
+                    for requirement_status in requirements:
+                        if requirement_status.failed:
+                            status = "FAIL"
+                        elif requirement_status.passed:
+                            status = "PASS"
+                        else:
+                            status = "INFO"
+                        summary_row = Check_Output_CSV_Compliance_Summary(
+                            Provider=requirement_status.compliance.Provider.lower(),
+                            Framework=requirement_status.compliance.Framework,
+                            Version=requirement_status.compliance.Version,
+                            AccountId=account_id,
+                            AssessmentDate=timestamp.isoformat(),
+                            Requirements_Id=requirement_status.requirement.Id,
+                            Requirements_Description=requirement_status.requirement.Description,
+                            Status=status,
+                            Pass=requirement_status.passed,
+                            Fail=requirement_status.failed,
+                            Total=requirement_status.total,
+                        )
+                        csv_writer.writerow(summary_row.dict().values())
+                summary_files.append(filename)
+            except Exception as error:
+                logger.error(
+                    f"{filename} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-                csv_writer.writerow(compliance_row.__dict__)
-    except Exception as error:
-        logger.error(
-            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-        )
+        return summary_files
 
 
 def display_compliance_table(
-    findings: list,
-    bulk_checks_metadata: dict,
+    compliance_aggregator: Compliance_Aggregator,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
 ):
     try:
+        requirements = compliance_aggregator.requirements.get(compliance_framework, [])
+        compliance = compliance_aggregator.frameworks.get(compliance_framework)
         if "ens_rd2022_aws" == compliance_framework:
             marcos = {}
             ens_compliance_table = {
@@ -186,47 +296,35 @@ def display_compliance_table(
                 "Opcional": [],
             }
             pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "ENS"
-                        and compliance.Provider == "AWS"
-                        and compliance.Version == "RD2022"
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        compliance_provider = compliance.Provider
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                marco_categoria = (
-                                    f"{attribute.Marco}/{attribute.Categoria}"
-                                )
-                                # Check if Marco/Categoria exists
-                                if marco_categoria not in marcos:
-                                    marcos[marco_categoria] = {
-                                        "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
-                                        "Opcional": 0,
-                                        "Alto": 0,
-                                        "Medio": 0,
-                                        "Bajo": 0,
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                    marcos[marco_categoria][
-                                        "Estado"
-                                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Nivel == "opcional":
-                                    marcos[marco_categoria]["Opcional"] += 1
-                                elif attribute.Nivel == "alto":
-                                    marcos[marco_categoria]["Alto"] += 1
-                                elif attribute.Nivel == "medio":
-                                    marcos[marco_categoria]["Medio"] += 1
-                                elif attribute.Nivel == "bajo":
-                                    marcos[marco_categoria]["Bajo"] += 1
+            compliance_fm = compliance.Framework if compliance else "ENS"
+            compliance_version = compliance.Version if compliance else "RD2022"
+            compliance_provider = compliance.Provider if compliance else "AWS"
+            for requirement_status in requirements:
+                for attribute in requirement_status.requirement.Attributes:
+                    marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
+                    # Check if Marco/Categoria exists
+                    if marco_categoria not in marcos:
+                        marcos[marco_categoria] = {
+                            "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
+                            "Opcional": 0,
+                            "Alto": 0,
+                            "Medio": 0,
+                            "Bajo": 0,
+                        }
+                    if requirement_status.failed:
+                        fail_count += requirement_status.failed
+                        marcos[marco_categoria][
+                            "Estado"
+                        ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
+                    pass_count += requirement_status.passed
+                    if attribute.Nivel == "opcional":
+                        marcos[marco_categoria]["Opcional"] += requirement_status.total
+                    elif attribute.Nivel == "alto":
+                        marcos[marco_categoria]["Alto"] += requirement_status.total
+                    elif attribute.Nivel == "medio":
+                        marcos[marco_categoria]["Medio"] += requirement_status.total
+                    elif attribute.Nivel == "bajo":
+                        marcos[marco_categoria]["Bajo"] += requirement_status.total
 
             # Add results to table
             for marco in marcos:
@@ -245,7 +343,7 @@ def display_compliance_table(
                 ens_compliance_table["Bajo"].append(
                     f"{Fore.YELLOW}{marcos[marco]['Bajo']}{Style.RESET_ALL}"
                 )
-            if fail_count + pass_count < 0:
+            if fail_count + pass_count < 1:
                 print(
                     f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_fm} {compliance_version} - {compliance_provider}{Style.RESET_ALL}.\n"
                 )
@@ -273,7 +371,10 @@ def display_compliance_table(
                 )
                 print(f"\nResultados detallados de {compliance_fm} en:")
                 print(
-                    f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
+                    f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv"
+                )
+                print(
+                    f" - CSV resumen: {output_directory}/{output_filename}_{compliance_framework}_summary.csv\n"
                 )
         elif "cis_1." in compliance_framework:
             sections = {}
@@ -284,40 +385,29 @@ def display_compliance_table(
                 "Level 2": [],
             }
             pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "CIS"
-                        and compliance.Version in compliance_framework
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                section = attribute.Section
-                                # Check if Section exists
-                                if section not in sections:
-                                    sections[section] = {
-                                        "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
-                                        "Level 1": {"FAIL": 0, "PASS": 0},
-                                        "Level 2": {"FAIL": 0, "PASS": 0},
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Profile == "Level 1":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 1"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 1"]["PASS"] += 1
-                                elif attribute.Profile == "Level 2":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 2"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 2"]["PASS"] += 1
+            compliance_fm = compliance.Framework if compliance else "CIS"
+            compliance_version = (
+                compliance.Version if compliance else compliance_framework.split("_")[1]
+            )
+            for requirement_status in requirements:
+                # Every finding that is not a FAIL counts as PASS in the levels
+                not_failed = requirement_status.total - requirement_status.failed
+                for attribute in requirement_status.requirement.Attributes:
+                    section = attribute.Section
+                    # Check if Section exists
+                    if section not in sections:
+                        sections[section] = {
+                            "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
+                            "Level 1": {"FAIL": 0, "PASS": 0},
+                            "Level 2": {"FAIL": 0, "PASS": 0},
+                        }
+                    fail_count += requirement_status.failed
+                    pass_count += requirement_status.passed
+                    if attribute.Profile in ("Level 1", "Level 2"):
+                        sections[section][attribute.Profile][
+                            "FAIL"
+                        ] += requirement_status.failed
+                        sections[section][attribute.Profile]["PASS"] += not_failed
 
             # Add results to table
             sections = dict(sorted(sections.items()))
@@ -368,12 +458,18 @@ def display_compliance_table(
                 )
                 print(f"\nDetailed results of {compliance_fm} are in:")
                 print(
-                    f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
+                    f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv"
+                )
+                print(
+                    f" - CSV summary: {output_directory}/{output_filename}_{compliance_framework}_summary.csv\n"
                 )
         else:
             print(f"\nDetailed results of {compliance_framework.upper()} are in:")
             print(
-                f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
+                f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv"
+            )
+            print(
+                f" - CSV summary: {output_directory}/{output_filename}_{compliance_framework}_summary.csv\n"
             )
     except Exception as error:
         logger.critical(
@@ -1,15 +1,22 @@
+import atexit
+import time
 from csv import DictWriter
 from io import TextIOWrapper
 from typing import Any
 
 from prowler.config.config import (
+    available_compliance_frameworks,
     csv_file_suffix,
     html_file_suffix,
     json_asff_file_suffix,
     json_file_suffix,
+    ndjson_asff_file_suffix,
+    ndjson_file_suffix,
+    parquet_file_suffix,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.html import add_html_header
+from prowler.lib.outputs.compliance import Compliance_Output
+from prowler.lib.outputs.html import HTML_Writer, add_html_header
 from prowler.lib.outputs.models import (
     Aws_Check_Output_CSV,
     Azure_Check_Output_CSV,
@@ -19,35 +26,44 @@ from prowler.lib.outputs.models import (
     Gcp_Check_Output_CSV,
     generate_csv_fields,
 )
+from prowler.lib.outputs.parquet import Parquet_Writer
 from prowler.lib.utils.utils import file_exists, open_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
 
 
+def get_csv_output_model(audit_info: Any):
+    """get_csv_output_model returns the CSV output model of the audited provider"""
+    if isinstance(audit_info, AWS_Audit_Info):
+        return Aws_Check_Output_CSV
+    if isinstance(audit_info, Azure_Audit_Info):
+        return Azure_Check_Output_CSV
+    if isinstance(audit_info, GCP_Audit_Info):
+        return Gcp_Check_Output_CSV
+
+
 def initialize_file_descriptor(
     filename: str,
     output_mode: str,
     audit_info: AWS_Audit_Info,
     format: Any = None,
+    buffering: int = -1,
 ) -> TextIOWrapper:
     """Open/Create the output file. If needed include headers or the required format"""
     try:
         if file_exists(filename):
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
+            file_descriptor = open_file(filename, "a", buffering)
         else:
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
+            file_descriptor = open_file(filename, "a", buffering)
 
             if output_mode in ("json", "json-asff"):
                 file_descriptor.write("[")
             elif "html" in output_mode:
                 add_html_header(file_descriptor, audit_info)
+            elif output_mode in ("ndjson", "ndjson-asff"):
+                # Every line is a finding, so nothing is written before them
+                pass
             else:
                 # Format is the class model of the CSV format to print the headers
                 csv_header = [x.upper() for x in generate_csv_fields(format)]
@@ -63,55 +79,80 @@ def initialize_file_descriptor(
     return file_descriptor
 
 
-def fill_file_descriptors(output_modes, output_directory, output_filename, audit_info):
+def fill_file_descriptors(
+    output_modes,
+    output_directory,
+    output_filename,
+    audit_info,
+    buffering: int = -1,
+    compress_html: bool = False,
+):
     try:
         file_descriptors = {}
         if output_modes:
             for output_mode in output_modes:
                 if output_mode == "csv":
                     filename = f"{output_directory}/{output_filename}{csv_file_suffix}"
-                    if isinstance(audit_info, AWS_Audit_Info):
-                        file_descriptor = initialize_file_descriptor(
-                            filename,
-                            output_mode,
-                            audit_info,
-                            Aws_Check_Output_CSV,
-                        )
-                    if isinstance(audit_info, Azure_Audit_Info):
-                        file_descriptor = initialize_file_descriptor(
-                            filename,
-                            output_mode,
-                            audit_info,
-                            Azure_Check_Output_CSV,
-                        )
-                    if isinstance(audit_info, GCP_Audit_Info):
-                        file_descriptor = initialize_file_descriptor(
-                            filename,
-                            output_mode,
-                            audit_info,
-                            Gcp_Check_Output_CSV,
-                        )
+                    file_descriptor = initialize_file_descriptor(
+                        filename,
+                        output_mode,
+                        audit_info,
+                        get_csv_output_model(audit_info),
+                        buffering,
+                    )
                     file_descriptors.update({output_mode: file_descriptor})
 
+                elif output_mode == "parquet":
+                    filename = (
+                        f"{output_directory}/{output_filename}{parquet_file_suffix}"
+                    )
+                    # The Parquet files are written by row groups instead of lines
+                    file_descriptors.update(
+                        {
+                            output_mode: Parquet_Writer(
+                                filename, get_csv_output_model(audit_info)
+                            )
+                        }
+                    )
+
                 elif output_mode == "json":
                     filename = f"{output_directory}/{output_filename}{json_file_suffix}"
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
+                    )
+                    file_descriptors.update({output_mode: file_descriptor})
+
+                elif output_mode == "ndjson":
+                    filename = (
+                        f"{output_directory}/{output_filename}{ndjson_file_suffix}"
+                    )
+                    file_descriptor = initialize_file_descriptor(
+                        filename, output_mode, audit_info, buffering=buffering
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "html":
                     filename = f"{output_directory}/{output_filename}{html_file_suffix}"
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
+                    )
+                    # The findings are embedded as data rendered by the report
+                    file_descriptors.update(
+                        {output_mode: HTML_Writer(file_descriptor, compress_html)}
                     )
-                    file_descriptors.update({output_mode: file_descriptor})
 
                 elif isinstance(audit_info, AWS_Audit_Info):
                     if output_mode == "json-asff":
                         filename = f"{output_directory}/{output_filename}{json_asff_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info
+                            filename, output_mode, audit_info, buffering=buffering
+                        )
+                        file_descriptors.update({output_mode: file_descriptor})
+
+                    elif output_mode == "ndjson-asff":
+                        filename = f"{output_directory}/{output_filename}{ndjson_asff_file_suffix}"
+                        file_descriptor = initialize_file_descriptor(
+                            filename, output_mode, audit_info, buffering=buffering
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -122,20 +163,29 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_ENS_RD2022,
+                            buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.5_aws":
                         filename = f"{output_directory}/{output_filename}_cis_1.5_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_CIS,
+                            buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.4_aws":
                         filename = f"{output_directory}/{output_filename}_cis_1.4_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_CIS,
+                            buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -147,6 +197,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_Generic_Compliance,
+                            buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -156,3 +207,94 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
         )
 
     return file_descriptors
+
+
+# Buffer size of the output files kept open during the scan
+output_buffer_size = 1024 * 1024
+# Seconds between the flushes of the output files
+output_flush_interval = 10
+
+
+class Output_Session:
+    """
+    Output_Session keeps the output files opened once for the whole scan, buffering the writes
+    in large blocks that are flushed periodically and when the session is closed.
+    """
+
+    def __init__(
+        self,
+        output_modes,
+        output_directory,
+        output_filename,
+        audit_info,
+        compress_html: bool = False,
+        bulk_checks_metadata: dict = None,
+    ):
+        self.file_descriptors = fill_file_descriptors(
+            output_modes,
+            output_directory,
+            output_filename,
+            audit_info,
+            output_buffer_size,
+            compress_html,
+        )
+        # The findings' rows are written by the same CSV writer for the whole scan
+        self.csv_writers = {}
+        if "csv" in self.file_descriptors:
+            self.csv_writers["csv"] = DictWriter(
+                self.file_descriptors["csv"],
+                fieldnames=generate_csv_fields(get_csv_output_model(audit_info)),
+                delimiter=";",
+            )
+        # The compliance rows of every check are rendered once for the whole scan
+        self.compliance_output = None
+        if bulk_checks_metadata and any(
+            output_mode in available_compliance_frameworks
+            for output_mode in self.file_descriptors
+        ):
+            self.compliance_output = Compliance_Output(
+                bulk_checks_metadata, audit_info, self.file_descriptors
+            )
+        self.last_flush = time.monotonic()
+        # The buffered findings must be written even if the execution is interrupted
+        atexit.register(self.close)
+
+    def flush(self, force: bool = True):
+        """flush writes the buffered data, if not forced only once per output_flush_interval"""
+        if force or time.monotonic() - self.last_flush >= output_flush_interval:
+            for file_descriptor in self.file_descriptors.values():
+                file_descriptor.flush()
+            self.last_flush = time.monotonic()
+
+    def close(self):
+        try:
+            for file_descriptor in self.file_descriptors.values():
+                if not file_descriptor.closed:
+                    file_descriptor.close()
+            self.csv_writers = {}
+            atexit.unregister(self.close)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+
+def get_output_session(output_options, audit_info) -> Output_Session:
+    """get_output_session returns the scan's Output_Session, opening the output files the first time"""
+    if not output_options.output_session:
+        output_options.output_session = Output_Session(
+            output_options.output_modes,
+            output_options.output_directory,
+            output_options.output_filename,
+            audit_info,
+            output_options.compress_html,
+            output_options.bulk_checks_metadata,
+        )
+    return output_options.output_session
+
+
+def close_output_session(output_options):
+    """close_output_session closes the scan's output files, if they were opened"""
+    if output_options.output_session:
+        output_options.output_session.close()
+        output_options.output_session = None
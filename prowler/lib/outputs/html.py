@@ -1,5 +1,9 @@
+import base64
 import importlib
+import json
 import sys
+import zlib
+from io import TextIOWrapper
 from os import path
 
 from prowler.config.config import (
@@ -13,7 +17,6 @@ from prowler.lib.check.models import Check_Report_AWS, Check_Report_GCP
 from prowler.lib.logger import logger
 from prowler.lib.outputs.models import (
     get_check_compliance,
-    parse_html_string,
     unroll_dict,
     unroll_tags,
 )
@@ -22,6 +25,11 @@ from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
 
+# Element of the HTML report with the findings, one JSON line per record
+html_findings_element_id = "findings-data"
+# Bytes of the compressed findings encoded per line of the HTML report, a multiple of 3 so the base64 lines can be joined
+html_compressed_line_size = 57 * 1024
+
 
 def add_html_header(file_descriptor, audit_info):
     try:
@@ -33,34 +41,12 @@ def add_html_header(file_descriptor, audit_info):
     <meta http-equiv="Content-Type" content="text/html; charset=UTF-8">
     <!-- Required meta tags -->
     <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
-    <style>
-        .read-more {
-            color: #00f;
-        }
-
-        .bg-success-custom {
-            background-color: #98dea7 !important;
-        }
-
-        .bg-danger {
-            background-color: #f28484 !important;
-        }
-    </style>
     <!-- Bootstrap CSS -->
     <link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.5.0/css/bootstrap.min.css"
         integrity="sha384-9aIt2nRpC12Uk9gS9baDl411NQApFmC26EwAOH8WgZl5MYYxFfc+NcPb1dKGj7Sk" crossorigin="anonymous">
-    <!-- https://datatables.net/download/index with jQuery, DataTables, Buttons, SearchPanes, and Select //-->
-    <link rel="stylesheet" type="text/css"
-        href="https://cdn.datatables.net/v/dt/jqc-1.12.4/dt-1.10.25/b-1.7.1/sp-1.4.0/sl-1.3.3/datatables.min.css" />
-    <link rel="stylesheet" href="https://pro.fontawesome.com/releases/v5.10.0/css/all.css"
-        integrity="sha384-AYmEC3Yw5cVb3ZcuHtOA93w35dYTsvhLPVnYs9eStHfGJvOvKxVfELGroGkvsg+p" crossorigin="anonymous" />
     <style>
-        .show-read-more .more-text {
-            display: none;
-        }
-
-        .dataTable {
-            font-size: 14px;
+        .bg-success-custom {
+            background-color: #98dea7 !important;
         }
 
         .container-fluid {
@@ -71,6 +57,56 @@ def add_html_header(file_descriptor, audit_info):
             float: left !important;
             max-width: 100%;
         }
+
+        /* Only the visible findings are rendered, every row has the same height */
+        .findings-grid {
+            display: grid;
+            grid-template-columns: 70px 100px 110px 120px 2fr 3fr 2fr 4fr;
+        }
+
+        .findings-grid > div {
+            padding: 0 6px;
+            line-height: 30px;
+            overflow: hidden;
+            white-space: nowrap;
+            text-overflow: ellipsis;
+        }
+
+        #findings-viewport {
+            height: 70vh;
+            overflow-y: auto;
+            border: 1px solid #dee2e6;
+        }
+
+        #findings-columns {
+            position: sticky;
+            top: 0;
+            z-index: 1;
+            font-weight: bold;
+            background-color: #e9ecef;
+        }
+
+        #findings-columns > div {
+            cursor: pointer;
+        }
+
+        #findings-rows {
+            position: relative;
+        }
+
+        .finding-row {
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 30px;
+            cursor: pointer;
+            border-bottom: 1px solid #dee2e6;
+        }
+
+        #finding-details dd {
+            white-space: pre-wrap;
+            word-break: break-word;
+        }
     </style>
     <title>Prowler - The Handy Cloud Security Tool</title>
     </head>
@@ -121,42 +157,69 @@ def add_html_header(file_descriptor, audit_info):
                 </div>
                 <ul class="list-group list-group-flush">
                     <li class="list-group-item">
-                        <b>Total Findings:</b> TOTAL_FINDINGS
+                        <b>Total Findings:</b> <span id="total-findings"></span>
                     </li>
                     <li class="list-group-item">
-                        <b>Passed:</b> TOTAL_PASS
+                        <b>Passed:</b> <span id="total-pass"></span>
                     </li>
                     <li class="list-group-item">
-                        <b>Failed:</b> TOTAL_FAIL
+                        <b>Failed:</b> <span id="total-fail"></span>
                     </li>
                     <li class="list-group-item">
-                        <b>Total Resources:</b> TOTAL_RESOURCES
+                        <b>Total Resources:</b> <span id="total-resources"></span>
                     </li>
                 </ul>
             </div>
         </div>
         </div>
         </div>
-        <div class="row-mt-3">
+        <div class="row mt-3">
         <div class="col-md-12">
-            <table class="table compact stripe row-border ordering" id="findingsTable" data-order='[[ 5, "asc" ]]' data-page-length='100'>
-            <thead class="thead-light">
-                <tr>
-                    <th scope="col">Status</th>
-                    <th scope="col">Severity</th>
-                    <th scope="col">Service Name</th>
-                    <th scope="col">Region</th>
-                    <th style="width:20%" scope="col">Check ID</th>
-                    <th style="width:20%" scope="col">Check Title</th>
-                    <th scope="col">Resource ID</th>
-                    <th scope="col">Resource Tags</th>
-                    <th scope="col">Status Extended</th>
-                    <th scope="col">Risk</th>
-                    <th scope="col">Recomendation</th>
-                    <th scope="col">Compliance</th>
-                </tr>
-            </thead>
-            <tbody>
+            <div class="form-row mb-2" id="findings-filters">
+                <div class="col-md-1">
+                    <select class="form-control form-control-sm" data-column="status"><option value="">Status</option></select>
+                </div>
+                <div class="col-md-1">
+                    <select class="form-control form-control-sm" data-column="severity"><option value="">Severity</option></select>
+                </div>
+                <div class="col-md-2">
+                    <select class="form-control form-control-sm" data-column="service"><option value="">Service Name</option></select>
+                </div>
+                <div class="col-md-2">
+                    <select class="form-control form-control-sm" data-column="region"><option value="">Region</option></select>
+                </div>
+                <div class="col-md-2">
+                    <select class="form-control form-control-sm" data-column="check_id"><option value="">Check ID</option></select>
+                </div>
+                <div class="col-md-3">
+                    <input class="form-control form-control-sm" id="findings-search" type="search" placeholder="Search">
+                </div>
+                <div class="col-md-1 text-right">
+                    <span class="align-middle" id="findings-count">Loading findings...</span>
+                </div>
+            </div>
+            <div id="findings-viewport">
+                <div class="findings-grid" id="findings-columns">
+                    <div data-column="status">Status</div>
+                    <div data-column="severity">Severity</div>
+                    <div data-column="service">Service Name</div>
+                    <div data-column="region">Region</div>
+                    <div data-column="check_id">Check ID</div>
+                    <div data-column="check_title">Check Title</div>
+                    <div data-column="resource_id">Resource ID</div>
+                    <div data-column="status_extended">Status Extended</div>
+                </div>
+                <div id="findings-rows"></div>
+            </div>
+            <div class="card mt-3 mb-3 d-none" id="finding-details">
+                <div class="card-header"></div>
+                <div class="card-body">
+                    <dl class="row mb-0"></dl>
+                </div>
+            </div>
+        </div>
+        </div>
+    </div>
     """
         )
     except Exception as error:
@@ -166,73 +229,110 @@ def add_html_header(file_descriptor, audit_info):
         sys.exit(1)
 
 
-def fill_html(file_descriptor, finding, output_options):
-    try:
-        row_class = "p-3 mb-2 bg-success-custom"
-        if finding.status == "INFO":
-            row_class = "table-info"
-        elif finding.status == "FAIL":
-            row_class = "table-danger"
-        elif finding.status == "WARNING":
-            row_class = "table-warning"
-        file_descriptor.write(
-            f"""
-                <tr class="{row_class}">
-                    <td>{finding.status}</td>
-                    <td>{finding.check_metadata.Severity}</td>
-                    <td>{finding.check_metadata.ServiceName}</td>
-                    <td>{finding.location if isinstance(finding, Check_Report_GCP) else finding.region if isinstance(finding, Check_Report_AWS) else ""}</td>
-                    <td>{finding.check_metadata.CheckID.replace("_", "<wbr>_")}</td>
-                    <td>{finding.check_metadata.CheckTitle}</td>
-                    <td>{finding.resource_id.replace("<", "&lt;").replace(">", "&gt;").replace("_", "<wbr>_")}</td>
-                    <td>{parse_html_string(unroll_tags(finding.resource_tags))}</td>
-                    <td>{finding.status_extended.replace("<", "&lt;").replace(">", "&gt;").replace("_", "<wbr>_")}</td>
-                    <td><p class="show-read-more">{finding.check_metadata.Risk}</p></td>
-                    <td><p class="show-read-more">{finding.check_metadata.Remediation.Recommendation.Text}</p> <a class="read-more" href="{finding.check_metadata.Remediation.Recommendation.Url}"><i class="fas fa-external-link-alt"></i></a></td>
-                    <td><p class="show-read-more">{parse_html_string(unroll_dict(get_check_compliance(finding, finding.check_metadata.Provider, output_options)))}</p></td>
-                </tr>
-                """
+class HTML_Writer:
+    """
+    HTML_Writer writes the findings to the HTML report as they are reported, in a single pass.
+
+    The findings are embedded as compact JSON lines that the report renders in the browser, so only
+    the visible rows are in the page. The metadata of every check is written once, the first time
+    one of its findings is written, and the findings refer to it. If compressed, the lines are
+    gzipped and base64 encoded while they are written.
+    """
+
+    def __init__(self, file_descriptor: TextIOWrapper, compressed: bool = False):
+        self.file_descriptor = file_descriptor
+        self.compressed = compressed
+        # Position of every check written in the report by its ID
+        self.checks = {}
+        self._compressor = None
+        # Compressed bytes not encoded yet
+        self._pending = b""
+        if compressed:
+            self._compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        # The findings are not parsed as HTML nor JavaScript
+        self.file_descriptor.write(
+            f'<script type="text/plain" id="{html_findings_element_id}" data-compressed="{str(compressed).lower()}">\n'
         )
-    except Exception as error:
-        logger.critical(
-            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+
+    @property
+    def closed(self) -> bool:
+        return self.file_descriptor.closed
+
+    def write_finding(self, finding, output_options):
+        check_metadata = finding.check_metadata
+        if check_metadata.CheckID not in self.checks:
+            self.checks[check_metadata.CheckID] = len(self.checks)
+            self.__write_record__(
+                [
+                    "check",
+                    check_metadata.CheckID,
+                    check_metadata.CheckTitle,
+                    check_metadata.Severity,
+                    check_metadata.ServiceName,
+                    check_metadata.Risk,
+                    check_metadata.Remediation.Recommendation.Text,
+                    check_metadata.Remediation.Recommendation.Url,
+                    unroll_dict(
+                        get_check_compliance(
+                            finding, check_metadata.Provider, output_options
+                        )
+                    ),
+                ]
+            )
+        if isinstance(finding, Check_Report_GCP):
+            region = finding.location
+        elif isinstance(finding, Check_Report_AWS):
+            region = finding.region
+        else:
+            region = ""
+        self.__write_record__(
+            [
+                self.checks[check_metadata.CheckID],
+                finding.status,
+                region,
+                finding.resource_id,
+                unroll_tags(finding.resource_tags),
+                finding.status_extended,
+            ]
         )
-        sys.exit(1)
 
+    def flush(self):
+        self.file_descriptor.flush()
 
-def fill_html_overview_statistics(stats, output_filename, output_directory):
-    try:
-        filename = f"{output_directory}/{output_filename}{html_file_suffix}"
-        #  Read file
-        if path.isfile(filename):
-            with open(filename, "r") as file:
-                filedata = file.read()
+    def close(self):
+        if self._compressor:
+            self._pending += self._compressor.flush()
+            self.__write_compressed__(final=True)
+            self._compressor = None
+        self.file_descriptor.write("</script>\n")
+        self.file_descriptor.close()
 
-            # Replace statistics
-            # TOTAL_FINDINGS
-            filedata = filedata.replace(
-                "TOTAL_FINDINGS", str(stats.get("findings_count"))
-            )
-            # TOTAL_RESOURCES
-            filedata = filedata.replace(
-                "TOTAL_RESOURCES", str(stats.get("resources_count"))
+    def __write_record__(self, record: list):
+        # The findings cannot close the script element
+        line = (
+            json.dumps(record, separators=(",", ":"), default=str).replace(
+                "<", "\\u003c"
             )
-            # TOTAL_PASS
-            filedata = filedata.replace("TOTAL_PASS", str(stats.get("total_pass")))
-            # TOTAL_FAIL
-            filedata = filedata.replace("TOTAL_FAIL", str(stats.get("total_fail")))
-            # Write file
-            with open(filename, "w") as file:
-                file.write(filedata)
-
-    except Exception as error:
-        logger.critical(
-            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+            + "\n"
         )
-        sys.exit(1)
+        if not self._compressor:
+            self.file_descriptor.write(line)
+        else:
+            self._pending += self._compressor.compress(line.encode())
+            self.__write_compressed__()
+
+    def __write_compressed__(self, final: bool = False):
+        while len(self._pending) >= html_compressed_line_size or (
+            final and self._pending
+        ):
+            self.file_descriptor.write(
+                base64.b64encode(self._pending[:html_compressed_line_size]).decode()
+                + "\n"
+            )
+            self._pending = self._pending[html_compressed_line_size:]
 
 
-def add_html_footer(output_filename, output_directory):
+def add_html_footer(output_filename, output_directory, stats):
     try:
         filename = f"{output_directory}/{output_filename}{html_file_suffix}"
         # Close HTML file if exists
@@ -241,86 +341,245 @@ def add_html_footer(output_filename, output_directory):
                 filename,
                 "a",
             )
+            # The statistics are known once all the findings are written
+            file_descriptor.write(
+                '<script type="application/json" id="findings-stats">'
+                + json.dumps(
+                    {
+                        "total-findings": stats.get("findings_count"),
+                        "total-pass": stats.get("total_pass"),
+                        "total-fail": stats.get("total_fail"),
+                        "total-resources": stats.get("resources_count"),
+                    }
+                )
+                + "</script>"
+            )
             file_descriptor.write(
                 """
-               </tbody>
-            </table>
-        </div>
-    </div>
-    </div>
-    </div>
-    <!-- Table search and paginator -->
     <!-- Optional JavaScript -->
-    <!-- jQuery first, then Popper.js, then Bootstrap JS -->
-    <script src="https://code.jquery.com/jquery-3.5.1.min.js"
-        integrity="sha256-9/aliU8dGd2tb6OSsuzixeV4y/faTqgFtohetphbbj0=" crossorigin="anonymous"></script>
-    <script src="https://stackpath.bootstrapcdn.com/bootstrap/4.5.0/js/bootstrap.bundle.min.js"
-        integrity="sha384-1CmrxMRARb6aLqgBO7yyAxTOQE2AKb9GfXnEo760AUcUmFx3ibVJJAzGytlQcNXd"
-        crossorigin="anonymous"></script>
-    <!-- https://datatables.net/download/index with jQuery, DataTables, Buttons, SearchPanes, and Select //-->
-    <script type="text/javascript"
-        src="https://cdn.datatables.net/v/dt/jqc-1.12.4/dt-1.10.25/b-1.7.1/sp-1.4.0/sl-1.3.3/datatables.min.js"></script>
     <script>
-        $(document).ready(function () {
-            // Initialise the table with 50 rows, and some search/filtering panes
-            $('#findingsTable').DataTable({
-                responsive: true,
-                // Show 25, 50, 100 and All records
-                lengthChange: true,
-                lengthMenu: [[25, 50, 100, -1], [25, 50, 100, "All"]],
-                searchPanes: {
-                    cascadePanes: true,
-                    viewTotal: true,
-                },
-                dom: 'Blfrtip',
-                language: {
-                    // To enable a filter button instead of the filter row
-                    searchPanes: {
-                        clearMessage: 'Clear Filters',
-                        collapse: { 0: 'Filters', _: 'Filters (%d)' },
-                        initCollapsed: true
+        (function () {
+            var ROW_HEIGHT = 30;
+            // Rows rendered above and below the visible ones
+            var OVERSCAN = 20;
+            var SEVERITY_ORDER = { critical: 0, high: 1, medium: 2, low: 3, informational: 4 };
+            var STATUS_CLASS = { PASS: "bg-success-custom", FAIL: "table-danger", WARNING: "table-warning", INFO: "table-info" };
+            var checks = [];
+            var findings = [];
+            var visible = [];
+            var sorting = { column: "check_title", ascending: true };
+            var rendered = { first: -1, last: -1 };
+            var viewport = document.getElementById("findings-viewport");
+            var rows = document.getElementById("findings-rows");
+            var count = document.getElementById("findings-count");
+            var search = document.getElementById("findings-search");
+            var filters = document.querySelectorAll("#findings-filters select");
 
+            var stats = JSON.parse(document.getElementById("findings-stats").textContent);
+            Object.keys(stats).forEach(function (id) {
+                document.getElementById(id).textContent = stats[id];
+            });
+
+            function value(finding, column) {
+                if (column in finding) {
+                    return finding[column];
+                }
+                return finding.check[column];
+            }
+
+            function readFindings(element) {
+                var text = element.textContent;
+                if (element.dataset.compressed !== "true") {
+                    return Promise.resolve(text);
+                }
+                if (typeof DecompressionStream === "undefined") {
+                    return Promise.reject(new Error("This browser cannot decompress the findings"));
+                }
+                var binary = atob(text.replace(/\\s+/g, ""));
+                var bytes = new Uint8Array(binary.length);
+                for (var i = 0; i < binary.length; i++) {
+                    bytes[i] = binary.charCodeAt(i);
+                }
+                var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+                return new Response(stream).text();
+            }
+
+            function parseFindings(text) {
+                text.split("\\n").forEach(function (line) {
+                    if (!line) {
+                        return;
                     }
-                },
-                buttons: [
-                    {
-                        extend: 'searchPanes',
-                        config: {
-                            cascadePanes: true,
-                            viewTotal: true,
-                            orderable: false
+                    var record = JSON.parse(line);
+                    if (record[0] === "check") {
+                        checks.push({
+                            check_id: record[1], check_title: record[2], severity: record[3], service: record[4],
+                            risk: record[5], recommendation: record[6], recommendation_url: record[7], compliance: record[8]
+                        });
+                    } else {
+                        findings.push({
+                            check: checks[record[0]], status: record[1], region: record[2], resource_id: record[3],
+                            tags: record[4], status_extended: record[5]
+                        });
+                    }
+                });
+            }
+
+            function fillFilters() {
+                filters.forEach(function (filter) {
+                    var values = {};
+                    findings.forEach(function (finding) {
+                        values[value(finding, filter.dataset.column)] = true;
+                    });
+                    Object.keys(values).sort().forEach(function (option) {
+                        filter.appendChild(new Option(option, option));
+                    });
+                    filter.addEventListener("change", applyFilters);
+                });
+            }
+
+            function compare(a, b) {
+                var first = value(a, sorting.column);
+                var second = value(b, sorting.column);
+                if (sorting.column === "severity") {
+                    first = SEVERITY_ORDER[first];
+                    second = SEVERITY_ORDER[second];
+                }
+                var order = first < second ? -1 : first > second ? 1 : 0;
+                return sorting.ascending ? order : -order;
+            }
+
+            function applyFilters() {
+                var selected = [];
+                filters.forEach(function (filter) {
+                    if (filter.value) {
+                        selected.push(filter);
+                    }
+                });
+                var text = search.value.toLowerCase();
+                visible = findings.filter(function (finding) {
+                    for (var i = 0; i < selected.length; i++) {
+                        if (value(finding, selected[i].dataset.column) !== selected[i].value) {
+                            return false;
                         }
                     }
-                ],
-                columnDefs: [
-                    {
-                        searchPanes: {
-                            show: true,
-                            pagingType: 'numbers',
-                            searching: true
-                        },
-                        // Show all filters
-                        targets: [0, 1, 2, 3, 5, 7]
+                    if (!text) {
+                        return true;
                     }
-                ]
-            });
-            var maxLength = 30;
-            // ReadMore ReadLess
-            $(".show-read-more").each(function () {
-                var myStr = $(this).text();
-                if ($.trim(myStr).length > maxLength) {
-                    var newStr = myStr.substring(0, maxLength);
-                    var removedStr = myStr.substring(maxLength, $.trim(myStr).length);
-                    $(this).empty().html(newStr);
-                    $(this).append(' <a href="javascript:void(0);" class="read-more">read more...</a>');
-                    $(this).append('<span class="more-text">' + removedStr + '</span>');
+                    if (!finding.text) {
+                        finding.text = [
+                            finding.status, finding.check.severity, finding.check.service, finding.region,
+                            finding.check.check_id, finding.check.check_title, finding.resource_id, finding.tags,
+                            finding.status_extended
+                        ].join(" ").toLowerCase();
+                    }
+                    return finding.text.indexOf(text) !== -1;
+                });
+                visible.sort(compare);
+                count.textContent = visible.length + " of " + findings.length;
+                rows.style.height = visible.length * ROW_HEIGHT + "px";
+                viewport.scrollTop = 0;
+                renderRows(true);
+            }
+
+            function renderRows(force) {
+                var first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+                var last = Math.min(visible.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+                if (!force && first === rendered.first && last === rendered.last) {
+                    return;
+                }
+                rendered = { first: first, last: last };
+                var fragment = document.createDocumentFragment();
+                for (var i = first; i < last; i++) {
+                    fragment.appendChild(createRow(visible[i], i));
                 }
+                rows.textContent = "";
+                rows.appendChild(fragment);
+            }
+
+            function createRow(finding, position) {
+                var row = document.createElement("div");
+                row.className = "findings-grid finding-row " + (STATUS_CLASS[finding.status] || "");
+                row.style.top = position * ROW_HEIGHT + "px";
+                ["status", "severity", "service", "region", "check_id", "check_title", "resource_id", "status_extended"].forEach(function (column) {
+                    var cell = document.createElement("div");
+                    cell.textContent = cell.title = value(finding, column);
+                    row.appendChild(cell);
+                });
+                row.addEventListener("click", function () {
+                    showDetails(finding);
+                });
+                return row;
+            }
+
+            function showDetails(finding) {
+                var details = document.getElementById("finding-details");
+                var list = details.querySelector("dl");
+                details.querySelector(".card-header").textContent = finding.check.check_id + " - " + finding.resource_id;
+                var contents = {};
+                list.textContent = "";
+                [
+                    ["Status", finding.status], ["Status Extended", finding.status_extended],
+                    ["Check Title", finding.check.check_title], ["Severity", finding.check.severity],
+                    ["Region", finding.region], ["Resource ID", finding.resource_id],
+                    ["Resource Tags", finding.tags.split(" | ").join("\\n")], ["Risk", finding.check.risk],
+                    ["Recommendation", finding.check.recommendation],
+                    ["Compliance", finding.check.compliance.split(" | ").join("\\n")]
+                ].forEach(function (field) {
+                    var name = document.createElement("dt");
+                    var content = document.createElement("dd");
+                    name.className = "col-md-2";
+                    content.className = "col-md-10";
+                    name.textContent = field[0];
+                    content.textContent = field[1];
+                    list.appendChild(name);
+                    list.appendChild(content);
+                    contents[field[0]] = content;
+                });
+                var url = finding.check.recommendation_url;
+                if (/^https?:\\/\\//.test(url)) {
+                    var link = document.createElement("a");
+                    link.href = url;
+                    link.target = "_blank";
+                    link.rel = "noopener noreferrer";
+                    link.textContent = url;
+                    contents.Recommendation.appendChild(document.createElement("br"));
+                    contents.Recommendation.appendChild(link);
+                }
+                details.classList.remove("d-none");
+                details.scrollIntoView({ behavior: "smooth" });
+            }
+
+            document.querySelectorAll("#findings-columns > div").forEach(function (column) {
+                column.addEventListener("click", function () {
+                    sorting = {
+                        column: column.dataset.column,
+                        ascending: sorting.column !== column.dataset.column || !sorting.ascending
+                    };
+                    visible.sort(compare);
+                    renderRows(true);
+                });
             });
-            $(".read-more").click(function () {
-                $(this).siblings(".more-text").contents().unwrap();
-                $(this).remove();
+            var searchTimeout;
+            search.addEventListener("input", function () {
+                clearTimeout(searchTimeout);
+                searchTimeout = setTimeout(applyFilters, 200);
+            });
+            viewport.addEventListener("scroll", function () {
+                window.requestAnimationFrame(function () {
+                    renderRows(false);
+                });
+            });
+
+            readFindings(document.getElementById("""
+                + f'"{html_findings_element_id}"'
+                + """)).then(function (text) {
+                parseFindings(text);
+                fillFilters();
+                applyFilters();
+            }).catch(function (error) {
+                count.textContent = error.message;
             });
-        });
+        })();
     </script>
 </body>
 
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 
@@ -70,6 +71,11 @@ def fill_json_asff(finding_output, audit_info, finding, output_options):
     return finding_output
 
 
+def write_ndjson(file_descriptor, finding: dict):
+    """write_ndjson writes the finding as a compact JSON object in its own line, so the file is always readable up to the last line"""
+    file_descriptor.write(json.dumps(finding, separators=(",", ":")) + "\n")
+
+
 def close_json(output_filename, output_directory, mode):
     """close_json closes the output JSON file replacing the last comma with ]"""
     try:
@@ -1,6 +1,5 @@
 import importlib
 import sys
-from csv import DictWriter
 from typing import Any, List, Optional
 
 from pydantic import BaseModel
@@ -10,15 +9,25 @@ from prowler.lib.check.models import Remediation
 from prowler.lib.logger import logger
 from prowler.providers.aws.lib.audit_info.models import AWS_Organizations_Info
 
+# Compliance requirements of each check and provider, computed once for all its findings
+checks_compliance = {}
+
 
 def get_check_compliance(finding, provider, output_options):
     try:
         check_compliance = {}
         # We have to retrieve all the check's compliance requirements
         if finding.check_metadata.CheckID in output_options.bulk_checks_metadata:
-            for compliance in output_options.bulk_checks_metadata[
+            compliances = output_options.bulk_checks_metadata[
                 finding.check_metadata.CheckID
-            ].Compliance:
+            ].Compliance
+            # The result is reused while the check's compliance is the same
+            cached_compliance = checks_compliance.get(
+                (finding.check_metadata.CheckID, provider)
+            )
+            if cached_compliance and cached_compliance[0] is compliances:
+                return cached_compliance[1]
+            for compliance in compliances:
                 compliance_fw = compliance.Framework
                 if compliance.Version:
                     compliance_fw = f"{compliance_fw}-{compliance.Version}"
@@ -27,6 +36,10 @@ def get_check_compliance(finding, provider, output_options):
                         check_compliance[compliance_fw] = []
                     for requirement in compliance.Requirements:
                         check_compliance[compliance_fw].append(requirement.Id)
+            checks_compliance[(finding.check_metadata.CheckID, provider)] = (
+                compliances,
+                check_compliance,
+            )
         return check_compliance
     except Exception as error:
         logger.critical(
@@ -35,11 +48,11 @@ def get_check_compliance(finding, provider, output_options):
         sys.exit(1)
 
 
-def generate_provider_output_csv(
-    provider: str, finding, audit_info, mode: str, fd, output_options
+def generate_provider_output_model(
+    provider: str, finding, audit_info, mode: str, output_options
 ):
     """
-    set_provider_output_options configures automatically the outputs based on the selected provider and returns the Provider_Output_Options object.
+    generate_provider_output_model returns the finding in the provider's output model of the mode, e.g. Aws_Check_Output_CSV for csv.
     """
     try:
         # Dynamically load the Provider_Output_Options class
@@ -105,18 +118,12 @@ def generate_provider_output_csv(
                     audit_info.organizations_metadata.account_details_tags
                 )
 
-        csv_writer = DictWriter(
-            fd,
-            fieldnames=generate_csv_fields(output_model),
-            delimiter=";",
-        )
-
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
     else:
-        return csv_writer, finding_output
+        return finding_output
 
 
 def fill_common_data_csv(finding: dict) -> dict:
@@ -345,7 +352,10 @@ def generate_provider_output_json(
         finding_output_model = f"{provider.capitalize()}_Check_Output_{mode.upper()}"
         output_model = getattr(importlib.import_module(__name__), finding_output_model)
         # Instantiate the class for the cloud provider
-        finding_output = output_model(**finding.check_metadata.dict())
+        # The check's compliance is filled below from the bulk checks metadata
+        finding_output = output_model(
+            **finding.check_metadata.dict(exclude={"Compliance"})
+        )
         # Fill common fields
         finding_output.AssessmentStartTime = timestamp.isoformat()
         finding_output.Status = finding.status
@@ -550,6 +560,24 @@ class Check_Output_CSV_Generic_Compliance(BaseModel):
     CheckId: str
 
 
+class Check_Output_CSV_Compliance_Summary(BaseModel):
+    """
+    Check_Output_CSV_Compliance_Summary generates a requirement's findings count in CSV format.
+    """
+
+    Provider: str
+    Framework: str
+    Version: Optional[str]
+    AccountId: str
+    AssessmentDate: str
+    Requirements_Id: str
+    Requirements_Description: str
+    Status: str
+    Pass: int
+    Fail: int
+    Total: int
+
+
 # JSON ASFF Output
 class ProductFields(BaseModel):
     ProviderName: str = "Prowler"
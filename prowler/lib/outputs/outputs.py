@@ -4,27 +4,27 @@ import sys
 from colorama import Fore, Style
 
 from prowler.config.config import (
-    available_compliance_frameworks,
     csv_file_suffix,
     html_file_suffix,
     json_asff_file_suffix,
     json_file_suffix,
+    ndjson_asff_file_suffix,
+    ndjson_file_suffix,
     orange_color,
+    parquet_file_suffix,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.compliance import add_manual_controls, fill_compliance
-from prowler.lib.outputs.file_descriptors import fill_file_descriptors
-from prowler.lib.outputs.html import fill_html
-from prowler.lib.outputs.json import fill_json_asff
+from prowler.lib.outputs.compliance import Compliance_Aggregator
+from prowler.lib.outputs.file_descriptors import get_output_session
+from prowler.lib.outputs.json import fill_json_asff, write_ndjson
 from prowler.lib.outputs.models import (
     Check_Output_JSON_ASFF,
-    generate_provider_output_csv,
     generate_provider_output_json,
+    generate_provider_output_model,
     unroll_tags,
 )
 from prowler.providers.aws.lib.allowlist.allowlist import is_allowlisted
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
-from prowler.providers.aws.lib.security_hub.security_hub import send_to_security_hub
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
 
 
@@ -51,17 +51,12 @@ def report(check_findings, output_options, audit_info):
         if isinstance(audit_info, Azure_Audit_Info):
             check_findings.sort(key=lambda x: x.subscription)
 
-        # Generate the required output files
+        # Recover the output files, opened once for the whole scan
         file_descriptors = {}
+        output_session = None
         if output_options.output_modes:
-            # if isinstance(audit_info, AWS_Audit_Info):
-            # We have to create the required output files
-            file_descriptors = fill_file_descriptors(
-                output_options.output_modes,
-                output_options.output_directory,
-                output_options.output_filename,
-                audit_info,
-            )
+            output_session = get_output_session(output_options, audit_info)
+            file_descriptors = output_session.file_descriptors
 
         if check_findings:
             for finding in check_findings:
@@ -87,66 +82,67 @@ def report(check_findings, output_options, audit_info):
                     if not (finding.status != "FAIL" and output_options.is_quiet):
                         # AWS specific outputs
                         if finding.check_metadata.Provider == "aws":
-                            if any(
-                                compliance in output_options.output_modes
-                                for compliance in available_compliance_frameworks
-                            ):
-                                fill_compliance(
-                                    output_options,
-                                    finding,
-                                    audit_info,
-                                    file_descriptors,
-                                )
-
-                                add_manual_controls(
-                                    output_options,
-                                    audit_info,
-                                    file_descriptors,
-                                )
+                            if output_session.compliance_output:
+                                output_session.compliance_output.write(finding)
 
-                            if "json-asff" in file_descriptors:
+                            if (
+                                "json-asff" in file_descriptors
+                                or "ndjson-asff" in file_descriptors
+                            ):
                                 finding_output = Check_Output_JSON_ASFF()
                                 fill_json_asff(
                                     finding_output, audit_info, finding, output_options
                                 )
 
-                                json.dump(
-                                    finding_output.dict(),
-                                    file_descriptors["json-asff"],
-                                    indent=4,
-                                )
-                                file_descriptors["json-asff"].write(",")
+                                if "json-asff" in file_descriptors:
+                                    json.dump(
+                                        finding_output.dict(),
+                                        file_descriptors["json-asff"],
+                                        indent=4,
+                                    )
+                                    file_descriptors["json-asff"].write(",")
+
+                                if "ndjson-asff" in file_descriptors:
+                                    write_ndjson(
+                                        file_descriptors["ndjson-asff"],
+                                        finding_output.dict(),
+                                    )
 
                             # Check if it is needed to send findings to security hub
                             if (
                                 output_options.security_hub_enabled
                                 and finding.status != "INFO"
                             ):
-                                send_to_security_hub(
-                                    output_options.is_quiet,
-                                    finding.status,
-                                    finding.region,
-                                    finding_output,
-                                    audit_info.audit_session,
+                                output_options.security_hub_exporter.send(
+                                    finding.region, finding_output
                                 )
 
                         # Common outputs
                         if "html" in file_descriptors:
-                            fill_html(file_descriptors["html"], finding, output_options)
-                            file_descriptors["html"].write("")
+                            file_descriptors["html"].write_finding(
+                                finding, output_options
+                            )
 
-                        if "csv" in file_descriptors:
-                            csv_writer, finding_output = generate_provider_output_csv(
+                        # The parquet output has the same columns as the CSV one
+                        if "csv" in file_descriptors or "parquet" in file_descriptors:
+                            finding_output = generate_provider_output_model(
                                 finding.check_metadata.Provider,
                                 finding,
                                 audit_info,
                                 "csv",
-                                file_descriptors["csv"],
                                 output_options,
                             )
-                            csv_writer.writerow(finding_output.__dict__)
+                            if "csv" in file_descriptors:
+                                output_session.csv_writers["csv"].writerow(
+                                    finding_output.__dict__
+                                )
 
-                        if "json" in file_descriptors:
+                            if "parquet" in file_descriptors:
+                                file_descriptors["parquet"].writerow(
+                                    finding_output.__dict__
+                                )
+
+                        if "json" in file_descriptors or "ndjson" in file_descriptors:
                             finding_output = generate_provider_output_json(
                                 finding.check_metadata.Provider,
                                 finding,
@@ -154,12 +150,18 @@ def report(check_findings, output_options, audit_info):
                                 "json",
                                 output_options,
                             )
-                            json.dump(
-                                finding_output.dict(),
-                                file_descriptors["json"],
-                                indent=4,
-                            )
-                            file_descriptors["json"].write(",")
+                            if "json" in file_descriptors:
+                                json.dump(
+                                    finding_output.dict(),
+                                    file_descriptors["json"],
+                                    indent=4,
+                                )
+                                file_descriptors["json"].write(",")
+
+                            if "ndjson" in file_descriptors:
+                                write_ndjson(
+                                    file_descriptors["ndjson"], finding_output.dict()
+                                )
 
         else:  # No service resources in the whole account
             color = set_report_color("INFO")
@@ -168,10 +170,9 @@ def report(check_findings, output_options, audit_info):
         # Separator between findings and bar
         if output_options.verbose:
             print()
-        if file_descriptors:
-            # Close all file descriptors
-            for file_descriptor in file_descriptors:
-                file_descriptors.get(file_descriptor).close()
+        if output_session:
+            # The output files are closed once all the checks are executed
+            output_session.flush(force=False)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -210,6 +211,12 @@ def send_to_s3_bucket(
             filename = f"{output_filename}{json_asff_file_suffix}"
         elif output_mode == "html":
             filename = f"{output_filename}{html_file_suffix}"
+        elif output_mode == "parquet":
+            filename = f"{output_filename}{parquet_file_suffix}"
+        elif output_mode == "ndjson":
+            filename = f"{output_filename}{ndjson_file_suffix}"
+        elif output_mode == "ndjson-asff":
+            filename = f"{output_filename}{ndjson_asff_file_suffix}"
         else:  # Compliance output mode
             filename = f"{output_filename}_{output_mode}{csv_file_suffix}"
         logger.info(f"Sending outputs to S3 bucket {output_bucket}")
@@ -229,6 +236,84 @@ def send_to_s3_bucket(
         sys.exit(1)
 
 
+class Findings_Aggregator:
+    """
+    Findings_Aggregator aggregates the findings while they are reported, so they are not
+    retained until the end of the scan to extract the statistics, the summary table and the
+    compliance tables. Only the resources ids are kept to count them.
+    """
+
+    def __init__(self, compliance_aggregator: Compliance_Aggregator = None):
+        self.total_pass = 0
+        self.total_fail = 0
+        self.findings_count = 0
+        self.total_findings = 0
+        self.resources = set()
+        # Findings by service, in the order of the executed checks
+        self.services = {}
+        # Findings count by status of each check, in the order of the executed checks
+        self.checks_status = {}
+        # Findings count by status of each requirement of the selected compliance frameworks
+        self.compliance_aggregator = compliance_aggregator
+
+    def __len__(self):
+        return self.total_findings
+
+    def add(self, findings: list):
+        """add updates the aggregates with the findings of a check"""
+        findings_status = {}
+        for finding in findings:
+            self.total_findings += 1
+            # Save the resource_id
+            self.resources.add(finding.resource_id)
+            if finding.status == "PASS":
+                self.total_pass += 1
+                self.findings_count += 1
+            elif finding.status == "FAIL":
+                self.total_fail += 1
+                self.findings_count += 1
+
+            service = self.services.setdefault(
+                finding.check_metadata.ServiceName,
+                {
+                    "Provider": finding.check_metadata.Provider,
+                    "Total": 0,
+                    "Critical": 0,
+                    "High": 0,
+                    "Medium": 0,
+                    "Low": 0,
+                },
+            )
+            service["Total"] += 1
+            if finding.status == "FAIL":
+                severity = finding.check_metadata.Severity.capitalize()
+                if severity in service:
+                    service[severity] += 1
+
+            check_status = self.checks_status.setdefault(
+                finding.check_metadata.CheckID, {}
+            )
+            check_status[finding.status] = check_status.get(finding.status, 0) + 1
+            if self.compliance_aggregator:
+                finding_status = findings_status.setdefault(
+                    finding.check_metadata.CheckID, {}
+                )
+                finding_status[finding.status] = (
+                    finding_status.get(finding.status, 0) + 1
+                )
+
+        for check_id, check_status in findings_status.items():
+            self.compliance_aggregator.add(check_id, check_status)
+
+    def get_statistics(self) -> dict:
+        return {
+            "total_pass": self.total_pass,
+            "total_fail": self.total_fail,
+            "resources_count": len(self.resources),
+            "findings_count": self.findings_count,
+        }
+
+
 def extract_findings_statistics(findings: list) -> dict:
     """
     extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
@@ -240,25 +325,8 @@ def extract_findings_statistics(findings: list) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    resources = set()
-    findings_count = 0
-
-    for finding in findings:
-        # Save the resource_id
-        resources.add(finding.resource_id)
-        if finding.status == "PASS":
-            total_pass += 1
-            findings_count += 1
-        if finding.status == "FAIL":
-            total_fail += 1
-            findings_count += 1
-
-    stats["total_pass"] = total_pass
-    stats["total_fail"] = total_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-
-    return stats
+    if isinstance(findings, Findings_Aggregator):
+        return findings.get_statistics()
+    findings_aggregator = Findings_Aggregator()
+    findings_aggregator.add(findings)
+    return findings_aggregator.get_statistics()
@@ -0,0 +1,134 @@
+from importlib.util import find_spec
+from typing import Any
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.models import generate_csv_fields
+
+# Findings written per row group, the rows are kept in memory until their group is written
+parquet_row_group_size = 10000
+# Columns with few distinct values, stored dictionary-encoded
+parquet_dictionary_columns = (
+    "assessment_start_time",
+    "provider",
+    "check_id",
+    "check_title",
+    "check_type",
+    "status",
+    "service_name",
+    "subservice_name",
+    "severity",
+    "resource_type",
+    "profile",
+    "account_id",
+    "account_name",
+    "account_email",
+    "account_arn",
+    "account_org",
+    "account_tags",
+    "region",
+    "tenant_domain",
+    "subscription",
+    "project_id",
+    "location",
+)
+parquet_compression = "zstd"
+
+
+def is_parquet_available() -> bool:
+    """is_parquet_available returns True if the optional pyarrow dependency is installed"""
+    return find_spec("pyarrow") is not None
+
+
+def generate_parquet_schema(output_model: Any):
+    """generate_parquet_schema returns the Arrow schema of the output model, with the columns in the CSV order"""
+    # pyarrow is optional and slow to import, so it is only imported for the parquet output
+    import pyarrow
+
+    parquet_types = {
+        bool: pyarrow.bool_(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+    }
+    fields = []
+    for field_name in generate_csv_fields(output_model):
+        field = output_model.__fields__[field_name]
+        fields.append(
+            pyarrow.field(
+                field_name,
+                parquet_types.get(field.type_, pyarrow.string()),
+                nullable=field.allow_none,
+            )
+        )
+    return pyarrow.schema(fields)
+
+
+class Parquet_Writer:
+    """
+    Parquet_Writer writes the findings to a Parquet file in row groups while the scan runs.
+
+    The columns are typed by the provider's CSV output model and the ones with few distinct
+    values are dictionary-encoded, so the file is much smaller than the CSV and JSON outputs
+    and it can be queried by column without parsing it whole. The file is only valid once
+    it is closed, since its footer describes the row groups.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        output_model: Any,
+        row_group_size: int = parquet_row_group_size,
+    ):
+        import pyarrow.parquet
+
+        self.schema = generate_parquet_schema(output_model)
+        self.row_group_size = row_group_size
+        self.columns = {column: [] for column in self.schema.names}
+        self.rows = 0
+        self._writer = pyarrow.parquet.ParquetWriter(
+            filename,
+            self.schema,
+            compression=parquet_compression,
+            use_dictionary=[
+                column
+                for column in parquet_dictionary_columns
+                if column in self.columns
+            ],
+        )
+
+    @property
+    def closed(self) -> bool:
+        return not self._writer.is_open
+
+    def writerow(self, row: dict):
+        """writerow adds a finding, in the same format as the CSV rows, writing its row group once it is full"""
+        for column, values in self.columns.items():
+            values.append(row.get(column))
+        self.rows += 1
+        if self.rows >= self.row_group_size:
+            self.__write_row_group__()
+
+    def flush(self):
+        # The findings are written by whole row groups, the last one when the file is closed
+        pass
+
+    def close(self):
+        try:
+            if not self.closed:
+                self.__write_row_group__()
+                self._writer.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __write_row_group__(self):
+        if not self.rows:
+            return
+        import pyarrow
+
+        self._writer.write_table(
+            pyarrow.Table.from_pydict(self.columns, schema=self.schema),
+            row_group_size=self.rows,
+        )
+        self.columns = {column: [] for column in self.schema.names}
+        self.rows = 0
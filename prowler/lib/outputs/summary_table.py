@@ -4,11 +4,12 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.lib.logger import logger
+from prowler.lib.outputs.outputs import Findings_Aggregator
 from prowler.providers.common.outputs import Provider_Output_Options
 
 
 def display_summary_table(
-    findings: list,
+    findings_aggregator: Findings_Aggregator,
     audit_info,
     output_options: Provider_Output_Options,
     provider: str,
@@ -33,16 +34,7 @@ def display_summary_table(
             entity_type = "Project ID"
             audited_entities = audit_info.project_id
 
-        if findings:
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-            }
+        if findings_aggregator:
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -52,45 +44,16 @@ def display_summary_table(
                 "Medium": [],
                 "Low": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Critical"] = current["High"] = current[
-                        "Medium"
-                    ] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            for service, current in findings_aggregator.services.items():
+                add_service_to_table(findings_table, {"Service": service, **current})
+            pass_count = findings_aggregator.total_pass
+            fail_count = findings_aggregator.total_fail
 
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count/len(findings)*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count/len(findings)*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count/len(findings_aggregator)*100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count/len(findings_aggregator)*100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -115,6 +78,14 @@ def display_summary_table(
                 print(f" - CSV: {output_directory}/{output_filename}.csv")
             if "json" in output_options.output_modes:
                 print(f" - JSON: {output_directory}/{output_filename}.json")
+            if "ndjson" in output_options.output_modes:
+                print(f" - NDJSON: {output_directory}/{output_filename}.ndjson")
+            if "ndjson-asff" in output_options.output_modes:
+                print(
+                    f" - NDJSON-ASFF: {output_directory}/{output_filename}.asff.ndjson"
+                )
+            if "parquet" in output_options.output_modes:
+                print(f" - Parquet: {output_directory}/{output_filename}.parquet")
 
         else:
             print(
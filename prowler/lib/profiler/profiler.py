@@ -0,0 +1,187 @@
+import json
+import threading
+import time
+from typing import Callable
+
+from boto3 import session
+
+from prowler.lib.logger import logger
+
+# Error codes returned by the AWS APIs when the requests are throttled
+throttling_error_codes = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "EC2ThrottledException",
+}
+# Key stored in the request context with the start of the API call
+profiler_start_key = "prowler_profiler_start"
+profiling_file_suffix = ".profiling.json"
+
+
+class Scan_Profiler:
+    """
+    Scan_Profiler measures where the time of a scan goes.
+
+    It times the service clients while they gather the resources and every check execution,
+    and once registered in a boto3 session, it counts the API calls, their latency, retries,
+    throttling errors and errors per service, operation and region.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.api_calls = {}
+        self.timings = {"services": {}, "checks": {}}
+
+    def enable(self):
+        self.enabled = True
+
+    def register(self, aws_session: session.Session):
+        """register hooks the profiler into the API calls of the clients created by the session"""
+        aws_session.events.register("before-call", self.__before_call__)
+        aws_session.events.register("after-call", self.__after_call__)
+        aws_session.events.register("after-call-error", self.__after_call_error__)
+        aws_session.events.register("needs-retry", self.__needs_retry__)
+
+    def measure(self, kind: str, name: str, call: Callable, *args):
+        """measure returns the result of call, storing its duration with the given name when enabled"""
+        if not self.enabled:
+            return call(*args)
+        start = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            with self._lock:
+                self.timings[kind][name] = self.timings[kind].get(name, 0) + (
+                    time.perf_counter() - start
+                )
+
+    def generate_report(self) -> dict:
+        """generate_report returns the measurements ranked by their total time"""
+        with self._lock:
+            api_calls = [
+                {"service": service, "operation": operation, "region": region, **stats}
+                for (service, operation, region), stats in self.api_calls.items()
+            ]
+            timings = {kind: dict(measures) for kind, measures in self.timings.items()}
+        report = {
+            "api_calls": sorted(api_calls, key=lambda stats: -stats["total_time"]),
+            "api_calls_by_service": rank_api_calls(api_calls, "service"),
+            "api_calls_by_region": rank_api_calls(api_calls, "region"),
+        }
+        for kind, measures in timings.items():
+            report[kind] = [
+                {"name": name, "total_time": round(total_time, 3)}
+                for name, total_time in sorted(
+                    measures.items(), key=lambda measure: -measure[1]
+                )
+            ]
+        for stats in report["api_calls"]:
+            stats["total_time"] = round(stats["total_time"], 3)
+            stats["max_time"] = round(stats["max_time"], 3)
+        return report
+
+    def write_report(self, output_directory: str, output_filename: str) -> str:
+        """write_report stores the report next to the outputs and returns its path"""
+        report_file = f"{output_directory}/{output_filename}{profiling_file_suffix}"
+        try:
+            with open(report_file, "w") as f:
+                json.dump(self.generate_report(), f, indent=4)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return report_file
+
+    def __get_api_call_stats__(self, model, context: dict) -> dict:
+        key = (
+            model.service_model.service_name,
+            model.name,
+            context.get("client_region") or "global",
+        )
+        if key not in self.api_calls:
+            self.api_calls[key] = {
+                "calls": 0,
+                "total_time": 0,
+                "max_time": 0,
+                "retries": 0,
+                "throttles": 0,
+                "errors": 0,
+            }
+        return self.api_calls[key]
+
+    def __before_call__(self, model, context, **kwargs):
+        context[profiler_start_key] = time.perf_counter()
+
+    def __after_call__(self, http_response, parsed, model, context, **kwargs):
+        latency = time.perf_counter() - context.get(
+            profiler_start_key, time.perf_counter()
+        )
+        with self._lock:
+            stats = self.__get_api_call_stats__(model, context)
+            stats["calls"] += 1
+            stats["total_time"] += latency
+            stats["max_time"] = max(stats["max_time"], latency)
+            stats["retries"] += parsed.get("ResponseMetadata", {}).get(
+                "RetryAttempts", 0
+            )
+            if "Error" in parsed:
+                stats["errors"] += 1
+
+    def __after_call_error__(self, model, context, **kwargs):
+        latency = time.perf_counter() - context.get(
+            profiler_start_key, time.perf_counter()
+        )
+        with self._lock:
+            stats = self.__get_api_call_stats__(model, context)
+            stats["calls"] += 1
+            stats["total_time"] += latency
+            stats["max_time"] = max(stats["max_time"], latency)
+            stats["errors"] += 1
+
+    def __needs_retry__(self, response, operation, request_dict, **kwargs):
+        # Every throttled attempt is counted, also the ones retried successfully
+        if response:
+            error_code = response[1].get("Error", {}).get("Code")
+            if error_code in throttling_error_codes:
+                with self._lock:
+                    stats = self.__get_api_call_stats__(
+                        operation, request_dict.get("context", {})
+                    )
+                    stats["throttles"] += 1
+
+
+def rank_api_calls(api_calls: list, key: str) -> list:
+    """rank_api_calls aggregates the API calls stats by the given key, ranked by their total time"""
+    aggregated = {}
+    for stats in api_calls:
+        totals = aggregated.setdefault(
+            stats[key],
+            {
+                key: stats[key],
+                "calls": 0,
+                "total_time": 0,
+                "retries": 0,
+                "throttles": 0,
+                "errors": 0,
+            },
+        )
+        for field in ("calls", "total_time", "retries", "throttles", "errors"):
+            totals[field] += stats[field]
+    for totals in aggregated.values():
+        totals["total_time"] = round(totals["total_time"], 3)
+    return sorted(aggregated.values(), key=lambda totals: -totals["total_time"])
+
+
+# Profiler shared by the whole scan, enabled with --profiling
+scan_profiler = Scan_Profiler()
@@ -1,5 +1,56 @@
+import re
+
 from prowler.lib.logger import logger
 
+# Separators of the ARN's resource part, e.g. role/path/name or log-group:name:*
+resource_separators = re.compile(r"[/:]")
+# Suffix of the ARNs that include every resource inside, e.g. log-group:name:*
+arn_wildcard_suffix = ":*"
+
+
+def remove_arn_wildcard(arn: str) -> str:
+    if arn.endswith(arn_wildcard_suffix):
+        return arn[: -len(arn_wildcard_suffix)]
+    return arn
+
+
+class Resource_Filter(list):
+    """
+    Resource_Filter is the list of audited resources (ARNs) indexed to be looked up by the services.
+
+    A resource is filtered if it is one of the ARNs, if one of the ARNs is a prefix of it up to
+    a separator (e.g. a log group ARN ending with :*) or if it is the name or ID at the end of
+    one of the ARNs (e.g. a bucket name or a VPC ID). The trailing :* of the ARNs and the
+    resources is ignored, so a log group matches with or without it.
+    """
+
+    def __init__(self, audit_resources: list = None):
+        super().__init__(audit_resources or [])
+        self.arns = set()
+        self.names = set()
+        for arn in self:
+            arn = remove_arn_wildcard(arn)
+            self.arns.add(arn)
+            # arn:partition:service:region:account-id:resource
+            arn_parts = arn.split(":", 5)
+            if len(arn_parts) == 6:
+                resource = arn_parts[5]
+                self.names.add(resource)
+                for separator in resource_separators.finditer(resource):
+                    self.names.add(resource[separator.end() :])
+
+    def is_filtered(self, resource: str) -> bool:
+        resource = remove_arn_wildcard(resource)
+        if resource in self.arns:
+            return True
+        if resource.startswith("arn:"):
+            # Check if the resource is inside one of the ARNs
+            for separator in resource_separators.finditer(resource):
+                if resource[: separator.start()] in self.arns:
+                    return True
+            return False
+        return resource in self.names
+
 
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
@@ -8,9 +59,10 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
-        if resource in str(audit_resources):
-            return True
-        return False
+        # The audit resources are indexed once when they are set
+        if not isinstance(audit_resources, Resource_Filter):
+            audit_resources = Resource_Filter(audit_resources)
+        return audit_resources.is_filtered(resource)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
@@ -0,0 +1,196 @@
+import atexit
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import threading
+from typing import Optional
+
+from detect_secrets import SecretsCollection
+from detect_secrets.core.plugins.util import get_mapping_from_secret_type_to_class
+from detect_secrets.core.scan import (
+    _process_line_based_plugins,
+    get_filters_with_parameter,
+)
+from detect_secrets.settings import cache_bust, configure_settings_from_baseline
+from detect_secrets.transformers import get_transformed_file
+from detect_secrets.util.inject import call_function_with_arguments
+
+from prowler.lib.logger import logger
+
+# Name of the scanned strings in the secrets found, the scanned files keep their name
+default_payload_name = "payload"
+# Minimum number of payloads to scan them in the process pool, fewer are scanned in this process
+default_pool_min_payloads = 64
+
+# The strings scanned in memory are not files
+in_memory_excluded_filters = {"detect_secrets.filters.common.is_invalid_file"}
+
+# Plugins configured in this process
+plugins_configured = False
+plugins_lock = threading.Lock()
+
+
+def configure_secrets_plugins():
+    """configure_secrets_plugins enables all the detect-secrets plugins and default filters once per process"""
+    global plugins_configured
+    if plugins_configured:
+        return
+    with plugins_lock:
+        if not plugins_configured:
+            cache_bust()
+            configure_settings_from_baseline(
+                {
+                    "plugins_used": [
+                        {"name": plugin_type.__name__}
+                        for plugin_type in get_mapping_from_secret_type_to_class().values()
+                    ]
+                }
+            )
+            plugins_configured = True
+
+
+def is_filtered_payload(name: str) -> bool:
+    """is_filtered_payload returns True if the payload is skipped by its name, e.g. a lock file or a non-text file by its extension"""
+    for filter_function in get_filters_with_parameter("filename"):
+        if filter_function.path in in_memory_excluded_filters:
+            continue
+        try:
+            if call_function_with_arguments(filter_function, filename=name):
+                return True
+        # The filters needing more than the name
+        except TypeError:
+            pass
+    return False
+
+
+def scan_payload(data: str, name: str = default_payload_name) -> Optional[list]:
+    """
+    scan_payload returns the secrets found in the string by detect-secrets, or None if there are none
+
+    The string is scanned in memory as detect-secrets scans a file with that name, first by lines
+    and then, if nothing is found, parsed by the eager transformers (e.g. as an INI file).
+    """
+    configure_secrets_plugins()
+    if is_filtered_payload(name):
+        return None
+    payload = io.StringIO(data, newline=None)
+    payload.name = name
+    secrets = SecretsCollection()
+    for use_eager_transformers in (False, True):
+        lines = get_transformed_file(payload, use_eager_transformers)
+        if not lines:
+            if use_eager_transformers:
+                break
+            lines = payload.readlines()
+            payload.seek(0)
+        for secret in _process_line_based_plugins(
+            lines=list(enumerate(lines, start=1)), filename=name
+        ):
+            secrets[name].add(secret)
+        if secrets[name]:
+            break
+    return secrets.json().get(name)
+
+
+def scan_payloads(payloads: list) -> list:
+    """scan_payloads scans a chunk of (data, name) payloads in a worker process"""
+    return [scan_payload(data, name) for data, name in payloads]
+
+
+class Secrets_Scanner:
+    """
+    Secrets_Scanner finds secrets with detect-secrets in the strings gathered by the checks.
+
+    The strings are scanned in memory and identical strings are scanned once per scan, since
+    the same user data or environment variables are usually repeated across resources.
+    Large batches are scanned in a pool of processes, created the first time it is needed.
+    """
+
+    def __init__(
+        self,
+        processes: int = None,
+        pool_min_payloads: int = default_pool_min_payloads,
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        self.pool_min_payloads = pool_min_payloads
+        self._lock = threading.Lock()
+        self._pool = None
+        self.results = {}
+
+    def scan(self, data: str, name: str = default_payload_name) -> Optional[list]:
+        """scan returns the secrets found in the string, or None if there are none"""
+        return self.scan_batch([data], name)[0]
+
+    def scan_batch(self, payloads: list, name: str = default_payload_name) -> list:
+        """scan_batch returns the secrets found in every string, or None for the ones without secrets"""
+        return self.scan_named_batch([(data, name) for data in payloads])
+
+    def scan_named_batch(self, payloads: list) -> list:
+        """scan_named_batch returns the secrets found in every (data, name) payload, e.g. the files of a package"""
+        keys = [
+            hashlib.sha256(f"{name}\0{data}".encode()).hexdigest()
+            for data, name in payloads
+        ]
+        pending = {}
+        for key, payload in zip(keys, payloads):
+            if key not in self.results:
+                pending[key] = payload
+        if pending:
+            results = self.__scan_pending__(list(pending.values()))
+            with self._lock:
+                self.results.update(zip(pending, results))
+        return [self.results[key] for key in keys]
+
+    def close(self):
+        with self._lock:
+            if self._pool:
+                self._pool.terminate()
+                self._pool = None
+                atexit.unregister(self.close)
+
+    def __scan_pending__(self, payloads: list) -> list:
+        pool = None
+        if len(payloads) >= self.pool_min_payloads and self.processes > 1:
+            pool = self.__get_pool__()
+        if not pool:
+            return scan_payloads(payloads)
+        chunksize = math.ceil(len(payloads) / (self.processes * 4))
+        chunks = [
+            payloads[index : index + chunksize]
+            for index in range(0, len(payloads), chunksize)
+        ]
+        results = []
+        for chunk_results in pool.imap(scan_payloads, chunks):
+            results.extend(chunk_results)
+        return results
+
+    def __get_pool__(self):
+        with self._lock:
+            # The daemonic processes, e.g. the AWS Organizations' accounts scans, cannot have children
+            if not self._pool and not multiprocessing.current_process().daemon:
+                try:
+                    # The checks run along other threads, e.g. the progress bar or the AWS
+                    # workers, so the workers are not forked from this process
+                    start_method = (
+                        "forkserver"
+                        if "forkserver" in multiprocessing.get_all_start_methods()
+                        else "spawn"
+                    )
+                    self._pool = multiprocessing.get_context(start_method).Pool(
+                        processes=self.processes,
+                        initializer=configure_secrets_plugins,
+                    )
+                    # The workers must be stopped even if the execution is interrupted
+                    atexit.register(self.close)
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                    self.processes = 1
+            return self._pool
+
+
+# Secrets scanner shared by the checks of the whole scan
+secrets_scanner = Secrets_Scanner()
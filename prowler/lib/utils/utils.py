@@ -1,21 +1,17 @@
 import json
-import os
 import sys
-import tempfile
 from hashlib import sha512
 from io import TextIOWrapper
 from os.path import exists
 from typing import Any
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.logger import logger
+from prowler.lib.secrets_scanner.secrets_scanner import secrets_scanner
 
 
-def open_file(input_file: str, mode: str = "r") -> TextIOWrapper:
+def open_file(input_file: str, mode: str = "r", buffering: int = -1) -> TextIOWrapper:
     try:
-        f = open(input_file, mode)
+        f = open(input_file, mode, buffering=buffering)
     except OSError:
         logger.critical(
             "Ooops! You reached your user session maximum open files. To solve this issue, increase the shell session limit by running this command `ulimit -n 4096`. For more info visit https://docs.prowler.cloud/en/latest/troubleshooting/"
@@ -61,18 +57,6 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode("utf-8")).hexdigest()[0:9]
 
 
-def detect_secrets_scan(data):
-    temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-    temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-    temp_data_file.close()
-
-    secrets = SecretsCollection()
-    with default_settings():
-        secrets.scan_file(temp_data_file.name)
-    os.remove(temp_data_file.name)
-
-    detect_secrets_output = secrets.json()
-    if detect_secrets_output:
-        return detect_secrets_output[temp_data_file.name]
-    else:
-        return None
+def detect_secrets_scan(data: str):
+    """detect_secrets_scan returns the secrets found in the string, or None if there are none"""
+    return secrets_scanner.scan(data)
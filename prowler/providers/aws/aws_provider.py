@@ -1,14 +1,20 @@
 import os
 import pathlib
 import sys
+from typing import Optional
 
 from boto3 import session
 from botocore.credentials import RefreshableCredentials
 from botocore.session import get_session
 
 from prowler.config.config import aws_services_json_file
-from prowler.lib.check.check import list_modules, recover_checks_from_service
+from prowler.lib.check.check import (
+    list_modules,
+    recover_checks_from_service,
+    recover_client_attributes_from_check,
+)
 from prowler.lib.logger import logger
+from prowler.lib.profiler.profiler import scan_profiler
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 
@@ -45,14 +51,24 @@ class AWS_Provider:
                 assumed_botocore_session.set_config_variable(
                     "region", audit_info.profile_region
                 )
-                return session.Session(
+                aws_session = session.Session(
                     profile_name=audit_info.profile,
                     botocore_session=assumed_botocore_session,
                 )
             # If we do not receive credentials start the session using the profile
             else:
                 logger.info("Creating session for not assumed identity ...")
-                return session.Session(profile_name=audit_info.profile)
+                aws_session = session.Session(profile_name=audit_info.profile)
+            # Reuse the API responses stored by previous scans
+            if audit_info.api_cache:
+                audit_info.api_cache.register(aws_session, audit_info)
+            # Limit the rate of the API calls not served by the cache
+            if audit_info.rate_limiter:
+                audit_info.rate_limiter.register(aws_session)
+            # Measure the API calls
+            if scan_profiler.enabled:
+                scan_profiler.register(aws_session)
+            return aws_session
         except Exception as error:
             logger.critical(f"{error.__class__.__name__} -- {error}")
             sys.exit(1)
@@ -142,6 +158,43 @@ def generate_regional_clients(
         )
 
 
+def get_required_client_attributes(
+    service_client: str, audit_info: AWS_Audit_Info
+) -> Optional[set]:
+    """
+    get_required_client_attributes returns the attributes of the service client used by the checks to execute,
+    so the service only gathers the resources they need.
+
+    None means every attribute is required, when the checks to execute are not known or one of them
+    uses the whole client.
+    """
+    try:
+        expected_checks = list(
+            getattr(audit_info.audit_metadata, "expected_checks", None) or []
+        )
+        if not expected_checks:
+            return None
+        required_attributes = set()
+        for check_name in expected_checks:
+            client_attributes = recover_client_attributes_from_check(check_name, "aws")
+            if client_attributes is None:
+                return None
+            if service_client in client_attributes:
+                if client_attributes[service_client] is None:
+                    return None
+                required_attributes.update(client_attributes[service_client])
+        return required_attributes
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def is_required_attribute(attribute: str, required_attributes: Optional[set]) -> bool:
+    return required_attributes is None or attribute in required_attributes
+
+
 def get_aws_available_regions():
     try:
         actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
@@ -106,8 +106,130 @@ def parse_allowlist_file(audit_info, allowlist_file):
         sys.exit(1)
 
 
+class Allowlist_Entry:
+    """Allowlist_Entry is a check's allowlist with its resources and tags patterns precompiled"""
+
+    def __init__(self, check_allowlist: dict):
+        self.all_regions = "*" in check_allowlist["Regions"]
+        self.regions = set(check_allowlist["Regions"])
+        # If there is a *, it affects to all resources
+        self.resources = [
+            re.compile(".*" if resource == "*" else resource)
+            for resource in check_allowlist["Resources"]
+        ]
+        self.tags = None
+        if "Tags" in check_allowlist:
+            self.tags = [re.compile(tag) for tag in check_allowlist["Tags"]]
+
+    def is_allowlisted(self, region, resource, tags) -> bool:
+        if not self.all_regions and region not in self.regions:
+            return False
+        for allowlisted_resource in self.resources:
+            if self.tags is not None:
+                # Check if there are resource tags
+                if not tags or not allowlisted_resource.search(resource):
+                    continue
+                # Every allowlisted tag must be in the resource tags
+                if all(
+                    any(allowed_tag.search(resource_tag) for resource_tag in tags)
+                    for allowed_tag in self.tags
+                ):
+                    return True
+            elif allowlisted_resource.search(resource):
+                return True
+        return False
+
+
+class Allowlist_Index:
+    """
+    Allowlist_Index is the parsed allowlist compiled to match the findings.
+
+    The checks are indexed by account and name, the regex checks are precompiled and the
+    allowlist entries that apply to each check are only resolved once.
+    """
+
+    def __init__(self, allowlist: dict):
+        self.allowlist = allowlist
+        self.accounts = {}
+        for account, account_allowlist in allowlist["Accounts"].items():
+            checks = {}
+            literal_checks = {}
+            regex_checks = []
+            for allowlisted_check, check_allowlist in account_allowlist[
+                "Checks"
+            ].items():
+                entry = Allowlist_Entry(check_allowlist)
+                checks[allowlisted_check] = entry
+                # If there is a *, it affects to all checks
+                if allowlisted_check == "*":
+                    continue
+                # The checks without regex metacharacters match as substrings
+                if (
+                    allowlisted_check
+                    and re.escape(allowlisted_check) == allowlisted_check
+                ):
+                    literal_checks[allowlisted_check] = entry
+                else:
+                    regex_checks.append((re.compile(allowlisted_check), entry))
+            self.accounts[account] = (checks, literal_checks, regex_checks)
+        # Allowlist entries by account and check
+        self.check_entries = {}
+
+    def __get_check_entries__(self, account, check) -> list:
+        if (account, check) not in self.check_entries:
+            checks, literal_checks, regex_checks = self.accounts[account]
+            entries = []
+            if "*" in checks:
+                entries.append(checks["*"])
+            # Check if there is the specific check
+            if check in checks and check != "*":
+                entries.append(checks[check])
+            # Look up every substring of the check in the literal checks
+            substrings = {
+                check[start:end]
+                for start in range(len(check))
+                for end in range(start + 1, len(check) + 1)
+            }
+            for substring in substrings:
+                if substring in literal_checks and substring != check:
+                    entries.append(literal_checks[substring])
+            # Check if check is a regex
+            for allowlisted_check, entry in regex_checks:
+                if allowlisted_check.pattern != check and allowlisted_check.search(
+                    check
+                ):
+                    entries.append(entry)
+            self.check_entries[(account, check)] = entries
+        return self.check_entries[(account, check)]
+
+    def is_allowlisted(self, audited_account, check, region, resource, tags) -> bool:
+        # If there is a *, it affects to all accounts
+        for account in (audited_account, "*"):
+            if account in self.accounts:
+                for entry in self.__get_check_entries__(account, check):
+                    if entry.is_allowlisted(region, resource, tags):
+                        return True
+        return False
+
+
+def compile_allowlist(allowlist: dict) -> Allowlist_Index:
+    """compile_allowlist returns the parsed allowlist indexed to match the findings"""
+    try:
+        return Allowlist_Index(allowlist)
+    except Exception as error:
+        logger.critical(
+            f"{error.__class__.__name__} -- Allowlist YAML is malformed - {error}[{error.__traceback__.tb_lineno}]"
+        )
+        sys.exit(1)
+
+
 def is_allowlisted(allowlist, audited_account, check, region, resource, tags):
     try:
+        # Use the compiled allowlist if available
+        if isinstance(allowlist, Allowlist_Index):
+            return allowlist.is_allowlisted(
+                audited_account, check, region, resource, tags
+            )
         if audited_account in allowlist["Accounts"]:
             if is_allowlisted_in_check(
                 allowlist, audited_account, check, region, resource, tags
@@ -135,9 +257,8 @@ def is_allowlisted_in_check(allowlist, audited_account, check, region, resource,
         ].keys():
             # If there is a *, it affects to all checks
             if "*" == allowlisted_check:
-                check = "*"
                 if is_allowlisted_in_region(
-                    allowlist, audited_account, check, region, resource, tags
+                    allowlist, audited_account, "*", region, resource, tags
                 ):
                     return True
             # Check if there is the specific check
@@ -0,0 +1,171 @@
+import base64
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import time
+from datetime import datetime
+
+from boto3 import session
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError
+
+from prowler.lib.logger import logger
+
+# Default directory to store the API responses
+default_api_cache_directory = f"{pathlib.Path.home()}/.prowler/api_cache"
+# Default seconds the API responses are valid
+default_api_cache_ttl = 3600
+# Only the operations that do not modify resources are cached
+cacheable_operations_prefixes = (
+    "Describe",
+    "List",
+    "Get",
+    "BatchGet",
+    "Lookup",
+    "Search",
+)
+# The STS operations identify the credentials in use, so they are never cached
+non_cacheable_services = {"sts"}
+# Read operations whose responses expire before the TTL, e.g. the presigned URL of the Lambda code
+non_cacheable_operations = {("lambda", "GetFunction")}
+# Key stored in the request context to identify the cached response
+api_cache_key = "prowler_api_cache_key"
+api_cache_hit = "prowler_api_cache_hit"
+
+
+class API_Cache_Encoder(json.JSONEncoder):
+    """API_Cache_Encoder encodes the types of the API responses not supported by JSON"""
+
+    def default(self, value):
+        if isinstance(value, datetime):
+            return {"__datetime__": value.isoformat()}
+        if isinstance(value, bytes):
+            return {"__bytes__": base64.b64encode(value).decode()}
+        # Streaming responses cannot be cached
+        return super().default(value)
+
+
+def decode_api_response(value: dict):
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+def is_cacheable_operation(service_name: str, operation_name: str) -> bool:
+    """is_cacheable_operation returns True if the responses of the operation can be reused"""
+    return (
+        service_name not in non_cacheable_services
+        and (service_name, operation_name) not in non_cacheable_operations
+        and operation_name.startswith(cacheable_operations_prefixes)
+    )
+
+
+class AWS_API_Cache:
+    """
+    AWS_API_Cache stores on disk the responses of the AWS API read operations to reuse them in later scans.
+
+    The responses are keyed by account, region, service, operation and parameters and expire
+    after the TTL, and they are only stored once the audited account is known. In replay mode
+    only the stored responses are used and AWS is only called to identify the credentials.
+    """
+
+    def __init__(
+        self,
+        cache_directory: str = default_api_cache_directory,
+        ttl: int = default_api_cache_ttl,
+        replay: bool = False,
+    ):
+        self.cache_directory = cache_directory
+        self.ttl = ttl
+        self.replay = replay
+        self.audit_info = None
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, aws_session: session.Session, audit_info):
+        """register hooks the cache into the API calls of the clients created by the session"""
+        self.audit_info = audit_info
+        aws_session.events.register("before-parameter-build", self.__set_key__)
+        aws_session.events.register("before-call", self.__before_call__)
+        aws_session.events.register("after-call", self.__after_call__)
+
+    def __set_key__(self, params, model, context, **kwargs):
+        if not is_cacheable_operation(model.service_model.service_name, model.name):
+            return
+        # The account is not known until the credentials are validated
+        if not self.audit_info.audited_account:
+            return
+        parameters = json.dumps(
+            params, sort_keys=True, cls=API_Cache_Encoder, default=str
+        )
+        context[api_cache_key] = os.path.join(
+            self.cache_directory,
+            str(self.audit_info.audited_account),
+            context.get("client_region") or "global",
+            model.service_model.service_name,
+            f"{model.name}-{hashlib.sha256(parameters.encode()).hexdigest()}.json",
+        )
+
+    def __before_call__(self, model, context, **kwargs):
+        cache_file = context.get(api_cache_key)
+        if cache_file:
+            try:
+                with open(cache_file) as f:
+                    cached_response = json.load(f, object_hook=decode_api_response)
+                if self.replay or time.time() - cached_response["timestamp"] < self.ttl:
+                    self.hits += 1
+                    context[api_cache_hit] = True
+                    return (
+                        AWSResponse(None, 200, {}, None),
+                        cached_response["response"],
+                    )
+            except FileNotFoundError:
+                pass
+            except Exception as error:
+                logger.warning(
+                    f"{cache_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            self.misses += 1
+        # In replay mode AWS is only called to identify the credentials
+        if (
+            self.replay
+            and model.service_model.service_name not in non_cacheable_services
+        ):
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": "APICacheMiss",
+                        "Message": "The response is not cached and the API cache is in replay mode",
+                    }
+                },
+                model.name,
+            )
+
+    def __after_call__(self, http_response, parsed, model, context, **kwargs):
+        cache_file = context.get(api_cache_key)
+        if not cache_file or context.get(api_cache_hit):
+            return
+        if http_response.status_code >= 300:
+            return
+        try:
+            cached_response = json.dumps(
+                {"timestamp": time.time(), "response": parsed}, cls=API_Cache_Encoder
+            )
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # Write it atomically since several threads can request the same data
+            with tempfile.NamedTemporaryFile(
+                "w", dir=os.path.dirname(cache_file), delete=False
+            ) as f:
+                f.write(cached_response)
+            os.replace(f.name, cache_file)
+        # Responses with streams are not cached
+        except TypeError:
+            pass
+        except Exception as error:
+            logger.warning(
+                f"{cache_file} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
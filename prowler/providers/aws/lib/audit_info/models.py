@@ -48,3 +48,5 @@ class AWS_Audit_Info:
     audit_resources: list
     organizations_metadata: AWS_Organizations_Info
     audit_metadata: Optional[Any] = None
+    api_cache: Optional[Any] = None
+    rate_limiter: Optional[Any] = None
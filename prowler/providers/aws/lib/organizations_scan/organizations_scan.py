@@ -0,0 +1,199 @@
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from typing import Callable, Iterator
+
+from boto3 import session
+
+from prowler.config.config import (
+    csv_file_suffix,
+    json_asff_file_suffix,
+    json_file_suffix,
+    ndjson_asff_file_suffix,
+    ndjson_file_suffix,
+)
+from prowler.lib.logger import logger
+from prowler.providers.aws.aws_provider import assume_role
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+
+# Default number of accounts scanned concurrently
+default_parallel_accounts = 4
+
+# Scan of an account of the organization, set in every worker process
+account_scanner = None
+
+
+def get_organization_accounts(
+    audit_info: AWS_Audit_Info, organizations_role_arn: str = None
+) -> list:
+    """
+    get_organization_accounts returns the active accounts of the AWS Organization
+
+    The accounts are listed assuming the organizations role if it is set, or with the current credentials.
+    """
+    try:
+        organizations_session = audit_info.original_session
+        if organizations_role_arn:
+            assumed_credentials = assume_role(
+                audit_info.original_session,
+                AWS_Assume_Role(
+                    role_arn=organizations_role_arn,
+                    session_duration=audit_info.assumed_role_info.session_duration
+                    or 3600,
+                    external_id=None,
+                ),
+            )
+            organizations_session = session.Session(
+                aws_access_key_id=assumed_credentials["Credentials"]["AccessKeyId"],
+                aws_secret_access_key=assumed_credentials["Credentials"][
+                    "SecretAccessKey"
+                ],
+                aws_session_token=assumed_credentials["Credentials"]["SessionToken"],
+            )
+        organizations_client = organizations_session.client("organizations")
+        accounts = []
+        for page in organizations_client.get_paginator("list_accounts").paginate():
+            for account in page["Accounts"]:
+                if account["Status"] == "ACTIVE":
+                    accounts.append(account)
+    except Exception as error:
+        logger.critical(f"{error.__class__.__name__} -- {error}")
+        sys.exit(1)
+    else:
+        return accounts
+
+
+def get_organization_account_role_arn(
+    partition: str, account_id: str, role_name: str
+) -> str:
+    return f"arn:{partition}:iam::{account_id}:role/{role_name}"
+
+
+def init_account_worker(scanner: Callable):
+    global account_scanner
+    account_scanner = scanner
+    # The accounts are reported by the main process, only the logs are kept
+    sys.stdout = open(os.devnull, "w")
+
+
+def scan_account(account: dict) -> dict:
+    """scan_account runs the scan of the account in a worker process and returns its results"""
+    start = time.perf_counter()
+    result = {
+        "account": account["Id"],
+        "name": account.get("Name", ""),
+        "stats": None,
+        "output_filename": None,
+        "error": None,
+    }
+    try:
+        result["stats"], result["output_filename"] = account_scanner(account)
+    # Prowler exits on critical errors, e.g. if the role cannot be assumed
+    except SystemExit as error:
+        result["error"] = f"Scan exited with code {error.code}"
+    except Exception as error:
+        result["error"] = f"{error.__class__.__name__}: {error}"
+    result["duration"] = round(time.perf_counter() - start, 2)
+    return result
+
+
+def scan_organization_accounts(
+    accounts: list, scanner: Callable, parallel_accounts: int
+) -> Iterator[dict]:
+    """
+    scan_organization_accounts scans the accounts concurrently and yields their results as they complete
+
+    Every account is scanned in a new process, since the service clients are built once per process.
+    When they are forked, the processes share the checks metadata already loaded by this one.
+    """
+    start_method = "fork" if sys.platform.startswith("linux") else "spawn"
+    with multiprocessing.get_context(start_method).Pool(
+        processes=max(1, min(parallel_accounts, len(accounts))),
+        initializer=init_account_worker,
+        initargs=(scanner,),
+        maxtasksperchild=1,
+    ) as pool:
+        for result in pool.imap_unordered(scan_account, accounts):
+            if result["error"]:
+                logger.error(f"Account {result['account']} -- {result['error']}")
+            yield result
+
+
+def merge_organization_outputs(
+    output_directory: str, accounts_output_filenames: list, output_filename: str
+) -> list:
+    """
+    merge_organization_outputs merges the CSV and JSON outputs of the accounts into one file per output mode
+
+    The merged accounts' files are removed and the merged files are returned. Other outputs,
+    like the HTML reports, are kept per account.
+    """
+    merged_files = []
+    try:
+        outputs = {}
+        output_files = sorted(os.listdir(output_directory))
+        for account_output_filename in accounts_output_filenames:
+            for output_file in output_files:
+                # The suffix identifies the output mode, e.g. ".csv" or "_cis_1.5_aws.csv"
+                if output_file.startswith(account_output_filename):
+                    suffix = output_file[len(account_output_filename) :]
+                    if suffix.endswith(csv_file_suffix) or suffix in (
+                        json_file_suffix,
+                        json_asff_file_suffix,
+                        ndjson_file_suffix,
+                        ndjson_asff_file_suffix,
+                    ):
+                        outputs.setdefault(suffix, []).append(
+                            f"{output_directory}/{output_file}"
+                        )
+        for suffix, account_files in outputs.items():
+            merged_file = f"{output_directory}/{output_filename}{suffix}"
+            with open(merged_file, "w") as merged:
+                if suffix.endswith(csv_file_suffix):
+                    merge_csv_files(account_files, merged)
+                elif suffix in (ndjson_file_suffix, ndjson_asff_file_suffix):
+                    merge_ndjson_files(account_files, merged)
+                else:
+                    merge_json_files(account_files, merged)
+            for account_file in account_files:
+                os.remove(account_file)
+            merged_files.append(merged_file)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return merged_files
+
+
+def merge_csv_files(account_files: list, merged):
+    """merge_csv_files writes the header once followed by the rows of every file"""
+    header_written = False
+    for account_file in account_files:
+        with open(account_file) as f:
+            header = f.readline()
+            if not header_written:
+                merged.write(header)
+                header_written = True
+            shutil.copyfileobj(f, merged)
+
+
+def merge_ndjson_files(account_files: list, merged):
+    """merge_ndjson_files writes the lines of every file one after the other"""
+    for account_file in account_files:
+        with open(account_file) as f:
+            shutil.copyfileobj(f, merged)
+
+
+def merge_json_files(account_files: list, merged):
+    """merge_json_files writes the findings of the JSON arrays of every file in a single array"""
+    merged.write("[")
+    separator = ""
+    for account_file in account_files:
+        with open(account_file) as f:
+            findings = f.read().strip()[1:-1].strip()
+        if findings:
+            merged.write(separator + findings)
+            separator = ","
+    merged.write("]")
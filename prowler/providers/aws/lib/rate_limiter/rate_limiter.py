@@ -0,0 +1,157 @@
+import threading
+import time
+
+from boto3 import session
+
+from prowler.lib.profiler.profiler import throttling_error_codes
+
+# Requests per second and burst of the AWS APIs with published limits, per service and operation.
+# The operations without an entry use the limit of their service, if any.
+# https://docs.aws.amazon.com/AWSEC2/latest/APIReference/throttling.html
+# https://docs.aws.amazon.com/awscloudtrail/latest/userguide/WhatIsCloudTrail-Limits.html
+# https://docs.aws.amazon.com/lambda/latest/dg/gettingstarted-limits.html
+# https://docs.aws.amazon.com/Route53/latest/DeveloperGuide/DNSLimitations.html
+# https://docs.aws.amazon.com/kms/latest/developerguide/requests-per-second.html
+# https://docs.aws.amazon.com/secretsmanager/latest/userguide/reference_limits.html
+published_rate_limits = {
+    ("ec2", None): (20, 100),
+    ("cloudtrail", None): (10, 10),
+    ("cloudtrail", "LookupEvents"): (2, 2),
+    ("lambda", None): (15, 15),
+    ("lambda", "GetFunction"): (100, 100),
+    ("route-53", None): (5, 5),
+    ("cloudwatch-logs", "DescribeLogStreams"): (25, 25),
+    ("kms", "ListKeys"): (100, 100),
+    ("kms", "ListAliases"): (100, 100),
+    ("kms", "DescribeKey"): (2000, 2000),
+    ("kms", "GetKeyPolicy"): (1000, 1000),
+    ("kms", "GetKeyRotationStatus"): (1000, 1000),
+    ("secrets-manager", "ListSecrets"): (100, 100),
+    ("secrets-manager", "DescribeSecret"): (5000, 5000),
+    ("secrets-manager", "GetResourcePolicy"): (5000, 5000),
+}
+# Requests per second of the APIs without a published limit once they are throttled
+default_throttled_rate = 10
+# Requests per second added every second the rate is the bottleneck
+additive_increase = 1
+# Factor applied to the rate of a throttled API
+multiplicative_decrease = 0.5
+minimum_rate = 0.5
+# Key stored in the request context with the time the request was sent
+rate_limiter_sent_key = "prowler_rate_limiter_sent"
+
+
+class Token_Bucket:
+    """
+    Token_Bucket limits the requests per second with an additive-increase/multiplicative-decrease rate.
+
+    A bucket without rate does not limit the requests until it is throttled for the first time.
+    """
+
+    def __init__(self, rate: float = None, burst: float = None):
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+        self.last_decrease = 0
+        self.throttles = 0
+
+    def acquire(self) -> float:
+        """acquire takes a token, waiting until the bucket has one, and returns the seconds waited"""
+        with self._lock:
+            now = time.monotonic()
+            if not self.rate:
+                return 0
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.timestamp) * self.rate
+            )
+            self.timestamp = now
+            # The token is reserved, so the concurrent requests wait in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def succeed(self):
+        """succeed raises the rate while the bucket is the bottleneck of the requests"""
+        with self._lock:
+            if self.rate and self.tokens < 1:
+                self.rate += additive_increase / self.rate
+                self.capacity = max(self.capacity, self.rate)
+
+    def throttle(self, sent: float):
+        """throttle lowers the rate once for all the requests sent before the last decrease"""
+        with self._lock:
+            self.throttles += 1
+            if sent < self.last_decrease:
+                return
+            now = time.monotonic()
+            self.last_decrease = now
+            if not self.rate:
+                self.rate = default_throttled_rate
+                self.tokens = 0
+                self.timestamp = now
+            else:
+                self.rate = max(minimum_rate, self.rate * multiplicative_decrease)
+            self.capacity = max(1, min(self.capacity or 0, self.rate))
+            self.tokens = min(self.tokens, self.capacity)
+
+
+class AWS_Rate_Limiter:
+    """
+    AWS_Rate_Limiter limits the requests of every AWS API per service, region and operation.
+
+    Every API starts from its published limit, and it adapts its rate to the throttling errors:
+    it increases additively while the requests succeed and decreases multiplicatively when throttled,
+    so the resources are gathered at the highest sustainable rate instead of retrying with backoff.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = {}
+
+    def register(self, aws_session: session.Session):
+        """register hooks the rate limiter into every attempt of the API calls of the clients created by the session"""
+        aws_session.events.register("request-created", self.__request_created__)
+        aws_session.events.register("needs-retry", self.__needs_retry__)
+
+    def get_bucket(self, service: str, region: str, operation: str) -> Token_Bucket:
+        key = (service, region, operation)
+        bucket = self.buckets.get(key)
+        if not bucket:
+            with self._lock:
+                bucket = self.buckets.get(key)
+                if not bucket:
+                    rate, burst = published_rate_limits.get(
+                        (service, operation),
+                        published_rate_limits.get((service, None), (None, None)),
+                    )
+                    bucket = self.buckets[key] = Token_Bucket(rate, burst)
+        return bucket
+
+    def __request_created__(self, request, operation_name, event_name, **kwargs):
+        # The event name is request-created.<service>.<operation>
+        service = event_name.split(".")[1]
+        context = request.context
+        bucket = self.get_bucket(
+            service, context.get("client_region") or "global", operation_name
+        )
+        bucket.acquire()
+        context[rate_limiter_sent_key] = time.monotonic()
+
+    def __needs_retry__(self, response, operation, request_dict, **kwargs):
+        # The requests failed without response do not say anything about the rate
+        if not response:
+            return
+        context = request_dict.get("context", {})
+        bucket = self.get_bucket(
+            operation.service_model.service_id.hyphenize(),
+            context.get("client_region") or "global",
+            operation.name,
+        )
+        if response[1].get("Error", {}).get("Code") in throttling_error_codes:
+            bucket.throttle(context.get(rate_limiter_sent_key, 0))
+        else:
+            bucket.succeed()
@@ -1,11 +1,15 @@
+import atexit
 import json
-from itertools import groupby
-from operator import itemgetter
+import os
+import queue
+import threading
+import time
 
 from boto3 import session
 
 from prowler.config.config import (
     json_asff_file_suffix,
+    ndjson_asff_file_suffix,
     output_file_timestamp,
     timestamp_utc,
 )
@@ -13,49 +17,160 @@ from prowler.lib.logger import logger
 from prowler.lib.outputs.models import Check_Output_JSON_ASFF
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 
+# Maximum number of findings accepted by BatchImportFindings
+security_hub_batch_size = 100
+# Attempts to import a finding into Security Hub
+security_hub_max_attempts = 3
 
-def send_to_security_hub(
-    is_quiet: bool,
-    finding_status: str,
-    region: str,
-    finding_output: Check_Output_JSON_ASFF,
-    session: session.Session,
-) -> int:
+
+class Security_Hub_Exporter:
     """
-    send_to_security_hub send each finding to Security Hub and return the number of findings that were successfully sent
+    Security_Hub_Exporter sends the findings to Security Hub in batches from a background thread.
+
+    The Security Hub status and the Prowler integration are checked once per region and the
+    findings that could not be imported are retried.
     """
-    success_count = 0
-    try:
-        # Check if -q option is set
-        if not is_quiet or (is_quiet and finding_status == "FAIL"):
-            logger.info("Sending findings to Security Hub.")
-            # Check if security hub is enabled in current region
-            security_hub_client = session.client("securityhub", region_name=region)
-            security_hub_client.describe_hub()
 
-            # Check if Prowler integration is enabled in Security Hub
-            if "prowler/prowler" not in str(
-                security_hub_client.list_enabled_products_for_import()
-            ):
+    def __init__(
+        self,
+        session: session.Session,
+        batch_size: int = security_hub_batch_size,
+        max_attempts: int = security_hub_max_attempts,
+    ):
+        self.session = session
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        # Security Hub clients by region, created by the caller's thread
+        self.clients = {}
+        # Regions where the findings can be imported, checked by the worker
+        self.regions_enabled = {}
+        self.findings_queue = queue.Queue()
+        self.pending_findings = {}
+        self.success_count = {}
+        self.failed_count = {}
+        self.worker = None
+
+    def send(self, region: str, finding_output: Check_Output_JSON_ASFF):
+        """send queues a finding to be imported into the Security Hub of its region"""
+        if region not in self.clients:
+            self.clients[region] = self.session.client(
+                "securityhub", region_name=region
+            )
+        if not self.worker:
+            self.worker = threading.Thread(
+                target=self.__export__, name="prowler-security-hub", daemon=True
+            )
+            self.worker.start()
+            # The queued findings must be sent even if the execution is interrupted
+            atexit.register(self.close)
+        self.findings_queue.put((region, finding_output.dict()))
+
+    def close(self) -> dict:
+        """close sends the queued findings and returns the number of findings imported by region"""
+        if self.worker:
+            # Notify the worker that there are no more findings
+            self.findings_queue.put(None)
+            self.worker.join()
+            self.worker = None
+            atexit.unregister(self.close)
+        for region, success_count in self.success_count.items():
+            logger.info(
+                f"Sent {success_count} findings to Security Hub in region {region}."
+            )
+        for region, failed_count in self.failed_count.items():
+            logger.error(
+                f"Failed to send {failed_count} findings to Security Hub in region {region}."
+            )
+        return self.success_count
+
+    def __export__(self):
+        while True:
+            item = self.findings_queue.get()
+            if item is None:
+                break
+            region, finding = item
+            self.pending_findings.setdefault(region, []).append(finding)
+            if len(self.pending_findings[region]) >= self.batch_size:
+                self.__send_batch__(region, self.pending_findings.pop(region))
+        # Send the remaining findings
+        for region, findings in self.pending_findings.items():
+            self.__send_batch__(region, findings)
+        self.pending_findings = {}
+
+    def __is_region_enabled__(self, region: str) -> bool:
+        if region not in self.regions_enabled:
+            self.regions_enabled[region] = False
+            try:
+                security_hub_client = self.clients[region]
+                # Check if security hub is enabled in current region
+                security_hub_client.describe_hub()
+                # Check if Prowler integration is enabled in Security Hub
+                if "prowler/prowler" not in str(
+                    security_hub_client.list_enabled_products_for_import()
+                ):
+                    logger.error(
+                        f"Security Hub is enabled in {region} but Prowler integration does not accept findings. More info: https://docs.prowler.cloud/en/latest/tutorials/aws/securityhub/"
+                    )
+                else:
+                    self.regions_enabled[region] = True
+            except Exception as error:
                 logger.error(
-                    f"Security Hub is enabled in {region} but Prowler integration does not accept findings. More info: https://docs.prowler.cloud/en/latest/tutorials/aws/securityhub/"
+                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
                 )
-            else:
-                # Send finding to Security Hub
-                batch_import = security_hub_client.batch_import_findings(
-                    Findings=[finding_output.dict()]
+        return self.regions_enabled[region]
+
+    def __send_batch__(self, region: str, findings: list):
+        if not self.__is_region_enabled__(region):
+            self.failed_count[region] = self.failed_count.get(region, 0) + len(findings)
+            return
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                batch_import = self.clients[region].batch_import_findings(
+                    Findings=findings
                 )
-                if batch_import["FailedCount"] > 0:
-                    failed_import = batch_import["FailedFindings"][0]
-                    logger.error(
-                        f"Failed to send archived findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+                self.success_count[region] = (
+                    self.success_count.get(region, 0) + batch_import["SuccessCount"]
+                )
+                if batch_import["FailedCount"] == 0:
+                    return
+                # Retry only the findings that were not imported
+                failed_ids = set()
+                for failed_import in batch_import["FailedFindings"]:
+                    failed_ids.add(failed_import["Id"])
+                    logger.warning(
+                        f"Failed to send finding {failed_import['Id']} to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
                     )
-                success_count = batch_import["SuccessCount"]
-    except Exception as error:
+                findings = [
+                    finding for finding in findings if finding["Id"] in failed_ids
+                ]
+            except Exception as error:
+                logger.warning(
+                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                )
+            if attempt < self.max_attempts:
+                time.sleep(2**attempt)
         logger.error(
-            f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            f"Failed to send {len(findings)} findings to AWS Security Hub in region {region} after {self.max_attempts} attempts"
         )
-    return success_count
+        self.failed_count[region] = self.failed_count.get(region, 0) + len(findings)
+
+
+def get_security_hub_current_findings_ids(filename: str) -> dict:
+    """
+    get_security_hub_current_findings_ids returns the IDs of the findings of the ASFF output by region
+
+    The NDJSON-ASFF output is read line by line, so only the IDs are kept in memory.
+    """
+    current_findings_ids = {}
+    with open(filename) as f:
+        if filename.endswith(ndjson_asff_file_suffix):
+            findings = (json.loads(line) for line in f if line.strip())
+        else:
+            findings = json.load(f)
+        for finding in findings:
+            region = finding["ProductArn"].split(":")[3]
+            current_findings_ids.setdefault(region, set()).add(finding["Id"])
+    return current_findings_ids
 
 
 # Move previous Security Hub check findings to ARCHIVED (as prowler didn't re-detect them)
@@ -66,29 +181,22 @@ def resolve_security_hub_previous_findings(
     resolve_security_hub_previous_findings archives all the findings that does not appear in the current execution
     """
     logger.info("Checking previous findings in Security Hub to archive them.")
-    # Read current findings from json-asff file
-    with open(
-        f"{output_directory}/prowler-output-{audit_info.audited_account}-{output_file_timestamp}{json_asff_file_suffix}"
-    ) as f:
-        json_asff_file = json.load(f)
-
-    # Sort by region
-    json_asff_file = sorted(json_asff_file, key=itemgetter("ProductArn"))
-    # Group by region
-    for product_arn, current_findings in groupby(
-        json_asff_file, key=itemgetter("ProductArn")
-    ):
-        region = product_arn.split(":")[3]
+    # Read current findings from the ndjson-asff file, or the json-asff file
+    output_filename = f"{output_directory}/prowler-output-{audit_info.audited_account}-{output_file_timestamp}"
+    if os.path.isfile(f"{output_filename}{ndjson_asff_file_suffix}"):
+        output_filename = f"{output_filename}{ndjson_asff_file_suffix}"
+    else:
+        output_filename = f"{output_filename}{json_asff_file_suffix}"
+    findings_ids_by_region = get_security_hub_current_findings_ids(output_filename)
+
+    for region in sorted(findings_ids_by_region):
+        current_findings_ids = findings_ids_by_region[region]
         try:
             # Check if security hub is enabled in current region
             security_hub_client = audit_info.audit_session.client(
                 "securityhub", region_name=region
             )
             security_hub_client.describe_hub()
-            # Get current findings IDs
-            current_findings_ids = []
-            for finding in current_findings:
-                current_findings_ids.append(finding["Id"])
             # Get findings of that region
             security_hub_client = audit_info.audit_session.client(
                 "securityhub", region_name=region
@@ -0,0 +1,118 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Iterable
+
+from prowler.lib.logger import logger
+
+# Default maximum number of concurrent API calls
+default_max_workers = 32
+# Default maximum number of concurrent API calls against the same region
+default_max_workers_per_region = 10
+
+
+class AWS_Worker_Pool:
+    """
+    AWS_Worker_Pool is a bounded thread pool shared by all the AWS services to gather their resources.
+
+    The work items are usually regional clients or resources, both with a region attribute,
+    so the concurrency is limited globally by the pool size and also per region.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = default_max_workers,
+        max_workers_per_region: int = default_max_workers_per_region,
+    ):
+        self.max_workers = max_workers
+        self.max_workers_per_region = max_workers_per_region
+        self._executor = None
+        self._region_semaphores = {}
+        self._lock = threading.Lock()
+        self._worker_context = threading.local()
+
+    def configure(self, max_workers: int = None, max_workers_per_region: int = None):
+        """configure sets the pool limits, the running work keeps the previous ones"""
+        with self._lock:
+            if max_workers:
+                self.max_workers = max_workers
+            if max_workers_per_region:
+                self.max_workers_per_region = max_workers_per_region
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self._region_semaphores = {}
+
+    def map(self, call: Callable, items: Iterable):
+        """
+        map executes call for each item in the pool and waits until all of them have finished.
+
+        The errors are logged since every service method handles its own, as the previous
+        per-service threads did.
+        """
+        items = list(items)
+        if not items:
+            return
+        # A worker waiting for other workers could deadlock the pool, so nested calls run inline
+        if getattr(self._worker_context, "in_worker", False):
+            for item in items:
+                self.__run__(call, item)
+            return
+
+        executor = self.__get_executor__()
+        futures = []
+        for item in items:
+            # Block until the item's region has a free slot
+            semaphore = self.__get_region_semaphore__(getattr(item, "region", None))
+            if semaphore:
+                semaphore.acquire()
+            futures.append(
+                executor.submit(self.__run_in_worker__, call, item, semaphore)
+            )
+        wait(futures)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __get_executor__(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if not self._executor:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="prowler-aws"
+                )
+            return self._executor
+
+    def __get_region_semaphore__(self, region: str) -> threading.BoundedSemaphore:
+        if not region:
+            return None
+        with self._lock:
+            if region not in self._region_semaphores:
+                self._region_semaphores[region] = threading.BoundedSemaphore(
+                    self.max_workers_per_region
+                )
+            return self._region_semaphores[region]
+
+    def __run_in_worker__(
+        self, call: Callable, item, semaphore: threading.BoundedSemaphore
+    ):
+        self._worker_context.in_worker = True
+        try:
+            self.__run__(call, item)
+        finally:
+            self._worker_context.in_worker = False
+            if semaphore:
+                semaphore.release()
+
+    def __run__(self, call: Callable, item):
+        try:
+            call(item)
+        except Exception as error:
+            logger.error(
+                f"{getattr(item, 'region', '')} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+
+# Worker pool shared by all the AWS services
+worker_pool = AWS_Worker_Pool()
@@ -1,11 +1,7 @@
-import os
-import tempfile
 from base64 import b64decode
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.secrets_scanner.secrets_scanner import secrets_scanner
 from prowler.providers.aws.services.autoscaling.autoscaling_client import (
     autoscaling_client,
 )
@@ -14,6 +10,16 @@ from prowler.providers.aws.services.autoscaling.autoscaling_client import (
 class autoscaling_find_secrets_ec2_launch_configuration(Check):
     def execute(self):
         findings = []
+        # Scan the User Data of all the launch configurations at once
+        configurations_secrets = iter(
+            secrets_scanner.scan_batch(
+                [
+                    b64decode(configuration.user_data).decode("utf-8")
+                    for configuration in autoscaling_client.launch_configurations
+                    if configuration.user_data
+                ]
+            )
+        )
         for configuration in autoscaling_client.launch_configurations:
             report = Check_Report_AWS(self.metadata())
             report.region = configuration.region
@@ -21,25 +27,12 @@ class autoscaling_find_secrets_ec2_launch_configuration(Check):
             report.resource_arn = configuration.arn
 
             if configuration.user_data:
-                temp_user_data_file = tempfile.NamedTemporaryFile(delete=False)
-                user_data = b64decode(configuration.user_data).decode("utf-8")
-
-                temp_user_data_file.write(
-                    bytes(user_data, encoding="raw_unicode_escape")
-                )
-                temp_user_data_file.close()
-                secrets = SecretsCollection()
-                with default_settings():
-                    secrets.scan_file(temp_user_data_file.name)
-
-                if secrets.json():
+                if next(configurations_secrets):
                     report.status = "FAIL"
                     report.status_extended = f"Potential secret found in autoscaling {configuration.name} User Data."
                 else:
                     report.status = "PASS"
                     report.status_extended = f"No secrets found in autoscaling {configuration.name} User Data."
-
-                os.remove(temp_user_data_file.name)
             else:
                 report.status = "PASS"
                 report.status_extended = f"No secrets found in autoscaling {configuration.name} since User Data is empty."
@@ -1,10 +1,13 @@
-import threading
-
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## AutoScaling
@@ -15,22 +18,22 @@ class AutoScaling:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes(
+            "autoscaling_client", audit_info
+        )
         self.launch_configurations = []
-        self.__threading_call__(self.__describe_launch_configurations__)
+        if is_required_attribute("launch_configurations", required_attributes):
+            self.__threading_call__(self.__describe_launch_configurations__)
         self.groups = []
-        self.__threading_call__(self.__describe_auto_scaling_groups__)
+        if is_required_attribute("groups", required_attributes):
+            self.__threading_call__(self.__describe_auto_scaling_groups__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __describe_launch_configurations__(self, regional_client):
         logger.info("AutoScaling - Describing Launch Configurations...")
@@ -1,10 +1,5 @@
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.secrets_scanner.secrets_scanner import secrets_scanner
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
 
@@ -23,44 +18,45 @@ class awslambda_function_no_secrets_in_code(Check):
                 report.status_extended = (
                     f"No secrets found in Lambda function {function.name} code"
                 )
-                with tempfile.TemporaryDirectory() as tmp_dir_name:
-                    function.code.code_zip.extractall(tmp_dir_name)
-                    # List all files
-                    files_in_zip = next(os.walk(tmp_dir_name))[2]
-                    secrets_findings = []
-                    for file in files_in_zip:
-                        secrets = SecretsCollection()
-                        with default_settings():
-                            secrets.scan_file(f"{tmp_dir_name}/{file}")
-                        detect_secrets_output = secrets.json()
-                        if detect_secrets_output:
-                            for (
-                                file_name
-                            ) in (
-                                detect_secrets_output.keys()
-                            ):  # Appears that only 1 file is being scanned at a time, so could rework this
-                                output_file_name = file_name.replace(
-                                    f"{tmp_dir_name}/", ""
-                                )
-                                secrets_string = ", ".join(
-                                    [
-                                        f"{secret['type']} on line {secret['line_number']}"
-                                        for secret in detect_secrets_output[file_name]
-                                    ]
-                                )
-                                secrets_findings.append(
-                                    f"{output_file_name}: {secrets_string}"
-                                )
-
-                    if secrets_findings:
-                        final_output_string = "; ".join(secrets_findings)
-                        report.status = "FAIL"
-                        # report.status_extended = f"Potential {'secrets' if len(secrets_findings)>1 else 'secret'} found in Lambda function {function.name} code. {final_output_string}"
-                        if len(secrets_findings) > 1:
-                            report.status_extended = f"Potential secrets found in Lambda function {function.name} code -> {final_output_string}"
-                        else:
-                            report.status_extended = f"Potential secret found in Lambda function {function.name} code -> {final_output_string}"
-                        # break // Don't break as there may be additional findings
+                # Scan the files in the root of the package without extracting them
+                files_data = []
+                code_zip = function.code.open()
+                try:
+                    for file in code_zip.infolist():
+                        if file.is_dir() or "/" in file.filename:
+                            continue
+                        try:
+                            files_data.append(
+                                (code_zip.read(file).decode("utf-8"), file.filename)
+                            )
+                        # The binary files are not scanned
+                        except UnicodeDecodeError:
+                            continue
+                finally:
+                    # The packages are released one by one, so the memory does not grow with the functions
+                    function.code.release()
+                secrets_findings = []
+                for (_, file_name), detect_secrets_output in zip(
+                    files_data, secrets_scanner.scan_named_batch(files_data)
+                ):
+                    if detect_secrets_output:
+                        secrets_string = ", ".join(
+                            [
+                                f"{secret['type']} on line {secret['line_number']}"
+                                for secret in detect_secrets_output
+                            ]
+                        )
+                        secrets_findings.append(f"{file_name}: {secrets_string}")
+
+                if secrets_findings:
+                    final_output_string = "; ".join(secrets_findings)
+                    report.status = "FAIL"
+                    # report.status_extended = f"Potential {'secrets' if len(secrets_findings)>1 else 'secret'} found in Lambda function {function.name} code. {final_output_string}"
+                    if len(secrets_findings) > 1:
+                        report.status_extended = f"Potential secrets found in Lambda function {function.name} code -> {final_output_string}"
+                    else:
+                        report.status_extended = f"Potential secret found in Lambda function {function.name} code -> {final_output_string}"
+                    # break // Don't break as there may be additional findings
 
                 findings.append(report)
 
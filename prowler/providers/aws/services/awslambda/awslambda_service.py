@@ -1,17 +1,19 @@
-import io
 import json
-import threading
 import zipfile
 from enum import Enum
 from typing import Any, Optional
 
-import requests
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.config.config import get_config_var
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
+from prowler.providers.aws.services.awslambda.lib.code_fetcher import (
+    lambda_code_fetcher,
+)
 
 
 ################## Lambda
@@ -32,6 +34,10 @@ class Lambda:
             "awslambda_function_no_secrets_in_code"
             in audit_info.audit_metadata.expected_checks
         ):
+            lambda_code_fetcher.configure(
+                directory=get_config_var("lambda_code_cache_directory"),
+                max_code_size_in_mb=get_config_var("max_lambda_code_size_in_mb"),
+            )
             self.__threading_call__(self.__get_function__)
 
         self.__threading_call__(self.__get_policy__)
@@ -41,13 +47,7 @@ class Lambda:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __list_functions__(self, regional_client):
         logger.info("Lambda - Listing Functions...")
@@ -85,6 +85,7 @@ class Lambda:
     def __get_function__(self, regional_client):
         logger.info("Lambda - Getting Function...")
         try:
+            codes_downloads = []
             for function in self.functions.values():
                 if function.region == regional_client.region:
                     function_information = regional_client.get_function(
@@ -92,11 +93,33 @@ class Lambda:
                     )
                     if "Location" in function_information["Code"]:
                         code_location_uri = function_information["Code"]["Location"]
-                        raw_code_zip = requests.get(code_location_uri).content
-                        self.functions[function.name].code = LambdaCode(
-                            location=code_location_uri,
-                            code_zip=zipfile.ZipFile(io.BytesIO(raw_code_zip)),
+                        code_sha256 = function_information["Configuration"][
+                            "CodeSha256"
+                        ]
+                        codes_downloads.append(
+                            (
+                                function,
+                                code_location_uri,
+                                code_sha256,
+                                lambda_code_fetcher.fetch(
+                                    code_location_uri, code_sha256
+                                ),
+                            )
                         )
+            # The code is downloaded concurrently to disk, only its path is kept
+            for (
+                function,
+                code_location_uri,
+                code_sha256,
+                code_download,
+            ) in codes_downloads:
+                code_path = code_download.result()
+                if code_path:
+                    function.code = LambdaCode(
+                        location=code_location_uri,
+                        code_sha256=code_sha256,
+                        path=code_path,
+                    )
 
         except Exception as error:
             logger.error(
@@ -172,7 +195,21 @@ class Lambda:
 
 class LambdaCode(BaseModel):
     location: str
-    code_zip: Any
+    code_sha256: Optional[str]
+    path: Optional[str]
+    code_zip: Any = None
+
+    def open(self) -> zipfile.ZipFile:
+        """open returns the code package, read from disk until it is released"""
+        if not self.code_zip:
+            self.code_zip = zipfile.ZipFile(self.path)
+        return self.code_zip
+
+    def release(self):
+        """release closes the code package once it has been processed"""
+        if self.code_zip:
+            self.code_zip.close()
+            self.code_zip = None
 
 
 class AuthType(Enum):
@@ -0,0 +1,190 @@
+import atexit
+import base64
+import binascii
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from prowler.lib.logger import logger
+
+# Prefix of the temporary directory of the Lambda code packages, removed when the scan finishes
+lambda_code_temporary_directory_prefix = "prowler-lambda-code-"
+# Default maximum number of concurrent downloads
+default_max_downloads = 8
+# Default maximum size of a code package, the limit of an unzipped deployment package
+default_max_code_size_in_mb = 250
+download_chunk_size = 1024 * 1024
+download_timeout = 60
+
+
+def get_code_file_name(code_sha256: str) -> str:
+    """get_code_file_name returns the file name of a code package from its CodeSha256, the base64 of its SHA-256"""
+    try:
+        return f"{base64.b64decode(code_sha256, validate=True).hex()}.zip"
+    except (binascii.Error, ValueError):
+        return f"{hashlib.sha256(code_sha256.encode()).hexdigest()}.zip"
+
+
+class Lambda_Code_Fetcher:
+    """
+    Lambda_Code_Fetcher downloads the code packages of the Lambda functions to disk.
+
+    The downloads share a pool of HTTP connections and run concurrently up to a limit. Every
+    package is streamed to a file with a size cap, verified against its CodeSha256 and
+    reused by the functions with the same code. Since the packages may contain secrets, they
+    are stored in a temporary directory removed on shutdown, unless a directory is set to
+    reuse them in later scans.
+    """
+
+    def __init__(
+        self,
+        directory: str = None,
+        max_downloads: int = default_max_downloads,
+        max_code_size_in_mb: int = default_max_code_size_in_mb,
+    ):
+        self.directory = directory
+        self.max_downloads = max_downloads
+        self.max_code_size = max_code_size_in_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        self._executor = None
+        self._session = None
+        self._downloads = {}
+        self._temporary_directory = None
+
+    def configure(
+        self,
+        directory: str = None,
+        max_downloads: int = None,
+        max_code_size_in_mb: int = None,
+    ):
+        """configure sets the fetcher limits, the running downloads keep the previous ones"""
+        with self._lock:
+            if directory:
+                self.directory = os.path.expanduser(directory)
+            if max_code_size_in_mb:
+                self.max_code_size = max_code_size_in_mb * 1024 * 1024
+            if max_downloads and max_downloads != self.max_downloads:
+                self.max_downloads = max_downloads
+                if self._executor:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+                self._session = None
+            self._downloads = {}
+
+    def fetch(self, location: str, code_sha256: str) -> Future:
+        """fetch returns a future with the path of the code package, or None if it could not be downloaded"""
+        with self._lock:
+            # The functions with the same code share the download
+            download = self._downloads.get(code_sha256)
+            if not download:
+                if not self._executor:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_downloads,
+                        thread_name_prefix="prowler-lambda-code",
+                    )
+                download = self._downloads[code_sha256] = self._executor.submit(
+                    self.__download__, location, code_sha256
+                )
+            return download
+
+    def shutdown(self):
+        """shutdown waits for the running downloads and removes the temporary code packages"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._downloads = {}
+        # The downloads need the lock to finish
+        if executor:
+            executor.shutdown(wait=True)
+        with self._lock:
+            if self._temporary_directory:
+                shutil.rmtree(self._temporary_directory, ignore_errors=True)
+                self._temporary_directory = None
+                atexit.unregister(self.shutdown)
+
+    def __get_directory__(self) -> str:
+        with self._lock:
+            if self.directory:
+                # The code packages may contain secrets, so only the user can read them
+                os.makedirs(self.directory, mode=0o700, exist_ok=True)
+                return self.directory
+            if not self._temporary_directory:
+                # Created only readable by the user
+                self._temporary_directory = tempfile.mkdtemp(
+                    prefix=lambda_code_temporary_directory_prefix
+                )
+                # The code packages must be removed even if the execution is interrupted
+                atexit.register(self.shutdown)
+            return self._temporary_directory
+
+    def __get_session__(self) -> requests.Session:
+        with self._lock:
+            if not self._session:
+                self._session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.max_downloads,
+                    pool_maxsize=self.max_downloads,
+                )
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+            return self._session
+
+    def __download__(self, location: str, code_sha256: str) -> Optional[str]:
+        temp_code_file = None
+        try:
+            directory = self.__get_directory__()
+            code_path = f"{directory}/{get_code_file_name(code_sha256)}"
+            if os.path.exists(code_path):
+                return code_path
+            with self.__get_session__().get(
+                location, stream=True, timeout=download_timeout
+            ) as response:
+                response.raise_for_status()
+                if (
+                    int(response.headers.get("Content-Length") or 0)
+                    > self.max_code_size
+                ):
+                    logger.warning(
+                        f"Lambda code package {code_sha256} exceeds {self.max_code_size} bytes, skipping it"
+                    )
+                    return None
+                code_digest = hashlib.sha256()
+                code_size = 0
+                with tempfile.NamedTemporaryFile(
+                    dir=directory, suffix=".tmp", delete=False
+                ) as temp_code_file:
+                    for chunk in response.iter_content(download_chunk_size):
+                        code_size += len(chunk)
+                        if code_size > self.max_code_size:
+                            logger.warning(
+                                f"Lambda code package {code_sha256} exceeds {self.max_code_size} bytes, skipping it"
+                            )
+                            return None
+                        code_digest.update(chunk)
+                        temp_code_file.write(chunk)
+            if base64.b64encode(code_digest.digest()).decode() != code_sha256:
+                logger.warning(
+                    f"Lambda code package {code_sha256} does not match its CodeSha256, skipping it"
+                )
+                return None
+            # Written atomically since other scans may be reading the same package
+            os.replace(temp_code_file.name, code_path)
+            return code_path
+        except Exception as error:
+            logger.error(
+                f"{code_sha256} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+        finally:
+            if temp_code_file and os.path.exists(temp_code_file.name):
+                os.remove(temp_code_file.name)
+
+
+# Code fetcher shared by the Lambda services of the whole scan
+lambda_code_fetcher = Lambda_Code_Fetcher()
@@ -1,11 +1,15 @@
-import threading
 from datetime import datetime
 
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## Backup
@@ -23,21 +27,22 @@ class Backup:
             if audit_info.profile_region
             else list(self.regional_clients.keys())[0]
         )
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes(
+            "backup_client", audit_info
+        )
         self.backup_vaults = []
-        self.__threading_call__(self.__list_backup_vaults__)
+        if is_required_attribute("backup_vaults", required_attributes):
+            self.__threading_call__(self.__list_backup_vaults__)
         self.backup_plans = []
-        self.__threading_call__(self.__list_backup_plans__)
+        if is_required_attribute("backup_plans", required_attributes):
+            self.__threading_call__(self.__list_backup_plans__)
         self.backup_report_plans = []
-        self.__threading_call__(self.__list_backup_report_plans__)
+        if is_required_attribute("backup_report_plans", required_attributes):
+            self.__threading_call__(self.__list_backup_report_plans__)
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __list_backup_vaults__(self, regional_client):
         logger.info("Backup - Listing Backup Vaults...")
@@ -1,7 +1,7 @@
 from json import dumps, loads
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.secrets_scanner.secrets_scanner import secrets_scanner
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     convert_to_cloudwatch_timestamp_format,
 )
@@ -11,29 +11,39 @@ from prowler.providers.aws.services.cloudwatch.logs_client import logs_client
 class cloudwatch_log_group_no_secrets_in_logs(Check):
     def execute(self):
         findings = []
-        for log_group in logs_client.log_groups:
-            report = Check_Report_AWS(self.metadata())
-            report.status = "PASS"
-            report.status_extended = f"No secrets found in {log_group.name} log group."
-            report.region = log_group.region
-            report.resource_id = log_group.name
-            report.resource_arn = log_group.arn
-            log_group_secrets = []
-            if log_group.log_streams:
-                for log_stream_name in log_group.log_streams:
-                    log_stream_secrets = {}
-                    log_stream_data = "\n".join(
+        # Scan the events of all the log streams at once
+        log_streams_secrets = iter(
+            secrets_scanner.scan_batch(
+                [
+                    "\n".join(
                         [
                             dumps(event["message"])
                             for event in log_group.log_streams[log_stream_name]
                         ]
                     )
-                    log_stream_secrets_output = detect_secrets_scan(log_stream_data)
+                    for log_group in logs_client.log_groups
+                    if log_group.log_streams
+                    for log_stream_name in log_group.log_streams
+                ]
+            )
+        )
+        # Secrets of every log group by log stream and by timestamp of their events
+        log_groups_secrets = []
+        # Flagged events with more than one line, rescanned at once to get the type of secret and the line number
+        multiline_events = []
+        for log_group in logs_client.log_groups:
+            log_group_secrets = {}
+            if log_group.log_streams:
+                for log_stream_name in log_group.log_streams:
+                    log_stream_secrets = {}
+                    rescanned_events = set()
+                    log_stream_secrets_output = next(log_streams_secrets)
 
                     if log_stream_secrets_output:
                         for secret in log_stream_secrets_output:
+                            event_index = secret["line_number"] - 1
                             flagged_event = log_group.log_streams[log_stream_name][
-                                secret["line_number"] - 1
+                                event_index
                             ]
                             cloudwatch_timestamp = (
                                 convert_to_cloudwatch_timestamp_format(
@@ -53,30 +63,54 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                                 )
                             if len(log_event_data.split("\n")) > 1:
                                 # Can get more informative output if there is more than 1 line.
-                                # Will rescan just this event to get the type of secret and the line number
-                                event_detect_secrets_output = detect_secrets_scan(
-                                    log_event_data
-                                )
-                                for secret in event_detect_secrets_output:
-                                    log_stream_secrets[cloudwatch_timestamp].add_secret(
-                                        secret["line_number"], secret["type"]
+                                # The event is rescanned once, along with the rest of the flagged events
+                                if event_index not in rescanned_events:
+                                    rescanned_events.add(event_index)
+                                    multiline_events.append(
+                                        (
+                                            log_stream_secrets[cloudwatch_timestamp],
+                                            log_event_data,
+                                        )
                                     )
                             else:
                                 log_stream_secrets[cloudwatch_timestamp].add_secret(
                                     1, secret["type"]
                                 )
                     if log_stream_secrets:
-                        secrets_string = "; ".join(
+                        log_group_secrets[log_stream_name] = log_stream_secrets
+            log_groups_secrets.append(log_group_secrets)
+
+        events_secrets = secrets_scanner.scan_batch(
+            [log_event_data for _, log_event_data in multiline_events]
+        )
+        for (event_secrets, _), event_detect_secrets_output in zip(
+            multiline_events, events_secrets
+        ):
+            for secret in event_detect_secrets_output or []:
+                event_secrets.add_secret(secret["line_number"], secret["type"])
+
+        for log_group, log_group_secrets in zip(
+            logs_client.log_groups, log_groups_secrets
+        ):
+            report = Check_Report_AWS(self.metadata())
+            report.status = "PASS"
+            report.status_extended = f"No secrets found in {log_group.name} log group."
+            report.region = log_group.region
+            report.resource_id = log_group.name
+            report.resource_arn = log_group.arn
+            if log_group_secrets:
+                secrets_string = "; ".join(
+                    [
+                        f"in log stream {log_stream_name} "
+                        + "; ".join(
                             [
                                 f"at {timestamp} - {log_stream_secrets[timestamp].to_string()}"
                                 for timestamp in log_stream_secrets
                             ]
                         )
-                        log_group_secrets.append(
-                            f"in log stream {log_stream_name} {secrets_string}"
-                        )
-            if log_group_secrets:
-                secrets_string = "; ".join(log_group_secrets)
+                        for log_stream_name, log_stream_secrets in log_group_secrets.items()
+                    ]
+                )
                 report.status = "FAIL"
                 report.status_extended = f"Potential secrets found in log group {log_group.name} {secrets_string}"
             findings.append(report)
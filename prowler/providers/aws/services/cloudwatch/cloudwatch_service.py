@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -7,7 +6,12 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## CloudWatch
@@ -31,13 +35,7 @@ class CloudWatch:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __describe_alarms__(self, regional_client):
         logger.info("CloudWatch - Describing alarms...")
@@ -91,31 +89,29 @@ class Logs:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("logs_client", audit_info)
         self.metric_filters = []
+        if is_required_attribute("metric_filters", required_attributes):
+            self.__threading_call__(self.__describe_metric_filters__)
         self.log_groups = []
-        self.__threading_call__(self.__describe_metric_filters__)
-        self.__threading_call__(self.__describe_log_groups__)
-        if (
-            "cloudwatch_log_group_no_secrets_in_logs"
-            in audit_info.audit_metadata.expected_checks
-        ):
-            self.events_per_log_group_threshold = (
-                1000  # The threshold for number of events to return per log group.
-            )
-            self.__threading_call__(self.__get_log_events__)
-        self.__list_tags_for_resource__()
+        if is_required_attribute("log_groups", required_attributes):
+            self.__threading_call__(self.__describe_log_groups__)
+            if (
+                "cloudwatch_log_group_no_secrets_in_logs"
+                in audit_info.audit_metadata.expected_checks
+            ):
+                self.events_per_log_group_threshold = (
+                    1000  # The threshold for number of events to return per log group.
+                )
+                self.__threading_call__(self.__get_log_events__)
+            self.__list_tags_for_resource__()
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __describe_metric_filters__(self, regional_client):
         logger.info("CloudWatch Logs - Describing metric filters...")
@@ -1,4 +1,3 @@
-import threading
 from datetime import datetime
 from typing import Optional
 
@@ -7,7 +6,12 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## EC2
@@ -19,39 +23,44 @@ class EC2:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("ec2_client", audit_info)
         self.instances = []
-        self.__threading_call__(self.__describe_instances__)
-        self.__get_instance_user_data__()
+        if is_required_attribute("instances", required_attributes):
+            self.__threading_call__(self.__describe_instances__)
+            self.__get_instance_user_data__()
         self.security_groups = []
-        self.__threading_call__(self.__describe_security_groups__)
+        if is_required_attribute("security_groups", required_attributes):
+            self.__threading_call__(self.__describe_security_groups__)
+            self.__threading_call__(self.__describe_sg_network_interfaces__)
         self.network_acls = []
-        self.__threading_call__(self.__describe_network_acls__)
+        if is_required_attribute("network_acls", required_attributes):
+            self.__threading_call__(self.__describe_network_acls__)
         self.snapshots = []
-        self.__threading_call__(self.__describe_snapshots__)
-        self.__get_snapshot_public__()
+        if is_required_attribute("snapshots", required_attributes):
+            self.__threading_call__(self.__describe_snapshots__)
+            self.__get_snapshot_public__()
         self.network_interfaces = []
-        self.__threading_call__(self.__describe_public_network_interfaces__)
-        self.__threading_call__(self.__describe_sg_network_interfaces__)
+        if is_required_attribute("network_interfaces", required_attributes):
+            self.__threading_call__(self.__describe_public_network_interfaces__)
         self.images = []
-        self.__threading_call__(self.__describe_images__)
+        if is_required_attribute("images", required_attributes):
+            self.__threading_call__(self.__describe_images__)
         self.volumes = []
-        self.__threading_call__(self.__describe_volumes__)
+        if is_required_attribute("volumes", required_attributes):
+            self.__threading_call__(self.__describe_volumes__)
         self.ebs_encryption_by_default = []
-        self.__threading_call__(self.__get_ebs_encryption_by_default__)
+        if is_required_attribute("ebs_encryption_by_default", required_attributes):
+            self.__threading_call__(self.__get_ebs_encryption_by_default__)
         self.elastic_ips = []
-        self.__threading_call__(self.__describe_addresses__)
+        if is_required_attribute("elastic_ips", required_attributes):
+            self.__threading_call__(self.__describe_addresses__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __describe_instances__(self, regional_client):
         logger.info("EC2 - Describing EC2 Instances...")
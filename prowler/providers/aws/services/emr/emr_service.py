@@ -1,4 +1,3 @@
-import threading
 from enum import Enum
 from typing import Optional
 
@@ -7,7 +6,12 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## EMR
@@ -18,23 +22,23 @@ class EMR:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("emr_client", audit_info)
         self.clusters = {}
+        if is_required_attribute("clusters", required_attributes):
+            self.__threading_call__(self.__list_clusters__)
+            self.__threading_call__(self.__describe_cluster__)
         self.block_public_access_configuration = {}
-        self.__threading_call__(self.__list_clusters__)
-        self.__threading_call__(self.__describe_cluster__)
-        self.__threading_call__(self.__get_block_public_access_configuration__)
+        if is_required_attribute(
+            "block_public_access_configuration", required_attributes
+        ):
+            self.__threading_call__(self.__get_block_public_access_configuration__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __list_clusters__(self, regional_client):
         logger.info("EMR - Listing Clusters...")
@@ -1,11 +1,15 @@
-import threading
 from typing import Optional
 
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## Glue
@@ -16,30 +20,32 @@ class Glue:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("glue_client", audit_info)
         self.connections = []
-        self.__threading_call__(self.__get_connections__)
+        if is_required_attribute("connections", required_attributes):
+            self.__threading_call__(self.__get_connections__)
         self.tables = []
-        self.__threading_call__(self.__search_tables__)
+        if is_required_attribute("tables", required_attributes):
+            self.__threading_call__(self.__search_tables__)
         self.catalog_encryption_settings = []
-        self.__threading_call__(self.__get_data_catalog_encryption_settings__)
+        if is_required_attribute("catalog_encryption_settings", required_attributes):
+            self.__threading_call__(self.__get_data_catalog_encryption_settings__)
         self.dev_endpoints = []
-        self.__threading_call__(self.__get_dev_endpoints__)
+        if is_required_attribute("dev_endpoints", required_attributes):
+            self.__threading_call__(self.__get_dev_endpoints__)
         self.security_configs = []
-        self.__threading_call__(self.__get_security_configurations__)
+        if is_required_attribute("security_configs", required_attributes):
+            self.__threading_call__(self.__get_security_configurations__)
         self.jobs = []
-        self.__threading_call__(self.__get_jobs__)
+        if is_required_attribute("jobs", required_attributes):
+            self.__threading_call__(self.__get_jobs__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __get_connections__(self, regional_client):
         logger.info("Glue - Getting connections...")
@@ -5,9 +5,14 @@ from typing import Optional
 from botocore.client import ClientError
 from pydantic import BaseModel
 
+from prowler.lib.incremental_scan.incremental_scan import incremental_scan
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
 
 
 def is_service_role(role):
@@ -60,36 +65,68 @@ class IAM:
         )
         self.client = list(global_client.values())[0]
         self.region = self.client.region
-        self.users = self.__get_users__()
-        self.roles = self.__get_roles__()
-        self.account_summary = self.__get_account_summary__()
-        self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
-        self.credential_report = self.__get_credential_report__()
-        self.groups = self.__get_groups__()
-        self.__get_group_users__()
-        self.__list_attached_group_policies__()
-        self.__list_attached_user_policies__()
-        self.__list_attached_role_policies__()
-        self.__list_inline_user_policies__()
-        self.__list_mfa_devices__()
-        self.password_policy = self.__get_password_policy__()
-        support_policy_arn = (
-            "arn:aws:iam::aws:policy/aws-service-role/AWSSupportServiceRolePolicy"
-        )
-        self.entities_role_attached_to_support_policy = (
-            self.__list_entities_role_for_policy__(support_policy_arn)
-        )
-        securityaudit_policy_arn = "arn:aws:iam::aws:policy/SecurityAudit"
-        self.entities_role_attached_to_securityaudit_policy = (
-            self.__list_entities_role_for_policy__(securityaudit_policy_arn)
-        )
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("iam_client", audit_info)
+        self.users = []
+        if is_required_attribute("users", required_attributes):
+            self.users = self.__get_users__()
+        self.roles = []
+        if is_required_attribute("roles", required_attributes):
+            self.roles = self.__get_roles__()
+        self.account_summary = None
+        if is_required_attribute("account_summary", required_attributes):
+            self.account_summary = self.__get_account_summary__()
+        self.virtual_mfa_devices = []
+        if is_required_attribute("virtual_mfa_devices", required_attributes):
+            self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
+        self.credential_report = []
+        if is_required_attribute("credential_report", required_attributes):
+            self.credential_report = self.__get_credential_report__()
+        self.groups = []
+        if is_required_attribute("groups", required_attributes):
+            self.groups = self.__get_groups__()
+            self.__get_group_users__()
+            self.__list_attached_group_policies__()
+        if is_required_attribute("users", required_attributes):
+            self.__list_attached_user_policies__()
+        if is_required_attribute("roles", required_attributes):
+            self.__list_attached_role_policies__()
+        if is_required_attribute("users", required_attributes):
+            self.__list_inline_user_policies__()
+            self.__list_mfa_devices__()
+        self.password_policy = None
+        if is_required_attribute("password_policy", required_attributes):
+            self.password_policy = self.__get_password_policy__()
+        self.entities_role_attached_to_support_policy = []
+        if is_required_attribute(
+            "entities_role_attached_to_support_policy", required_attributes
+        ):
+            support_policy_arn = (
+                "arn:aws:iam::aws:policy/aws-service-role/AWSSupportServiceRolePolicy"
+            )
+            self.entities_role_attached_to_support_policy = (
+                self.__list_entities_role_for_policy__(support_policy_arn)
+            )
+        self.entities_role_attached_to_securityaudit_policy = []
+        if is_required_attribute(
+            "entities_role_attached_to_securityaudit_policy", required_attributes
+        ):
+            securityaudit_policy_arn = "arn:aws:iam::aws:policy/SecurityAudit"
+            self.entities_role_attached_to_securityaudit_policy = (
+                self.__list_entities_role_for_policy__(securityaudit_policy_arn)
+            )
         # List both Customer (attached and unattached) and AWS Managed (only attached) policies
         self.policies = []
-        self.policies.extend(self.__list_policies__("AWS"))
-        self.policies.extend(self.__list_policies__("Local"))
-        self.__list_policies_version__(self.policies)
-        self.saml_providers = self.__list_saml_providers__()
-        self.server_certificates = self.__list_server_certificates__()
+        if is_required_attribute("policies", required_attributes):
+            self.policies.extend(self.__list_policies__("AWS"))
+            self.policies.extend(self.__list_policies__("Local"))
+            self.__list_policies_version__(self.policies)
+        self.saml_providers = []
+        if is_required_attribute("saml_providers", required_attributes):
+            self.saml_providers = self.__list_saml_providers__()
+        self.server_certificates = []
+        if is_required_attribute("server_certificates", required_attributes):
+            self.server_certificates = self.__list_server_certificates__()
         self.__list_tags_for_resource__()
 
     def __get_client__(self):
@@ -430,6 +467,7 @@ class IAM:
                             Policy(
                                 name=policy["PolicyName"],
                                 arn=policy["Arn"],
+                                id=policy["PolicyId"],
                                 version_id=policy["DefaultVersionId"],
                                 type="Custom" if scope == "Local" else "AWS",
                                 attached=True
@@ -448,10 +486,20 @@ class IAM:
         logger.info("IAM - List Policies Version...")
         try:
             for policy in policies:
-                policy_version = self.client.get_policy_version(
-                    PolicyArn=policy.arn, VersionId=policy.version_id
+                # The policy versions never change, so their documents are reused by the incremental scans.
+                # A policy recreated with the same name has the same ARN and version ID but a new policy ID
+                policy_version_key = f"{policy.id}:{policy.version_id}"
+                policy.document = incremental_scan.get_resource_detail(
+                    self.service, policy_version_key
                 )
-                policy.document = policy_version["PolicyVersion"]["Document"]
+                if policy.document is None:
+                    policy_version = self.client.get_policy_version(
+                        PolicyArn=policy.arn, VersionId=policy.version_id
+                    )
+                    policy.document = policy_version["PolicyVersion"]["Document"]
+                    incremental_scan.set_resource_detail(
+                        self.service, policy_version_key, policy.document
+                    )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -595,6 +643,7 @@ class Certificate(BaseModel):
 class Policy(BaseModel):
     name: str
     arn: str
+    id: str
     version_id: str
     type: str
     attached: bool
@@ -1,4 +1,3 @@
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -6,7 +5,12 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## RDS
@@ -22,26 +26,27 @@ class RDS:
         self.db_snapshots = []
         self.db_engines = {}
         self.db_cluster_snapshots = []
-        self.__threading_call__(self.__describe_db_instances__)
-        self.__threading_call__(self.__describe_db_parameters__)
-        self.__threading_call__(self.__describe_db_snapshots__)
-        self.__threading_call__(self.__describe_db_snapshot_attributes__)
-        self.__threading_call__(self.__describe_db_clusters__)
-        self.__threading_call__(self.__describe_db_cluster_snapshots__)
-        self.__threading_call__(self.__describe_db_cluster_snapshot_attributes__)
-        self.__threading_call__(self.__describe_db_engine_versions__)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("rds_client", audit_info)
+        if is_required_attribute("db_instances", required_attributes):
+            self.__threading_call__(self.__describe_db_instances__)
+            self.__threading_call__(self.__describe_db_parameters__)
+        if is_required_attribute("db_snapshots", required_attributes):
+            self.__threading_call__(self.__describe_db_snapshots__)
+            self.__threading_call__(self.__describe_db_snapshot_attributes__)
+        if is_required_attribute("db_clusters", required_attributes):
+            self.__threading_call__(self.__describe_db_clusters__)
+        if is_required_attribute("db_cluster_snapshots", required_attributes):
+            self.__threading_call__(self.__describe_db_cluster_snapshots__)
+            self.__threading_call__(self.__describe_db_cluster_snapshot_attributes__)
+        if is_required_attribute("db_engines", required_attributes):
+            self.__threading_call__(self.__describe_db_engine_versions__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __describe_db_instances__(self, regional_client):
         logger.info("RDS - Describe Instances...")
@@ -4,7 +4,11 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
 
 
 ################## Route53
@@ -25,7 +29,12 @@ class Route53:
             self.__list_hosted_zones__()
             self.__list_query_logging_configs__()
             self.__list_tags_for_resource__()
-            self.__list_resource_record_sets__()
+            # Only the record sets used by the checks to execute are gathered
+            if is_required_attribute(
+                "record_sets",
+                get_required_client_attributes("route53_client", audit_info),
+            ):
+                self.__list_resource_record_sets__()
 
     def __get_session__(self):
         return self.session
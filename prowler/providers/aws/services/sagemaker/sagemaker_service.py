@@ -1,4 +1,3 @@
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -6,7 +5,12 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################################ SageMaker
@@ -19,9 +23,16 @@ class SageMaker:
         self.sagemaker_notebook_instances = []
         self.sagemaker_models = []
         self.sagemaker_training_jobs = []
-        self.__threading_call__(self.__list_notebook_instances__)
-        self.__threading_call__(self.__list_models__)
-        self.__threading_call__(self.__list_training_jobs__)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes(
+            "sagemaker_client", audit_info
+        )
+        if is_required_attribute("sagemaker_notebook_instances", required_attributes):
+            self.__threading_call__(self.__list_notebook_instances__)
+        if is_required_attribute("sagemaker_models", required_attributes):
+            self.__threading_call__(self.__list_models__)
+        if is_required_attribute("sagemaker_training_jobs", required_attributes):
+            self.__threading_call__(self.__list_training_jobs__)
         self.__describe_model__(self.regional_clients)
         self.__describe_notebook_instance__(self.regional_clients)
         self.__describe_training_job__(self.regional_clients)
@@ -31,13 +42,7 @@ class SageMaker:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __list_notebook_instances__(self, regional_client):
         logger.info("SageMaker - listing notebook instances...")
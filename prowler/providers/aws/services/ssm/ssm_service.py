@@ -1,5 +1,4 @@
 import json
-import threading
 from enum import Enum
 from typing import Optional
 
@@ -8,7 +7,12 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## SSM
@@ -20,26 +24,25 @@ class SSM:
         self.audited_partition = audit_info.audited_partition
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("ssm_client", audit_info)
         self.documents = {}
+        if is_required_attribute("documents", required_attributes):
+            self.__threading_call__(self.__list_documents__)
+            self.__threading_call__(self.__get_document__)
+            self.__threading_call__(self.__describe_document_permission__)
         self.compliance_resources = {}
+        if is_required_attribute("compliance_resources", required_attributes):
+            self.__threading_call__(self.__list_resource_compliance_summaries__)
         self.managed_instances = {}
-        self.__threading_call__(self.__list_documents__)
-        self.__threading_call__(self.__get_document__)
-        self.__threading_call__(self.__describe_document_permission__)
-        self.__threading_call__(self.__list_resource_compliance_summaries__)
-        self.__threading_call__(self.__describe_instance_information__)
+        if is_required_attribute("managed_instances", required_attributes):
+            self.__threading_call__(self.__describe_instance_information__)
 
     def __get_session__(self):
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __list_documents__(self, regional_client):
         logger.info("SSM - Listing Documents...")
@@ -1,12 +1,16 @@
 import json
-import threading
 from typing import Optional
 
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.aws_provider import (
+    generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
+)
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 
 
 ################## VPC
@@ -17,19 +21,33 @@ class VPC:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        # Only the resources used by the checks to execute are gathered
+        required_attributes = get_required_client_attributes("vpc_client", audit_info)
+        # The subnets are also added to their VPCs
+        gather_vpcs = is_required_attribute(
+            "vpcs", required_attributes
+        ) or is_required_attribute("vpc_subnets", required_attributes)
         self.vpcs = {}
         self.vpc_peering_connections = []
         self.vpc_endpoints = []
         self.vpc_endpoint_services = []
-        self.__threading_call__(self.__describe_vpcs__)
-        self.__threading_call__(self.__describe_vpc_peering_connections__)
-        self.__threading_call__(self.__describe_vpc_endpoints__)
-        self.__threading_call__(self.__describe_vpc_endpoint_services__)
-        self.__describe_flow_logs__()
-        self.__describe_peering_route_tables__()
-        self.__describe_vpc_endpoint_service_permissions__()
+        if gather_vpcs:
+            self.__threading_call__(self.__describe_vpcs__)
+        if is_required_attribute("vpc_peering_connections", required_attributes):
+            self.__threading_call__(self.__describe_vpc_peering_connections__)
+        if is_required_attribute("vpc_endpoints", required_attributes):
+            self.__threading_call__(self.__describe_vpc_endpoints__)
+        if is_required_attribute("vpc_endpoint_services", required_attributes):
+            self.__threading_call__(self.__describe_vpc_endpoint_services__)
+        if is_required_attribute("vpcs", required_attributes):
+            self.__describe_flow_logs__()
+        if is_required_attribute("vpc_peering_connections", required_attributes):
+            self.__describe_peering_route_tables__()
+        if is_required_attribute("vpc_endpoint_services", required_attributes):
+            self.__describe_vpc_endpoint_service_permissions__()
         self.vpc_subnets = {}
-        self.__threading_call__(self.__describe_vpc_subnets__)
+        if gather_vpcs:
+            self.__threading_call__(self.__describe_vpc_subnets__)
         self.region = (
             audit_info.profile_region
             if audit_info.profile_region
@@ -40,13 +58,7 @@ class VPC:
         return self.session
 
     def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        worker_pool.map(call, self.regional_clients.values())
 
     def __describe_vpcs__(self, regional_client):
         logger.info("VPC - Describing VPCs...")
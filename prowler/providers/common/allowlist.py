@@ -2,7 +2,10 @@ import importlib
 import sys
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.lib.allowlist.allowlist import parse_allowlist_file
+from prowler.providers.aws.lib.allowlist.allowlist import (
+    compile_allowlist,
+    parse_allowlist_file,
+)
 
 
 def set_provider_allowlist(provider, audit_info, args):
@@ -29,7 +32,9 @@ def set_provider_allowlist(provider, audit_info, args):
 def set_aws_allowlist(audit_info, allowlist_file):
     # Parse content from Allowlist file and get it, if necessary, from S3
     if allowlist_file:
-        allowlist_file = parse_allowlist_file(audit_info, allowlist_file)
+        allowlist_file = compile_allowlist(
+            parse_allowlist_file(audit_info, allowlist_file)
+        )
     else:
         allowlist_file = None
     return allowlist_file
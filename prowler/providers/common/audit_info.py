@@ -1,15 +1,22 @@
 import sys
 
 from botocore.config import Config
+from botocore.endpoint import MAX_POOL_CONNECTIONS
 from colorama import Fore, Style
 
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import Resource_Filter
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     get_checks_from_input_arn,
     get_regions_from_audit_resources,
 )
+from prowler.providers.aws.lib.api_cache.api_cache import (
+    AWS_API_Cache,
+    default_api_cache_directory,
+    default_api_cache_ttl,
+)
 from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
 from prowler.providers.aws.lib.audit_info.audit_info import current_audit_info
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info, AWS_Credentials
@@ -20,9 +27,11 @@ from prowler.providers.aws.lib.credentials.credentials import (
 from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
 )
+from prowler.providers.aws.lib.rate_limiter.rate_limiter import AWS_Rate_Limiter
 from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
     get_tagged_resources,
 )
+from prowler.providers.aws.lib.worker_pool.worker_pool import worker_pool
 from prowler.providers.azure.azure_provider import Azure_Provider
 from prowler.providers.azure.lib.audit_info.audit_info import azure_audit_info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
@@ -109,6 +118,29 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
             new_boto3_config = current_audit_info.session_config.merge(config)
             current_audit_info.session_config = new_boto3_config
 
+        # Set the limits of the worker pool shared by the AWS services
+        aws_max_workers = arguments.get("aws_max_workers")
+        aws_max_workers_per_region = arguments.get("aws_max_workers_per_region")
+        if aws_max_workers or aws_max_workers_per_region:
+            worker_pool.configure(aws_max_workers, aws_max_workers_per_region)
+        # Every regional client must have enough connections for its region's workers
+        if worker_pool.max_workers_per_region > MAX_POOL_CONNECTIONS:
+            current_audit_info.session_config = current_audit_info.session_config.merge(
+                Config(max_pool_connections=worker_pool.max_workers_per_region)
+            )
+
+        # Set the API responses cache
+        if arguments.get("api_cache") or arguments.get("api_cache_replay"):
+            current_audit_info.api_cache = AWS_API_Cache(
+                arguments.get("api_cache") or default_api_cache_directory,
+                arguments.get("api_cache_ttl") or default_api_cache_ttl,
+                arguments.get("api_cache_replay"),
+            )
+
+        # Set the rate limiter of the AWS API calls
+        if not arguments.get("no_aws_rate_limiter"):
+            current_audit_info.rate_limiter = AWS_Rate_Limiter()
+
         # Setting session
         current_audit_info.profile = input_profile
         current_audit_info.audited_regions = input_regions
@@ -147,6 +179,13 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
                 role_arn_parsed = parse_iam_credentials_arn(
                     current_audit_info.assumed_role_info.role_arn
                 )
+                # The metadata is of the audited account, the one of the role to assume if it is set,
+                # e.g. every account of the AWS Organization with --scan-organization
+                organizations_metadata_account = current_audit_info.audited_account
+                if input_role:
+                    organizations_metadata_account = parse_iam_credentials_arn(
+                        input_role
+                    ).account_id
 
             except Exception as error:
                 logger.critical(f"{error.__class__.__name__} -- {error}")
@@ -154,13 +193,13 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
 
             else:
                 logger.info(
-                    f"Getting organizations metadata for account {organizations_role_arn}"
+                    f"Getting organizations metadata for account {organizations_metadata_account}"
                 )
                 assumed_credentials = assume_role(
                     aws_provider.aws_session, aws_provider.role_info
                 )
                 current_audit_info.organizations_metadata = get_organizations_metadata(
-                    current_audit_info.audited_account, assumed_credentials
+                    organizations_metadata_account, assumed_credentials
                 )
                 logger.info("Organizations metadata retrieved")
 
@@ -229,13 +268,15 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         # Parse Scan Tags
         if arguments.get("resource_tags"):
             input_resource_tags = arguments.get("resource_tags")
-            current_audit_info.audit_resources = get_tagged_resources(
-                input_resource_tags, current_audit_info
+            current_audit_info.audit_resources = Resource_Filter(
+                get_tagged_resources(input_resource_tags, current_audit_info)
             )
 
         # Parse Input Resource ARNs
         if arguments.get("resource_arn"):
-            current_audit_info.audit_resources = arguments.get("resource_arn")
+            current_audit_info.audit_resources = Resource_Filter(
+                arguments.get("resource_arn")
+            )
 
         return current_audit_info
 
@@ -3,9 +3,11 @@ import sys
 from dataclasses import dataclass
 from os import makedirs
 from os.path import isdir
+from typing import Any
 
 from prowler.config.config import change_config_var, output_file_timestamp
 from prowler.lib.logger import logger
+from prowler.providers.aws.lib.security_hub.security_hub import Security_Hub_Exporter
 
 
 def set_provider_output_options(
@@ -39,6 +41,8 @@ class Provider_Output_Options:
     verbose: str
     output_filename: str
     only_logs: bool
+    compress_html: bool
+    output_session: Any
 
     def __init__(self, arguments, allowlist_file, bulk_checks_metadata):
         self.is_quiet = arguments.quiet
@@ -48,6 +52,9 @@ class Provider_Output_Options:
         self.bulk_checks_metadata = bulk_checks_metadata
         self.allowlist_file = allowlist_file
         self.only_logs = arguments.only_logs
+        self.compress_html = getattr(arguments, "compress_html", False)
+        # Output files opened during the scan
+        self.output_session = None
         # Check output directory, if it is not created -> create it
         if arguments.output_directory:
             if not isdir(arguments.output_directory):
@@ -95,6 +102,7 @@ class Gcp_Output_Options(Provider_Output_Options):
 
 class Aws_Output_Options(Provider_Output_Options):
     security_hub_enabled: bool
+    security_hub_exporter: Security_Hub_Exporter
 
     def __init__(self, arguments, audit_info, allowlist_file, bulk_checks_metadata):
         # First call Provider_Output_Options init
@@ -117,8 +125,11 @@ class Aws_Output_Options(Provider_Output_Options):
 
         # Security Hub Outputs
         self.security_hub_enabled = arguments.security_hub
+        self.security_hub_exporter = None
         if arguments.security_hub:
+            self.security_hub_exporter = Security_Hub_Exporter(audit_info.audit_session)
             if not self.output_modes:
                 self.output_modes = ["json-asff"]
-            else:
+            # The findings to resolve can be read from either ASFF output
+            elif "ndjson-asff" not in self.output_modes:
                 self.output_modes.append("json-asff")
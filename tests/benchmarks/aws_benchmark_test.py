@@ -0,0 +1,297 @@
+import importlib
+import json
+import os
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+from boto3 import client, session
+from moto import (
+    mock_ec2,
+    mock_iam,
+    mock_logs,
+    mock_rds,
+    mock_s3,
+    mock_s3control,
+    mock_sts,
+)
+from moto.ec2.models.amis import AmiBackend
+
+from prowler.config.config import prowler_version
+from prowler.lib.check.check import (
+    recover_checks_from_provider,
+    recover_service_clients_from_checks,
+)
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import Logs
+from prowler.providers.aws.services.ec2.ec2_service import EC2
+from prowler.providers.aws.services.iam.iam_service import IAM
+from prowler.providers.aws.services.rds.rds_service import RDS
+from prowler.providers.aws.services.s3.s3_service import S3, S3Control
+from prowler.providers.aws.services.vpc.vpc_service import VPC
+from prowler.providers.common.models import Audit_Metadata
+
+# The benchmark seeds moto with large synthetic accounts so it is only run on demand:
+#   PROWLER_BENCHMARK=1 pytest tests/benchmarks -s
+# PROWLER_BENCHMARK_SCALE multiplies the number of resources (e.g. 0.01 for a quick run)
+# and PROWLER_BENCHMARK_OUTPUT sets the JSON file where the results are stored.
+benchmark_enabled = os.environ.get("PROWLER_BENCHMARK")
+benchmark_scale = float(os.environ.get("PROWLER_BENCHMARK_SCALE", "1"))
+benchmark_output = os.environ.get(
+    "PROWLER_BENCHMARK_OUTPUT", "prowler-benchmark-results.json"
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGIONS = [
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "ca-central-1",
+    "eu-central-1",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-west-3",
+    "eu-north-1",
+    "ap-south-1",
+    "ap-northeast-1",
+    "ap-northeast-2",
+    "ap-northeast-3",
+    "ap-southeast-1",
+    "ap-southeast-2",
+    "sa-east-1",
+]
+# Resources of the synthetic account for a scale of 1
+AWS_RESOURCES = {
+    "security_groups": 10000,
+    "vpcs": 500,
+    "buckets": 5000,
+    "roles": 20000,
+    "db_instances": 500,
+    "log_groups": 50000,
+}
+# Services benchmarked, keyed by the name of their client in the checks
+AWS_SERVICES = {
+    "ec2_client": EC2,
+    "vpc_client": VPC,
+    "s3_client": S3,
+    "s3control_client": S3Control,
+    "iam_client": IAM,
+    "rds_client": RDS,
+    "logs_client": Logs,
+}
+
+
+def scaled(resources: int) -> int:
+    return max(1, int(resources * benchmark_scale))
+
+
+def set_mocked_audit_info(expected_checks: list):
+    audit_info = AWS_Audit_Info(
+        session_config=None,
+        original_session=None,
+        audit_session=session.Session(
+            profile_name=None,
+            botocore_session=None,
+        ),
+        audited_account=AWS_ACCOUNT_NUMBER,
+        audited_user_id=None,
+        audited_partition="aws",
+        audited_identity_arn=None,
+        profile=None,
+        profile_region="us-east-1",
+        credentials=None,
+        assumed_role_info=None,
+        audited_regions=AWS_REGIONS,
+        organizations_metadata=None,
+        audit_resources=None,
+        audit_metadata=Audit_Metadata(
+            services_scanned=0,
+            expected_checks=expected_checks,
+            completed_checks=0,
+            audit_progress=0,
+        ),
+    )
+    return audit_info
+
+
+def seed_account() -> dict:
+    """seed_account creates the synthetic resources spread across the regions and returns their count"""
+    seeded = {resource: scaled(count) for resource, count in AWS_RESOURCES.items()}
+    for index in range(seeded["security_groups"]):
+        region = AWS_REGIONS[index % len(AWS_REGIONS)]
+        client("ec2", region_name=region).create_security_group(
+            GroupName=f"benchmark-sg-{index}", Description="Benchmark"
+        )
+    for index in range(seeded["vpcs"]):
+        region = AWS_REGIONS[index % len(AWS_REGIONS)]
+        client("ec2", region_name=region).create_vpc(
+            CidrBlock=f"10.{index % 256}.0.0/16"
+        )
+    for index in range(seeded["buckets"]):
+        region = AWS_REGIONS[index % len(AWS_REGIONS)]
+        bucket_configuration = {}
+        if region != "us-east-1":
+            bucket_configuration = {
+                "CreateBucketConfiguration": {"LocationConstraint": region}
+            }
+        client("s3", region_name=region).create_bucket(
+            Bucket=f"benchmark-bucket-{index}", **bucket_configuration
+        )
+    iam_client = client("iam")
+    for index in range(seeded["roles"]):
+        iam_client.create_role(
+            RoleName=f"benchmark-role-{index}",
+            AssumeRolePolicyDocument=json.dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": {"Service": "ec2.amazonaws.com"},
+                            "Action": "sts:AssumeRole",
+                        }
+                    ],
+                }
+            ),
+        )
+    for index in range(seeded["db_instances"]):
+        region = AWS_REGIONS[index % len(AWS_REGIONS)]
+        client("rds", region_name=region).create_db_instance(
+            DBInstanceIdentifier=f"benchmark-db-{index}",
+            DBInstanceClass="db.t3.micro",
+            Engine="postgres",
+            AllocatedStorage=10,
+        )
+    for index in range(seeded["log_groups"]):
+        region = AWS_REGIONS[index % len(AWS_REGIONS)]
+        client("logs", region_name=region).create_log_group(
+            logGroupName=f"benchmark-log-group-{index}"
+        )
+    return seeded
+
+
+class API_Calls_Counter:
+    """API_Calls_Counter counts the AWS API calls made by the clients of a session"""
+
+    def __init__(self, aws_session: session.Session):
+        self.api_calls = 0
+        aws_session.events.register("before-call", self.__count__)
+
+    def __count__(self, **kwargs):
+        self.api_calls += 1
+
+
+def measure(call, api_calls_counter: API_Calls_Counter) -> tuple:
+    """measure executes call and returns its result with the wall time, API calls and peak memory"""
+    api_calls = api_calls_counter.api_calls
+    tracemalloc.reset_peak()
+    memory, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    result = call()
+    wall_time = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    return result, {
+        "wall_time": round(wall_time, 3),
+        "api_calls": api_calls_counter.api_calls - api_calls,
+        "peak_memory": peak_memory - memory,
+    }
+
+
+def recover_benchmark_checks() -> dict:
+    """recover_benchmark_checks returns the checks that only use the benchmarked services with their clients"""
+    benchmark_checks = {}
+    for service in ("ec2", "vpc", "s3", "iam", "rds", "cloudwatch"):
+        for check_name, _ in recover_checks_from_provider("aws", service):
+            check_clients = [
+                service_client.split(".")[-1]
+                for service_client in recover_service_clients_from_checks(
+                    [check_name], "aws"
+                )
+            ]
+            if check_clients and all(
+                check_client in AWS_SERVICES for check_client in check_clients
+            ):
+                benchmark_checks[check_name] = check_clients
+    return dict(sorted(benchmark_checks.items()))
+
+
+@pytest.mark.skipif(
+    not benchmark_enabled, reason="Set PROWLER_BENCHMARK=1 to run the benchmark"
+)
+class Test_AWS_Benchmark:
+    # Only the synthetic resources are measured, not the public AMIs and snapshots of moto
+    @mock.patch.object(AmiBackend, "_load_amis", new=lambda self: None)
+    @mock_sts
+    @mock_ec2
+    @mock_s3
+    @mock_s3control
+    @mock_iam
+    @mock_rds
+    @mock_logs
+    def test_aws_benchmark(self):
+        start = time.perf_counter()
+        seeded = seed_account()
+        seed_time = round(time.perf_counter() - start, 3)
+
+        benchmark_checks = recover_benchmark_checks()
+        audit_info = set_mocked_audit_info(list(benchmark_checks))
+        api_calls_counter = API_Calls_Counter(audit_info.audit_session)
+        results = {
+            "prowler_version": prowler_version,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "scale": benchmark_scale,
+            "regions": len(AWS_REGIONS),
+            "resources": seeded,
+            "seed_time": seed_time,
+            "services": {},
+            "checks": {},
+        }
+
+        tracemalloc.start()
+        try:
+            services = {}
+            for client_name, service in AWS_SERVICES.items():
+                services[client_name], results["services"][service.__name__] = measure(
+                    lambda: service(audit_info), api_calls_counter
+                )
+
+            # Every check is executed with the services already built
+            with mock.patch(
+                "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+                new=audit_info,
+            ):
+                for check_name, check_clients in benchmark_checks.items():
+                    service = check_name.split("_")[0]
+                    check_module_path = f"prowler.providers.aws.services.{service}.{check_name}.{check_name}"
+                    check_module = importlib.import_module(check_module_path)
+                    with mock.patch.multiple(
+                        check_module,
+                        **{
+                            check_client: services[check_client]
+                            for check_client in check_clients
+                        },
+                    ):
+                        check = getattr(check_module, check_name)()
+                        try:
+                            findings, results["checks"][check_name] = measure(
+                                check.execute, api_calls_counter
+                            )
+                            results["checks"][check_name]["findings"] = len(findings)
+                        # Some checks need APIs not implemented by moto
+                        except Exception as error:
+                            results["checks"][check_name] = {
+                                "error": f"{error.__class__.__name__}: {error}"
+                            }
+        finally:
+            tracemalloc.stop()
+
+        with open(benchmark_output, "w") as f:
+            json.dump(results, f, indent=4)
+
+        assert len(services["ec2_client"].security_groups) >= seeded["security_groups"]
+        assert len(services["s3_client"].buckets) == seeded["buckets"]
+        assert len(services["logs_client"].log_groups) == seeded["log_groups"]
+        assert results["checks"]
@@ -1,8 +1,11 @@
 import os
 import pathlib
+import sys
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
 
+import mock
+import pytest
 from boto3 import client, session
 from mock import patch
 from moto import mock_s3
@@ -10,16 +13,30 @@ from moto import mock_s3
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
+    execute_check,
+    execute_checks,
+    is_time_dependent_check,
     list_modules,
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
+    prefetch_service_clients,
     recover_checks_from_provider,
     recover_checks_from_service,
+    recover_client_attributes_from_check,
+    recover_service_clients_from_checks,
     remove_custom_checks_module,
     update_audit_metadata,
 )
-from prowler.lib.check.models import load_check_metadata
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    checks_metadata,
+    load_check_metadata,
+    register_check_metadata,
+)
+from prowler.lib.incremental_scan.incremental_scan import Incremental_Scan
+from prowler.lib.profiler.profiler import Scan_Profiler
 from prowler.providers.aws.aws_provider import (
     get_checks_from_input_arn,
     get_regions_from_audit_resources,
@@ -134,6 +151,15 @@ def mock_recover_checks_from_aws_provider_lambda_service(*_):
     ]
 
 
+def mock_finding(check_name, service):
+    finding = mock.MagicMock()
+    finding.status = "PASS"
+    finding.resource_id = check_name
+    finding.check_metadata.CheckID = check_name
+    finding.check_metadata.ServiceName = service
+    return finding
+
+
 class Test_Check:
     def set_mocked_audit_info(self):
         audit_info = AWS_Audit_Info(
@@ -320,6 +346,7 @@ class Test_Check:
         assert listed_services == sorted(expected_services)
 
     @patch("prowler.lib.check.check.list_modules", new=mock_list_modules)
+    @patch("prowler.lib.check.check.get_checks_manifest", new=lambda _: None)
     def test_recover_checks_from_provider(self):
         provider = "azure"
         service = "storage"
@@ -510,3 +537,269 @@ class Test_Check:
         assert audit_metadata.services_scanned == 1
         assert audit_metadata.expected_checks == expected_checks
         assert audit_metadata.completed_checks == 1
+
+    def test_execute_checks_in_parallel(self):
+        checks_to_execute = [
+            "accessanalyzer_enabled_without_findings",
+            "ec2_ami_public",
+            "ec2_ebs_default_encryption",
+            "iam_support_role_created",
+        ]
+        loaded_checks = []
+
+        def mock_load_check(service, check_name, provider):
+            check = mock.MagicMock()
+            check.CheckID = check_name
+            check.ServiceName = service
+            check.execute.return_value = [mock_finding(check_name, service)]
+            loaded_checks.append(check_name)
+            return check
+
+        reported_findings = []
+
+        def mock_report(check_findings, *_):
+            reported_findings.extend(check_findings)
+
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = mock.MagicMock()
+        audit_output_options.only_logs = True
+        audit_output_options.verbose = False
+        with mock.patch(
+            "prowler.lib.check.check.load_check", new=mock_load_check
+        ), mock.patch("prowler.lib.check.check.report", new=mock_report):
+            findings = execute_checks(
+                checks_to_execute, "aws", audit_info, audit_output_options, 3
+            )
+
+        # Findings are reported and aggregated following the checks order
+        assert [
+            finding.resource_id for finding in reported_findings
+        ] == checks_to_execute
+        assert len(findings) == 4
+        assert list(findings.checks_status) == checks_to_execute
+        assert list(findings.services) == ["accessanalyzer", "ec2", "iam"]
+        assert sorted(loaded_checks) == checks_to_execute
+        assert audit_info.audit_metadata.completed_checks == 4
+        assert audit_info.audit_metadata.services_scanned == 3
+        assert audit_info.audit_metadata.audit_progress == 100
+
+    def test_execute_checks_in_parallel_check_error(self):
+        checks_to_execute = ["ec2_ami_public", "ec2_ebs_default_encryption"]
+
+        def mock_load_check(service, check_name, provider):
+            check = mock.MagicMock()
+            check.CheckID = check_name
+            if check_name == "ec2_ami_public":
+                check.execute.side_effect = Exception("Check failed")
+            else:
+                check.execute.return_value = [mock_finding(check_name, service)]
+            return check
+
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = mock.MagicMock()
+        audit_output_options.only_logs = True
+        audit_output_options.verbose = False
+        with mock.patch(
+            "prowler.lib.check.check.load_check", new=mock_load_check
+        ), mock.patch("prowler.lib.check.check.report"):
+            findings = execute_checks(
+                checks_to_execute, "aws", audit_info, audit_output_options, 2
+            )
+
+        assert list(findings.checks_status) == ["ec2_ebs_default_encryption"]
+        assert audit_info.audit_metadata.completed_checks == 2
+
+    def test_execute_checks_in_parallel_check_exit(self):
+        checks_to_execute = ["ec2_ami_public", "ec2_ebs_default_encryption"]
+
+        def mock_load_check(service, check_name, provider):
+            # Some service clients exit if they cannot be built
+            if check_name == "ec2_ami_public":
+                sys.exit(1)
+            check = mock.MagicMock()
+            check.CheckID = check_name
+            check.execute.return_value = [mock_finding(check_name, service)]
+            return check
+
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = mock.MagicMock()
+        audit_output_options.only_logs = True
+        audit_output_options.verbose = False
+        with mock.patch(
+            "prowler.lib.check.check.load_check", new=mock_load_check
+        ), mock.patch("prowler.lib.check.check.report"):
+            # The scan exits as in the sequential execution, instead of waiting forever
+            with pytest.raises(SystemExit):
+                execute_checks(
+                    checks_to_execute, "aws", audit_info, audit_output_options, 2
+                )
+
+    def test_recover_service_clients_from_checks(self):
+        checks_to_execute = [
+            "ec2_ami_public",
+            "ec2_ebs_default_encryption",
+            "iam_password_policy_minimum_length_14",
+            "vpc_peering_routing_tables_with_least_privilege",
+            "nonexistent_check",
+        ]
+        assert recover_service_clients_from_checks(checks_to_execute, "aws") == [
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.iam.iam_client",
+            "prowler.providers.aws.services.vpc.vpc_client",
+        ]
+
+    def test_recover_client_attributes_from_check(self):
+        assert recover_client_attributes_from_check(
+            "ec2_ebs_default_encryption", "aws"
+        ) == {"ec2_client": {"ebs_encryption_by_default"}}
+        assert recover_client_attributes_from_check(
+            "vpc_peering_routing_tables_with_least_privilege", "aws"
+        ) == {"vpc_client": {"vpc_peering_connections"}}
+        assert recover_client_attributes_from_check("nonexistent_check", "aws") is None
+
+    def test_is_time_dependent_check(self):
+        assert is_time_dependent_check("ec2_instance_older_than_specific_days", "aws")
+        assert not is_time_dependent_check("ec2_ebs_default_encryption", "aws")
+        assert is_time_dependent_check("nonexistent_check", "aws")
+
+    def test_execute_check_incremental(self, tmp_path):
+        from prowler.providers.aws.services.ec2.ec2_service import (
+            EbsEncryptionByDefault,
+        )
+
+        ec2_client = mock.MagicMock()
+        ec2_client.ebs_encryption_by_default = [
+            EbsEncryptionByDefault(status=True, region=AWS_REGION)
+        ]
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=self.set_mocked_audit_info(),
+        ), mock.patch(
+            "prowler.providers.aws.services.ec2.ec2_ebs_default_encryption.ec2_ebs_default_encryption.ec2_client",
+            new=ec2_client,
+        ):
+            from prowler.providers.aws.services.ec2.ec2_ebs_default_encryption.ec2_ebs_default_encryption import (
+                ec2_ebs_default_encryption,
+            )
+
+            check = ec2_ebs_default_encryption()
+            first_scan = Incremental_Scan()
+            first_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+            with mock.patch("prowler.lib.check.check.incremental_scan", new=first_scan):
+                findings = execute_check(check)
+            assert findings[0].status == "PASS"
+            assert first_scan.evaluated_checks == 1
+            first_scan.write()
+
+            # The resources did not change, so the check is not executed
+            second_scan = Incremental_Scan()
+            second_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+            with mock.patch(
+                "prowler.lib.check.check.incremental_scan", new=second_scan
+            ), mock.patch.object(ec2_ebs_default_encryption, "execute") as execute:
+                reused_findings = execute_check(check)
+            execute.assert_not_called()
+            assert second_scan.reused_checks == 1
+            assert isinstance(reused_findings[0], Check_Report_AWS)
+            assert reused_findings[0].status == "PASS"
+            assert reused_findings[0].region == AWS_REGION
+            assert reused_findings[0].check_metadata is check.metadata()
+            second_scan.write()
+
+            # The resources changed, so the check is executed again
+            ec2_client.ebs_encryption_by_default[0].status = False
+            third_scan = Incremental_Scan()
+            third_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+            with mock.patch("prowler.lib.check.check.incremental_scan", new=third_scan):
+                findings = execute_check(check)
+            assert findings[0].status == "FAIL"
+            assert third_scan.evaluated_checks == 1
+
+    def test_prefetch_service_clients(self):
+        service_clients = [
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.iam.iam_client",
+        ]
+        imported_modules = []
+
+        def mock_import_module(module):
+            if module.endswith("iam_client"):
+                raise Exception("Service failed")
+            imported_modules.append(module)
+
+        with mock.patch(
+            "prowler.lib.check.check.recover_service_clients_from_checks",
+            return_value=service_clients,
+        ), mock.patch(
+            "prowler.lib.check.check.importlib.import_module", new=mock_import_module
+        ):
+            # Errors building a service client must not stop the execution
+            prefetch_service_clients(["ec2_ami_public"], "aws", 2)
+
+        assert imported_modules == ["prowler.providers.aws.services.ec2.ec2_client"]
+
+    def test_execute_checks_profiling(self):
+        checks_to_execute = ["ec2_ami_public", "ec2_ebs_default_encryption"]
+
+        def mock_load_check(service, check_name, provider):
+            check = mock.MagicMock()
+            check.CheckID = check_name
+            check.execute.return_value = [mock_finding(check_name, service)]
+            return check
+
+        profiler = Scan_Profiler()
+        profiler.enable()
+        audit_info = self.set_mocked_audit_info()
+        audit_output_options = mock.MagicMock()
+        audit_output_options.only_logs = True
+        audit_output_options.verbose = False
+        with mock.patch(
+            "prowler.lib.check.check.scan_profiler", new=profiler
+        ), mock.patch(
+            "prowler.lib.check.check.load_check", new=mock_load_check
+        ), mock.patch(
+            "prowler.lib.check.check.report"
+        ), mock.patch(
+            "prowler.lib.check.check.prefetch_service_clients"
+        ) as prefetch_service_clients:
+            execute_checks(checks_to_execute, "aws", audit_info, audit_output_options)
+
+        # The service clients are built one by one to measure each of them
+        prefetch_service_clients.assert_called_once_with(checks_to_execute, "aws", 1)
+        assert (
+            sorted(check["name"] for check in profiler.generate_report()["checks"])
+            == checks_to_execute
+        )
+
+    def test_check_shared_metadata(self):
+        class test_check(Check):
+            def execute(self):
+                return [Check_Report_AWS(self.metadata())]
+
+        metadata_file = (
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        )
+        check_metadata = load_check_metadata(metadata_file)
+        # The check's metadata file is next to its module
+        register_check_metadata(
+            f"{os.path.realpath(__file__)[:-3]}.metadata.json", check_metadata
+        )
+        try:
+            check = test_check()
+            findings = check.execute() + check.execute()
+        finally:
+            checks_metadata.clear()
+
+        assert check.CheckID == check_metadata.CheckID
+        # Every finding references the same metadata
+        assert check.metadata() is check_metadata
+        assert all(finding.check_metadata is check_metadata for finding in findings)
+
+    def test_check_report_from_json_metadata(self):
+        metadata_file = (
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        )
+        check_metadata = load_check_metadata(metadata_file)
+        finding = Check_Report_AWS(check_metadata.json())
+        assert finding.check_metadata == check_metadata
+        assert finding.check_metadata is not check_metadata
@@ -0,0 +1,70 @@
+import os
+from unittest import mock
+
+from prowler.lib.check.check import (
+    discover_checks_from_provider,
+    generate_checks_manifest,
+    get_checks_manifest,
+    recover_checks_from_provider,
+)
+from prowler.lib.check.checks_manifest import (
+    generate_checks_fingerprint,
+    load_checks_manifest,
+    write_checks_manifest,
+)
+from prowler.lib.check.models import load_check_metadata
+
+
+class Test_Checks_Manifest:
+    def test_generate_checks_fingerprint(self):
+        assert generate_checks_fingerprint("aws") == generate_checks_fingerprint("aws")
+        assert generate_checks_fingerprint("aws") != generate_checks_fingerprint(
+            "azure"
+        )
+
+    def test_checks_manifest(self, tmp_path):
+        fingerprint = generate_checks_fingerprint("aws")
+        checks_manifest = generate_checks_manifest("aws", fingerprint)
+        check = checks_manifest["checks"]["ec2_ami_public"]
+        assert check["service"] == "ec2"
+        assert check["path"].endswith("services/ec2/ec2_ami_public")
+
+        write_checks_manifest("aws", checks_manifest, str(tmp_path))
+        assert os.listdir(tmp_path) == ["aws.json"]
+        stored_manifest = load_checks_manifest("aws", fingerprint, str(tmp_path))
+        assert stored_manifest["checks"].keys() == checks_manifest["checks"].keys()
+        # The stored metadata is the validated one
+        assert stored_manifest["checks"]["ec2_ami_public"][
+            "metadata"
+        ] == load_check_metadata(f"{check['path']}/ec2_ami_public.metadata.json")
+        assert (
+            stored_manifest["checks"]["ec2_ami_public"]["metadata"].Remediation.Code.CLI
+            == check["metadata"].Remediation.Code.CLI
+        )
+
+        # The manifest is outdated if the checks are modified
+        assert not load_checks_manifest("aws", "modified", str(tmp_path))
+        assert not load_checks_manifest("azure", fingerprint, str(tmp_path))
+
+    def test_recover_checks_from_provider(self, tmp_path):
+        with mock.patch(
+            "prowler.lib.check.check.load_checks_manifest",
+            new=lambda provider, fingerprint: load_checks_manifest(
+                provider, fingerprint, str(tmp_path)
+            ),
+        ), mock.patch(
+            "prowler.lib.check.check.write_checks_manifest",
+            new=lambda provider, manifest: write_checks_manifest(
+                provider, manifest, str(tmp_path)
+            ),
+        ), mock.patch(
+            "prowler.lib.check.check.checks_manifests", new={}
+        ):
+            assert get_checks_manifest("aws")["fingerprint"]
+            assert os.listdir(tmp_path) == ["aws.json"]
+            assert recover_checks_from_provider("aws") == discover_checks_from_provider(
+                "aws"
+            )
+            assert recover_checks_from_provider(
+                "aws", "iam"
+            ) == discover_checks_from_provider("aws", "iam")
@@ -0,0 +1,105 @@
+from prowler.lib.check.compliance import (
+    index_compliance_frameworks,
+    update_checks_metadata_with_compliance,
+)
+from prowler.lib.check.compliance_models import (
+    Compliance_Base_Model,
+    Compliance_Requirement,
+)
+from prowler.lib.check.models import Check_Metadata_Model
+
+
+def mock_compliance_framework(framework: str, requirements: dict):
+    return Compliance_Base_Model(
+        Framework=framework,
+        Provider="AWS",
+        Version="1.0",
+        Description=f"{framework} framework",
+        Requirements=[
+            Compliance_Requirement(
+                Id=requirement_id,
+                Description=f"Requirement {requirement_id}",
+                Attributes=[],
+                Checks=checks,
+            )
+            for requirement_id, checks in requirements.items()
+        ],
+    )
+
+
+def mock_check_metadata(check_id: str):
+    return Check_Metadata_Model(
+        Provider="aws",
+        CheckID=check_id,
+        CheckTitle=check_id,
+        CheckType=[],
+        ServiceName="ec2",
+        SubServiceName="",
+        ResourceIdTemplate="",
+        Severity="low",
+        ResourceType="",
+        Description="",
+        Risk="",
+        RelatedUrl="",
+        Remediation={
+            "Code": {"CLI": "", "NativeIaC": "", "Other": "", "Terraform": ""},
+            "Recommendation": {"Text": "", "Url": ""},
+        },
+        Categories=[],
+        DependsOn=[],
+        RelatedTo=[],
+        Notes="",
+    )
+
+
+bulk_compliance_frameworks = {
+    "framework_a_aws": mock_compliance_framework(
+        "A",
+        {
+            "1.1": ["ec2_ami_public", "ec2_ami_public", "iam_no_root_access_key"],
+            "1.2": [],
+        },
+    ),
+    "framework_b_aws": mock_compliance_framework("B", {"2.1": ["ec2_ami_public"]}),
+}
+
+
+class Test_Compliance:
+    def test_index_compliance_frameworks(self):
+        compliance_index = index_compliance_frameworks(bulk_compliance_frameworks)
+
+        assert [
+            (compliance.Framework, compliance.Requirements[0].Id)
+            for compliance in compliance_index["ec2_ami_public"]
+        ] == [("A", "1.1"), ("B", "2.1")]
+        # The compliance is shared by the checks of the requirement
+        assert (
+            compliance_index["iam_no_root_access_key"][0]
+            is compliance_index["ec2_ami_public"][0]
+        )
+        assert (
+            "Checks" not in compliance_index["ec2_ami_public"][0].Requirements[0].dict()
+        )
+        # Manual requirements
+        assert [
+            compliance.Requirements[0].Id for compliance in compliance_index[None]
+        ] == ["1.2"]
+
+    def test_update_checks_metadata_with_compliance(self):
+        bulk_checks_metadata = {
+            "ec2_ami_public": mock_check_metadata("ec2_ami_public"),
+            "iam_no_root_access_key": mock_check_metadata("iam_no_root_access_key"),
+            "s3_bucket_public_access": mock_check_metadata("s3_bucket_public_access"),
+        }
+        update_checks_metadata_with_compliance(
+            bulk_compliance_frameworks, bulk_checks_metadata
+        )
+
+        assert len(bulk_checks_metadata["ec2_ami_public"].Compliance) == 2
+        assert len(bulk_checks_metadata["iam_no_root_access_key"].Compliance) == 1
+        # The manual requirements are not included in the last check
+        assert bulk_checks_metadata["s3_bucket_public_access"].Compliance == []
+        manual_check_compliance = bulk_checks_metadata["manual_check"].Compliance
+        assert len(manual_check_compliance) == 1
+        assert manual_check_compliance[0].Framework == "A"
+        assert manual_check_compliance[0].Requirements[0].Id == "1.2"
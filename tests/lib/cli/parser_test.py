@@ -1,8 +1,11 @@
 import uuid
+from unittest import mock
 
 import pytest
 
+from prowler.config.config import default_parallel_checks, default_prefetch_services
 from prowler.lib.cli.parser import ProwlerArgumentParser
+from prowler.providers.aws.lib.api_cache.api_cache import default_api_cache_directory
 
 prowler_command = "prowler"
 
@@ -50,6 +53,9 @@ class Test_Parser:
         assert not parsed.external_id
         assert not parsed.region
         assert not parsed.organizations_role
+        assert not parsed.scan_organization
+        assert not parsed.parallel_accounts
+        assert not parsed.merge_outputs
         assert not parsed.security_hub
         assert not parsed.quick_inventory
         assert not parsed.output_bucket
@@ -220,6 +226,24 @@ class Test_Parser:
         assert len(parsed.output_modes) == 1
         assert "csv" in parsed.output_modes
 
+    def test_root_parser_output_modes_parquet(self):
+        command = [prowler_command, "-M", "csv", "parquet"]
+        with mock.patch(
+            "prowler.lib.cli.parser.is_parquet_available", return_value=True
+        ):
+            parsed = self.parser.parse(command)
+        assert parsed.output_modes == ["csv", "parquet"]
+
+    def test_root_parser_output_modes_parquet_without_pyarrow(self, capsys):
+        command = [prowler_command, "-M", "parquet"]
+        with mock.patch(
+            "prowler.lib.cli.parser.is_parquet_available", return_value=False
+        ), pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert "requires pyarrow" in capsys.readouterr().err
+
     def test_root_parser_output_filename_short(self):
         filename = "test_output.txt"
         command = [prowler_command, "-F", filename]
@@ -789,6 +813,40 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.organizations_role == organizations_role
 
+    def test_aws_parser_scan_organization(self):
+        command = [
+            prowler_command,
+            "--scan-organization",
+            "ProwlerRole",
+            "--parallel-accounts",
+            "8",
+            "--merge-outputs",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.scan_organization == "ProwlerRole"
+        assert parsed.parallel_accounts == 8
+        assert parsed.merge_outputs
+
+    def test_aws_parser_scan_organization_with_role(self):
+        command = [
+            prowler_command,
+            "--scan-organization",
+            "ProwlerRole",
+            "-R",
+            "arn:aws:iam::123456789012:role/ProwlerRole",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_parallel_accounts_without_scan_organization(self):
+        command = [prowler_command, "--parallel-accounts", "8"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_aws_parser_security_hub_short(self):
         argument = "-S"
         command = [prowler_command, argument]
@@ -910,6 +968,102 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_aws_max_workers(self):
+        command = [
+            prowler_command,
+            "--aws-max-workers",
+            "64",
+            "--aws-max-workers-per-region",
+            "20",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_max_workers == 64
+        assert parsed.aws_max_workers_per_region == 20
+
+    def test_aws_parser_no_aws_rate_limiter(self):
+        command = [prowler_command, "--no-aws-rate-limiter"]
+        parsed = self.parser.parse(command)
+        assert parsed.no_aws_rate_limiter
+
+    def test_aws_parser_aws_max_workers_invalid(self):
+        command = [prowler_command, "--aws-max-workers-per-region", "0"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_aws_parser_api_cache(self):
+        command = [prowler_command, "--api-cache"]
+        parsed = self.parser.parse(command)
+        assert parsed.api_cache == default_api_cache_directory
+        assert not parsed.api_cache_ttl
+        assert not parsed.api_cache_replay
+
+    def test_aws_parser_api_cache_directory_replay(self):
+        directory = "/tmp/api_cache"
+        command = [
+            prowler_command,
+            "--api-cache",
+            directory,
+            "--api-cache-ttl",
+            "60",
+            "--api-cache-replay",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.api_cache == directory
+        assert parsed.api_cache_ttl == 60
+        assert parsed.api_cache_replay
+
+    def test_parser_compress_html(self):
+        command = [prowler_command, "--compress-html"]
+        parsed = self.parser.parse(command)
+        assert parsed.compress_html
+
+    def test_parser_profiling(self):
+        command = [prowler_command, "--profiling"]
+        parsed = self.parser.parse(command)
+        assert parsed.profiling
+
+    def test_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        workers = "8"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == int(workers)
+
+    def test_parser_parallel_checks_default(self):
+        command = [prowler_command, "--parallel-checks"]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == default_parallel_checks
+
+    def test_parser_parallel_checks_invalid(self):
+        argument = "--parallel-checks"
+        command = [prowler_command, argument, "0"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_parser_prefetch_services(self):
+        argument = "--prefetch-services"
+        workers = "4"
+        command = [prowler_command, argument, workers]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_services == int(workers)
+
+    def test_parser_prefetch_services_default(self):
+        command = [prowler_command, "--prefetch-services"]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_services == default_prefetch_services
+
+    def test_parser_prefetch_services_invalid(self):
+        argument = "--prefetch-services"
+        command = [prowler_command, argument, "0"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_parser_azure_auth_sp(self):
         argument = "--sp-env-auth"
         command = [prowler_command, "azure", argument]
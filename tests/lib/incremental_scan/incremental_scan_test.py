@@ -0,0 +1,154 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from mock import MagicMock
+from pydantic import BaseModel
+
+from prowler.lib.incremental_scan.incremental_scan import (
+    Incremental_Scan,
+    fingerprint,
+    fingerprint_resources,
+    get_audit_identity,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+
+class Bucket(BaseModel):
+    arn: str
+    name: str
+    region: str
+    tags: set = set()
+
+
+@dataclass
+class Trail:
+    name: str
+    region: str
+    latest_delivery: datetime
+
+
+class Test_Incremental_Scan:
+    def test_fingerprint(self):
+        assert fingerprint({"tags": {"b", "a"}}) == fingerprint({"tags": {"a", "b"}})
+        assert fingerprint(
+            Trail("trail", "eu-west-1", datetime(2023, 1, 1))
+        ) != fingerprint(Trail("trail", "eu-west-1", datetime(2023, 1, 2)))
+
+    def test_fingerprint_resources(self):
+        buckets = [
+            Bucket(arn="arn:aws:s3:::bucket-1", name="bucket-1", region="eu-west-1"),
+            Bucket(arn="arn:aws:s3:::bucket-2", name="bucket-2", region="eu-west-1"),
+        ]
+        resources_fingerprints = fingerprint_resources(buckets)
+        assert list(resources_fingerprints) == [
+            "arn:aws:s3:::bucket-1",
+            "arn:aws:s3:::bucket-2",
+        ]
+        # Resources without an identifier are keyed by their position
+        trails = [
+            Trail("trail", "eu-west-1", datetime(2023, 1, 1)),
+            Trail("trail", "us-east-1", datetime(2023, 1, 1)),
+        ]
+        assert list(fingerprint_resources(trails)) == ["trail", "trail#1"]
+        assert list(fingerprint_resources({"eu-west-1": True})) == ["eu-west-1"]
+        assert list(fingerprint_resources(None)) == [""]
+
+    def test_get_audit_identity(self):
+        audit_info = MagicMock()
+        audit_info.audited_account = AWS_ACCOUNT_NUMBER
+        assert get_audit_identity("aws", audit_info) == AWS_ACCOUNT_NUMBER
+        audit_info.identity.tenant_ids = ["tenant-1", "tenant-2"]
+        assert get_audit_identity("azure", audit_info) == "tenant-1-tenant-2"
+        audit_info.project_id = "project"
+        assert get_audit_identity("gcp", audit_info) == "project"
+
+    def test_get_check_fingerprint(self, tmp_path):
+        check_file = tmp_path / "check.py"
+        check_file.write_text("")
+        s3_client = MagicMock()
+        s3_client.buckets = [
+            Bucket(arn="arn:aws:s3:::bucket-1", name="bucket-1", region="eu-west-1")
+        ]
+        incremental_scan = Incremental_Scan()
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        check_fingerprint = incremental_scan.get_check_fingerprint(
+            str(check_file), {"s3_client": (s3_client, {"buckets"})}
+        )
+        assert check_fingerprint
+        # The attributes are fingerprinted once per scan
+        assert list(incremental_scan.state["resources"]) == ["s3_client.buckets"]
+        assert check_fingerprint == incremental_scan.get_check_fingerprint(
+            str(check_file), {"s3_client": (s3_client, {"buckets"})}
+        )
+        # The methods cannot be fingerprinted
+        assert not incremental_scan.get_check_fingerprint(
+            str(check_file), {"s3_client": (s3_client, {"__get_session__"})}
+        )
+
+    def test_resource_detail(self, tmp_path):
+        incremental_scan = Incremental_Scan()
+        # Nothing is stored if it is not enabled
+        incremental_scan.set_resource_detail("iam", "policy:v1", {"Statement": []})
+        assert incremental_scan.get_resource_detail("iam", "policy:v1") is None
+
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        incremental_scan.set_resource_detail("iam", "policy:v1", {"Statement": []})
+        incremental_scan.set_resource_detail("iam", "deleted:v1", {"Statement": []})
+        incremental_scan.set_resource_detail("ec2", "not-read", {})
+        incremental_scan.write()
+
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        assert incremental_scan.get_resource_detail("iam", "policy:v1") == {
+            "Statement": []
+        }
+        incremental_scan.write()
+        # Only the details used by the last scan are kept
+        with open(f"{tmp_path}/aws-{AWS_ACCOUNT_NUMBER}.json") as f:
+            assert json.load(f)["details"] == {"iam": {"policy:v1": {"Statement": []}}}
+
+    def test_write_resources_changes(self, tmp_path):
+        check_file = tmp_path / "check.py"
+        check_file.write_text("")
+        s3_client = MagicMock()
+        s3_client.buckets = [
+            Bucket(arn="arn:aws:s3:::bucket-1", name="bucket-1", region="eu-west-1"),
+            Bucket(arn="arn:aws:s3:::bucket-2", name="bucket-2", region="eu-west-1"),
+        ]
+        incremental_scan = Incremental_Scan()
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        incremental_scan.get_check_fingerprint(
+            str(check_file), {"s3_client": (s3_client, {"buckets"})}
+        )
+        assert incremental_scan.write() == {"new": 2, "changed": 0, "deleted": 0}
+
+        s3_client.buckets = [
+            Bucket(
+                arn="arn:aws:s3:::bucket-1",
+                name="bucket-1",
+                region="eu-west-1",
+                tags={"changed"},
+            ),
+            Bucket(arn="arn:aws:s3:::bucket-3", name="bucket-3", region="eu-west-1"),
+        ]
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        incremental_scan.get_check_fingerprint(
+            str(check_file), {"s3_client": (s3_client, {"buckets"})}
+        )
+        assert incremental_scan.write() == {"new": 1, "changed": 1, "deleted": 1}
+
+    def test_outdated_state(self, tmp_path):
+        with open(f"{tmp_path}/aws-{AWS_ACCOUNT_NUMBER}.json", "w") as f:
+            json.dump(
+                {
+                    "fingerprint": "outdated",
+                    "resources": {},
+                    "checks": {"check": {}},
+                    "details": {},
+                },
+                f,
+            )
+        incremental_scan = Incremental_Scan()
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        assert not incremental_scan.previous_state["checks"]
@@ -0,0 +1,297 @@
+import csv
+import io
+from os import path
+from unittest import mock
+
+from prowler.lib.check.compliance_models import (
+    CIS_Requirements,
+    Compliance_Base_Model,
+    Compliance_Requirement,
+    ENS_Requirements,
+    Generic_Compliance_Requirements,
+)
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
+from prowler.lib.outputs.compliance import (
+    Compliance_Aggregator,
+    Compliance_Output,
+    display_compliance_table,
+    get_compliance_output_mode,
+)
+from prowler.lib.outputs.models import Check_Output_CSV_ENS_RD2022
+from prowler.lib.outputs.outputs import Findings_Aggregator
+
+AWS_ACCOUNT_ID = "123456789012"
+
+
+def generate_check_metadata(check_id: str, compliance: list):
+    check_metadata = load_check_metadata(
+        f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+    )
+    check_metadata.CheckID = check_id
+    check_metadata.Compliance = compliance
+    return check_metadata
+
+
+def generate_cis_compliance(version: str, requirement_id: str, checks: list):
+    return Compliance_Base_Model(
+        Framework="CIS",
+        Provider="AWS",
+        Version=version,
+        Description=f"CIS {version}",
+        Requirements=[
+            Compliance_Requirement(
+                Checks=checks,
+                Id=requirement_id,
+                Description=f"Requirement {requirement_id}",
+                Attributes=[
+                    CIS_Requirements(
+                        Section="1. Identity and Access Management",
+                        Profile="Level 1",
+                        AssessmentStatus="Automated",
+                        Description="Description",
+                        RationaleStatement="Rationale",
+                        ImpactStatement="",
+                        RemediationProcedure="Remediation",
+                        AuditProcedure="Audit",
+                        AdditionalInformation="",
+                        References="https://docs.aws.amazon.com",
+                    )
+                ],
+            )
+        ],
+    )
+
+
+class Test_Compliance_Output:
+    def test_get_compliance_output_mode(self):
+        assert (
+            get_compliance_output_mode(generate_cis_compliance("1.5", "1.1", []))
+            == "cis_1.5_aws"
+        )
+        compliance = mock.MagicMock(
+            Framework="AWS-Foundational-Security-Best-Practices",
+            Version="",
+            Provider="AWS",
+        )
+        assert (
+            get_compliance_output_mode(compliance)
+            == "aws_foundational_security_best_practices_aws"
+        )
+
+    def test_compliance_output(self):
+        ens_compliance = Compliance_Base_Model(
+            Framework="ENS",
+            Provider="AWS",
+            Version="RD2022",
+            Description="ENS",
+            Requirements=[
+                Compliance_Requirement(
+                    Checks=["iam_disable_30_days_credentials"],
+                    Id="op.acc.1.aws.iam.2",
+                    Description="Identificación",
+                    Attributes=[
+                        ENS_Requirements(
+                            IdGrupoControl="op.acc.1",
+                            Marco="operacional",
+                            Categoria="control de acceso",
+                            DescripcionControl="Descripción",
+                            Nivel="alto",
+                            Tipo="requisito",
+                            Dimensiones=["trazabilidad", "autenticidad"],
+                        )
+                    ],
+                )
+            ],
+        )
+        soc2_compliance = Compliance_Base_Model(
+            Framework="SOC2",
+            Provider="AWS",
+            Version="",
+            Description="SOC2",
+            Requirements=[
+                Compliance_Requirement(
+                    Checks=["iam_disable_30_days_credentials"],
+                    Id="cc_6_1",
+                    Description="CC6.1",
+                    Attributes=[
+                        Generic_Compliance_Requirements(ItemId="cc_6_1", Service="iam"),
+                        Generic_Compliance_Requirements(ItemId="cc_6_1", Service="s3"),
+                    ],
+                )
+            ],
+        )
+        bulk_checks_metadata = {
+            "iam_disable_30_days_credentials": generate_check_metadata(
+                "iam_disable_30_days_credentials",
+                [
+                    generate_cis_compliance(
+                        "1.5", "1.12", ["iam_disable_30_days_credentials"]
+                    ),
+                    # CIS 1.4 is not selected
+                    generate_cis_compliance(
+                        "1.4", "1.12", ["iam_disable_30_days_credentials"]
+                    ),
+                    ens_compliance,
+                    soc2_compliance,
+                ],
+            ),
+            "manual_check": generate_check_metadata(
+                "manual_check", [generate_cis_compliance("1.5", "1.1", [])]
+            ),
+        }
+        audit_info = mock.MagicMock()
+        audit_info.audited_account = AWS_ACCOUNT_ID
+        file_descriptors = {
+            "cis_1.5_aws": io.StringIO(),
+            "ens_rd2022_aws": io.StringIO(),
+            "soc2_aws": io.StringIO(),
+            "csv": io.StringIO(),
+        }
+        compliance_output = Compliance_Output(
+            bulk_checks_metadata, audit_info, file_descriptors
+        )
+
+        # The manual controls are not written until a finding is reported
+        assert not file_descriptors["cis_1.5_aws"].getvalue()
+
+        for index in range(2):
+            finding = Check_Report_AWS(
+                bulk_checks_metadata["iam_disable_30_days_credentials"].json()
+            )
+            finding.region = "eu-west-1"
+            finding.status = "FAIL"
+            finding.status_extended = f"User user-{index}; has unused credentials"
+            finding.resource_id = f"user-{index}"
+            compliance_output.write(finding)
+
+        cis_rows = list(
+            csv.reader(
+                io.StringIO(file_descriptors["cis_1.5_aws"].getvalue()), delimiter=";"
+            )
+        )
+        # The manual controls are written once, after the first finding
+        assert len(cis_rows) == 3
+        assert cis_rows[1][5] == "1.1"
+        assert cis_rows[1][-4:] == [
+            "INFO",
+            "Manual check",
+            "manual_check",
+            "manual_check",
+        ]
+        assert "manual_check" not in compliance_output.templates
+        assert cis_rows[2][:7] == [
+            "aws",
+            "CIS 1.5",
+            AWS_ACCOUNT_ID,
+            "eu-west-1",
+            cis_rows[0][4],
+            "1.12",
+            "Requirement 1.12",
+        ]
+        assert cis_rows[2][-4:] == [
+            "FAIL",
+            "User user-1; has unused credentials",
+            "user-1",
+            "iam_disable_30_days_credentials",
+        ]
+
+        ens_rows = list(
+            csv.DictReader(
+                io.StringIO(file_descriptors["ens_rd2022_aws"].getvalue()),
+                fieldnames=list(Check_Output_CSV_ENS_RD2022.__fields__),
+                delimiter=";",
+            )
+        )
+        assert len(ens_rows) == 2
+        assert ens_rows[0]["Requirements_Attributes_Nivel"] == "alto"
+        assert (
+            ens_rows[0]["Requirements_Attributes_Dimensiones"]
+            == "trazabilidad,autenticidad"
+        )
+        assert ens_rows[0]["ResourceId"] == "user-0"
+
+        # A row per attribute of the requirement
+        soc2_rows = list(
+            csv.reader(
+                io.StringIO(file_descriptors["soc2_aws"].getvalue()), delimiter=";"
+            )
+        )
+        assert [row[10] for row in soc2_rows] == ["iam", "s3", "iam", "s3"]
+        assert not file_descriptors["csv"].getvalue()
+
+
+class Test_Compliance_Aggregator:
+    def test_compliance_aggregator(self, tmp_path, capsys):
+        cis_compliance = generate_cis_compliance(
+            "1.5",
+            "1.12",
+            ["iam_disable_30_days_credentials", "iam_no_root_access_key"],
+        )
+        bulk_checks_metadata = {
+            "iam_disable_30_days_credentials": generate_check_metadata(
+                "iam_disable_30_days_credentials",
+                [
+                    cis_compliance,
+                    # CIS 1.4 is not selected
+                    generate_cis_compliance(
+                        "1.4", "1.12", ["iam_disable_30_days_credentials"]
+                    ),
+                ],
+            ),
+            "iam_no_root_access_key": generate_check_metadata(
+                "iam_no_root_access_key", [cis_compliance]
+            ),
+            "iam_password_policy": generate_check_metadata(
+                "iam_password_policy",
+                [generate_cis_compliance("1.5", "1.8", ["iam_password_policy"])],
+            ),
+        }
+        findings_aggregator = Findings_Aggregator(
+            Compliance_Aggregator(bulk_checks_metadata, ["cis_1.5_aws"])
+        )
+        for check_id, statuses in (
+            ("iam_disable_30_days_credentials", ["FAIL", "PASS"]),
+            ("iam_no_root_access_key", ["PASS"]),
+            ("iam_password_policy", ["INFO"]),
+        ):
+            findings = []
+            for index, status in enumerate(statuses):
+                finding = Check_Report_AWS(bulk_checks_metadata[check_id].json())
+                finding.region = "eu-west-1"
+                finding.status = status
+                finding.resource_id = f"{check_id}-{index}"
+                findings.append(finding)
+            findings_aggregator.add(findings)
+
+        compliance_aggregator = findings_aggregator.compliance_aggregator
+        assert list(compliance_aggregator.requirements) == ["cis_1.5_aws"]
+        # The requirement shared by both checks is counted once
+        requirements = compliance_aggregator.requirements["cis_1.5_aws"]
+        assert [
+            (
+                requirement_status.requirement.Id,
+                requirement_status.passed,
+                requirement_status.failed,
+                requirement_status.total,
+            )
+            for requirement_status in requirements
+        ] == [("1.12", 2, 1, 3), ("1.8", 0, 0, 1)]
+
+        summary_files = compliance_aggregator.write_summaries(
+            "prowler-output", str(tmp_path), AWS_ACCOUNT_ID
+        )
+        assert summary_files == [f"{tmp_path}/prowler-output_cis_1.5_aws_summary.csv"]
+        with open(summary_files[0]) as summary_file:
+            summary_rows = list(csv.reader(summary_file, delimiter=";"))
+        assert summary_rows[0][:3] == ["PROVIDER", "FRAMEWORK", "VERSION"]
+        assert [row[5:] for row in summary_rows[1:]] == [
+            ["1.12", "Requirement 1.12", "FAIL", "2", "1", "3"],
+            ["1.8", "Requirement 1.8", "INFO", "0", "0", "1"],
+        ]
+
+        display_compliance_table(
+            compliance_aggregator, "cis_1.5_aws", "prowler-output", str(tmp_path)
+        )
+        output = capsys.readouterr().out
+        assert "CIS-1.5" in output
+        assert "prowler-output_cis_1.5_aws_summary.csv" in output
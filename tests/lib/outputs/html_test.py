@@ -0,0 +1,132 @@
+import base64
+import gzip
+import hashlib
+import json
+from os import path
+from unittest import mock
+
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
+from prowler.lib.outputs.html import (
+    HTML_Writer,
+    add_html_footer,
+    html_compressed_line_size,
+)
+from prowler.lib.utils.utils import open_file
+
+
+def generate_finding(resource_id: str, status: str) -> Check_Report_AWS:
+    finding = Check_Report_AWS(
+        load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+    )
+    finding.resource_id = resource_id
+    finding.resource_arn = "test-arn"
+    finding.resource_tags = [{"Key": "Name", "Value": "test"}]
+    finding.region = "eu-west-1"
+    finding.status = status
+    finding.status_extended = "</script><b>This is a test</b>"
+    return finding
+
+
+def read_findings_data(filename: str) -> tuple:
+    with open(filename) as html_file:
+        opening_tag, data = html_file.read().split("\n", 1)
+    return opening_tag, data.removesuffix("</script>\n")
+
+
+class Test_HTML:
+    def test_html_writer(self, tmp_path):
+        filename = f"{tmp_path}/prowler-output.html"
+        output_options = mock.MagicMock()
+        output_options.bulk_checks_metadata = {}
+        html_writer = HTML_Writer(open_file(filename, "a"))
+        html_writer.write_finding(
+            generate_finding("resource-1", "PASS"), output_options
+        )
+        html_writer.write_finding(
+            generate_finding("resource-2", "FAIL"), output_options
+        )
+        html_writer.close()
+
+        assert html_writer.closed
+        opening_tag, data = read_findings_data(filename)
+        assert 'data-compressed="false"' in opening_tag
+        # The findings cannot close the script element
+        assert "</script>" not in data
+        # The metadata of the check is written once
+        check, *findings = [json.loads(line) for line in data.splitlines()]
+        assert check[0] == "check"
+        assert check[1] == "iam_disable_30_days_credentials"
+        assert findings == [
+            [
+                0,
+                "PASS",
+                "eu-west-1",
+                "resource-1",
+                "Name=test",
+                "</script><b>This is a test</b>",
+            ],
+            [
+                0,
+                "FAIL",
+                "eu-west-1",
+                "resource-2",
+                "Name=test",
+                "</script><b>This is a test</b>",
+            ],
+        ]
+
+    def test_html_writer_compressed(self, tmp_path):
+        filename = f"{tmp_path}/prowler-output.html"
+        output_options = mock.MagicMock()
+        output_options.bulk_checks_metadata = {}
+        html_writer = HTML_Writer(open_file(filename, "a"), compressed=True)
+        findings_count = 10000
+        for index in range(findings_count):
+            html_writer.write_finding(
+                generate_finding(
+                    hashlib.sha256(str(index).encode()).hexdigest(), "PASS"
+                ),
+                output_options,
+            )
+        html_writer.close()
+
+        opening_tag, data = read_findings_data(filename)
+        assert 'data-compressed="true"' in opening_tag
+        lines = data.splitlines()
+        # The compressed findings are written while the scan runs, not only when closed
+        assert len(lines) > 1
+        assert all(
+            len(line) == html_compressed_line_size * 4 // 3 for line in lines[:-1]
+        )
+        records = gzip.decompress(base64.b64decode("".join(lines))).splitlines()
+        assert len(records) == findings_count + 1
+        assert (
+            json.loads(records[-1])[3]
+            == hashlib.sha256(str(findings_count - 1).encode()).hexdigest()
+        )
+
+    def test_add_html_footer(self, tmp_path):
+        stats = {
+            "findings_count": 3,
+            "total_pass": 2,
+            "total_fail": 1,
+            "resources_count": 2,
+        }
+        add_html_footer("prowler-output", str(tmp_path), stats)
+        # Nothing is written if the report does not exist
+        assert not path.isfile(f"{tmp_path}/prowler-output.html")
+
+        with open(f"{tmp_path}/prowler-output.html", "w") as html_file:
+            html_file.write("<html>")
+        add_html_footer("prowler-output", str(tmp_path), stats)
+        with open(f"{tmp_path}/prowler-output.html") as html_file:
+            report = html_file.read()
+        assert report.startswith("<html>")
+        assert report.endswith("</html>\n")
+        assert (
+            '<script type="application/json" id="findings-stats">'
+            '{"total-findings": 3, "total-pass": 2, "total-fail": 1, "total-resources": 2}'
+            "</script>"
+        ) in report
@@ -23,9 +23,14 @@ from prowler.lib.check.compliance_models import (
     Compliance_Requirement,
 )
 from prowler.lib.check.models import Check_Report, load_check_metadata
-from prowler.lib.outputs.file_descriptors import fill_file_descriptors
-from prowler.lib.outputs.json import fill_json_asff
+from prowler.lib.outputs.file_descriptors import (
+    close_output_session,
+    fill_file_descriptors,
+    get_output_session,
+)
+from prowler.lib.outputs.json import fill_json_asff, write_ndjson
 from prowler.lib.outputs.models import (
+    Aws_Check_Output_CSV,
     Check_Output_CSV,
     Check_Output_JSON_ASFF,
     Compliance,
@@ -41,13 +46,16 @@ from prowler.lib.outputs.models import (
     unroll_tags,
 )
 from prowler.lib.outputs.outputs import (
+    Findings_Aggregator,
     extract_findings_statistics,
     send_to_s3_bucket,
     set_report_color,
 )
 from prowler.lib.utils.utils import hash_sha512, open_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
-from prowler.providers.aws.lib.security_hub.security_hub import send_to_security_hub
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    Security_Hub_Exporter,
+)
 
 AWS_ACCOUNT_ID = "123456789012"
 
@@ -161,6 +169,90 @@ class Test_Outputs:
                 )
                 remove(expected[index][output_mode].name)
 
+    def test_output_session(self):
+        output_directory = f"{os.path.dirname(os.path.realpath(__file__))}"
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=AWS_ACCOUNT_ID,
+            audited_identity_arn="test-arn",
+            audited_user_id="test",
+            audited_partition="aws",
+            profile="default",
+            profile_region="eu-west-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-2", "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+        )
+        output_options = mock.MagicMock()
+        output_options.output_modes = ["csv", "json"]
+        output_options.output_directory = output_directory
+        output_options.output_filename = "prowler-output-session-test"
+        output_options.output_session = None
+
+        output_session = get_output_session(output_options, audit_info)
+        # The output files are only opened once per scan
+        assert get_output_session(output_options, audit_info) is output_session
+        csv_file = output_session.file_descriptors["csv"]
+        json_file = output_session.file_descriptors["json"]
+        # The findings' CSV rows are written by the same writer for the whole scan
+        assert output_session.csv_writers["csv"].fieldnames == generate_csv_fields(
+            Aws_Check_Output_CSV
+        )
+        json_file.write("{}")
+        close_output_session(output_options)
+
+        assert output_options.output_session is None
+        assert csv_file.closed and json_file.closed
+        with open(json_file.name) as json_output:
+            assert json_output.read() == "[{}"
+        remove(csv_file.name)
+        remove(json_file.name)
+
+    def test_output_session_ndjson(self, tmp_path):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=AWS_ACCOUNT_ID,
+            audited_identity_arn="test-arn",
+            audited_user_id="test",
+            audited_partition="aws",
+            profile="default",
+            profile_region="eu-west-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-2", "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+        )
+        output_options = mock.MagicMock()
+        output_options.output_modes = ["ndjson", "ndjson-asff"]
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output-ndjson-test"
+        output_options.output_session = None
+
+        output_session = get_output_session(output_options, audit_info)
+        ndjson_file = output_session.file_descriptors["ndjson"]
+        assert ndjson_file.name == f"{tmp_path}/prowler-output-ndjson-test.ndjson"
+        assert (
+            output_session.file_descriptors["ndjson-asff"].name
+            == f"{tmp_path}/prowler-output-ndjson-test.asff.ndjson"
+        )
+        write_ndjson(ndjson_file, {"CheckID": "check-1", "Status": "PASS"})
+        write_ndjson(ndjson_file, {"CheckID": "check-2", "Status": "FAIL"})
+        close_output_session(output_options)
+
+        # One compact finding per line, without anything before or after them
+        with open(ndjson_file.name) as ndjson_output:
+            assert ndjson_output.read() == (
+                '{"CheckID":"check-1","Status":"PASS"}\n'
+                '{"CheckID":"check-2","Status":"FAIL"}\n'
+            )
+
     def test_set_report_color(self):
         test_status = ["PASS", "FAIL", "ERROR", "WARNING"]
         test_colors = [Fore.GREEN, Fore.RED, Fore.BLACK, orange_color]
@@ -676,8 +768,60 @@ class Test_Outputs:
         assert stats["resources_count"] == 0
         assert stats["findings_count"] == 0
 
+    def test_findings_aggregator(self):
+        findings = []
+        for check_id, service, severity, status in (
+            ("ec2_ami_public", "ec2", "critical", "FAIL"),
+            ("ec2_ami_public", "ec2", "critical", "PASS"),
+            ("ec2_ebs_default_encryption", "ec2", "medium", "FAIL"),
+            ("iam_support_role_created", "iam", "low", "WARNING"),
+        ):
+            finding = mock.MagicMock()
+            finding.status = status
+            finding.resource_id = f"{check_id}_{status}"
+            finding.check_metadata.CheckID = check_id
+            finding.check_metadata.ServiceName = service
+            finding.check_metadata.Provider = "aws"
+            finding.check_metadata.Severity = severity
+            findings.append(finding)
+
+        findings_aggregator = Findings_Aggregator()
+        findings_aggregator.add(findings[:2])
+        findings_aggregator.add(findings[2:])
+
+        assert len(findings_aggregator) == 4
+        assert extract_findings_statistics(findings_aggregator) == {
+            "total_pass": 1,
+            "total_fail": 2,
+            "resources_count": 4,
+            "findings_count": 3,
+        }
+        assert findings_aggregator.services == {
+            "ec2": {
+                "Provider": "aws",
+                "Total": 3,
+                "Critical": 1,
+                "High": 0,
+                "Medium": 1,
+                "Low": 0,
+            },
+            "iam": {
+                "Provider": "aws",
+                "Total": 1,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+            },
+        }
+        assert findings_aggregator.checks_status == {
+            "ec2_ami_public": {"FAIL": 1, "PASS": 1},
+            "ec2_ebs_default_encryption": {"FAIL": 1},
+            "iam_support_role_created": {"WARNING": 1},
+        }
+
     @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
-    def test_send_to_security_hub(self):
+    def test_security_hub_exporter_send_finding(self):
         # Create mock session
         session = boto3.session.Session(
             region_name="eu-west-1",
@@ -714,27 +858,101 @@ class Test_Outputs:
         output_options = mock.MagicMock()
         fill_json_asff(finding_output, input_audit_info, finding, output_options)
 
-        assert (
-            send_to_security_hub(
-                False,
-                finding.status,
-                finding.region,
-                finding_output,
-                input_audit_info.audit_session,
-            )
-            == 1
-        )
-        # Setting is_quiet to True
-        assert (
-            send_to_security_hub(
-                True,
-                finding.status,
-                finding.region,
-                finding_output,
-                input_audit_info.audit_session,
-            )
-            == 0
-        )
+        exporter = Security_Hub_Exporter(input_audit_info.audit_session)
+        exporter.send(finding.region, finding_output)
+        assert exporter.close() == {"eu-west-1": 1}
+
+    def test_security_hub_exporter(self):
+        security_hub_client = mock.MagicMock()
+        security_hub_client.list_enabled_products_for_import.return_value = {
+            "ProductSubscriptions": ["prowler/prowler"]
+        }
+        security_hub_client.batch_import_findings.side_effect = lambda Findings: {
+            "FailedCount": 0,
+            "SuccessCount": len(Findings),
+        }
+        session = mock.MagicMock()
+        session.client.return_value = security_hub_client
+
+        exporter = Security_Hub_Exporter(session)
+        for index in range(250):
+            finding_output = Check_Output_JSON_ASFF(Id=f"finding-{index}")
+            exporter.send("eu-west-1", finding_output)
+        assert exporter.close() == {"eu-west-1": 250}
+
+        # Security Hub status is checked once per region
+        session.client.assert_called_once_with("securityhub", region_name="eu-west-1")
+        security_hub_client.describe_hub.assert_called_once()
+        # Findings are sent in batches of 100
+        assert [
+            len(call.kwargs["Findings"])
+            for call in security_hub_client.batch_import_findings.call_args_list
+        ] == [100, 100, 50]
+
+    def test_security_hub_exporter_close_at_exit(self):
+        security_hub_client = mock.MagicMock()
+        session = mock.MagicMock()
+        session.client.return_value = security_hub_client
+
+        exporter = Security_Hub_Exporter(session)
+        with mock.patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.atexit"
+        ) as atexit_mock:
+            exporter.send("eu-west-1", Check_Output_JSON_ASFF(Id="finding-0"))
+            # The queued findings are sent if the scan exits before closing the exporter
+            atexit_mock.register.assert_called_once_with(exporter.close)
+            exporter.close()
+            atexit_mock.unregister.assert_called_once_with(exporter.close)
+
+    def test_security_hub_exporter_retry_failed_findings(self):
+        security_hub_client = mock.MagicMock()
+        security_hub_client.list_enabled_products_for_import.return_value = {
+            "ProductSubscriptions": ["prowler/prowler"]
+        }
+        security_hub_client.batch_import_findings.side_effect = [
+            {
+                "FailedCount": 1,
+                "SuccessCount": 1,
+                "FailedFindings": [
+                    {
+                        "Id": "finding-1",
+                        "ErrorCode": "Throttling",
+                        "ErrorMessage": "Rate exceeded",
+                    }
+                ],
+            },
+            {"FailedCount": 0, "SuccessCount": 1},
+        ]
+        session = mock.MagicMock()
+        session.client.return_value = security_hub_client
+
+        exporter = Security_Hub_Exporter(session)
+        exporter.send("eu-west-1", Check_Output_JSON_ASFF(Id="finding-0"))
+        exporter.send("eu-west-1", Check_Output_JSON_ASFF(Id="finding-1"))
+        with mock.patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.time.sleep"
+        ):
+            assert exporter.close() == {"eu-west-1": 2}
+        # Only the failed finding is retried
+        retried_findings = security_hub_client.batch_import_findings.call_args_list[
+            1
+        ].kwargs["Findings"]
+        assert [finding["Id"] for finding in retried_findings] == ["finding-1"]
+        assert exporter.failed_count == {}
+
+    def test_security_hub_exporter_integration_disabled(self):
+        security_hub_client = mock.MagicMock()
+        security_hub_client.list_enabled_products_for_import.return_value = {
+            "ProductSubscriptions": []
+        }
+        session = mock.MagicMock()
+        session.client.return_value = security_hub_client
+
+        exporter = Security_Hub_Exporter(session)
+        exporter.send("eu-west-1", Check_Output_JSON_ASFF(Id="finding-0"))
+        assert exporter.close() == {}
+        assert exporter.failed_count == {"eu-west-1": 1}
+        security_hub_client.batch_import_findings.assert_not_called()
 
     def test_get_check_compliance(self):
         bulk_check_metadata = [
@@ -0,0 +1,145 @@
+import csv
+from os import path
+from unittest import mock
+
+import pytest
+
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
+from prowler.lib.outputs.file_descriptors import close_output_session
+from prowler.lib.outputs.models import (
+    Aws_Check_Output_CSV,
+    Gcp_Check_Output_CSV,
+    generate_csv_fields,
+    generate_provider_output_model,
+)
+from prowler.lib.outputs.outputs import report
+from prowler.lib.outputs.parquet import (
+    Parquet_Writer,
+    generate_parquet_schema,
+    is_parquet_available,
+)
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+AWS_ACCOUNT_ID = "123456789012"
+
+
+def generate_finding_row(index: int) -> dict:
+    row = {field: "" for field in generate_csv_fields(Aws_Check_Output_CSV)}
+    row.update(
+        {
+            "check_id": "iam_root_mfa_enabled",
+            "status": "FAIL" if index % 2 else "PASS",
+            "severity": "critical",
+            "region": "eu-west-1",
+            "account_id": int(AWS_ACCOUNT_ID),
+            "profile": None,
+            "resource_id": f"resource-{index}",
+        }
+    )
+    return row
+
+
+class Test_Parquet:
+    def test_is_parquet_available(self):
+        assert is_parquet_available()
+        with mock.patch("prowler.lib.outputs.parquet.find_spec", return_value=None):
+            assert not is_parquet_available()
+
+    def test_generate_parquet_schema(self):
+        schema = generate_parquet_schema(Aws_Check_Output_CSV)
+        # The columns follow the CSV output
+        assert schema.names == generate_csv_fields(Aws_Check_Output_CSV)
+        assert schema.field("account_id").type == pyarrow.int64()
+        assert schema.field("check_id").type == pyarrow.string()
+        assert not schema.field("check_id").nullable
+        assert schema.field("profile").nullable
+        assert "project_id" in generate_parquet_schema(Gcp_Check_Output_CSV).names
+
+    def test_parquet_writer(self, tmp_path):
+        filename = f"{tmp_path}/prowler-output.parquet"
+        parquet_writer = Parquet_Writer(
+            filename, Aws_Check_Output_CSV, row_group_size=2
+        )
+        for index in range(5):
+            parquet_writer.writerow(generate_finding_row(index))
+        # The full row groups are written while the scan runs
+        assert parquet_writer.rows == 1
+        parquet_writer.close()
+        assert parquet_writer.closed
+
+        parquet_file = pyarrow_parquet.ParquetFile(filename)
+        assert parquet_file.metadata.num_rows == 5
+        assert parquet_file.metadata.num_row_groups == 3
+        column_encodings = parquet_file.metadata.row_group(0).column(
+            parquet_file.schema_arrow.get_field_index("check_id")
+        )
+        assert "RLE_DICTIONARY" in column_encodings.encodings
+        findings = parquet_file.read().to_pydict()
+        assert findings["resource_id"] == [f"resource-{index}" for index in range(5)]
+        assert findings["status"] == ["PASS", "FAIL", "PASS", "FAIL", "PASS"]
+        assert findings["account_id"] == [int(AWS_ACCOUNT_ID)] * 5
+
+    def test_parquet_writer_no_findings(self, tmp_path):
+        filename = f"{tmp_path}/prowler-output.parquet"
+        parquet_writer = Parquet_Writer(filename, Aws_Check_Output_CSV)
+        parquet_writer.flush()
+        parquet_writer.close()
+        # Closing twice does nothing
+        parquet_writer.close()
+        assert pyarrow_parquet.ParquetFile(filename).metadata.num_rows == 0
+
+    def test_report_csv_and_parquet(self, tmp_path):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=AWS_ACCOUNT_ID,
+            audited_identity_arn="test-arn",
+            audited_user_id="test",
+            audited_partition="aws",
+            profile="default",
+            profile_region="eu-west-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+        )
+        output_options = mock.MagicMock()
+        output_options.output_modes = ["csv", "parquet"]
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output"
+        output_options.output_session = None
+        output_options.allowlist_file = None
+        output_options.verbose = False
+        output_options.is_quiet = False
+        output_options.security_hub_enabled = False
+        output_options.bulk_checks_metadata = {}
+        finding = Check_Report_AWS(
+            load_check_metadata(
+                f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+            ).json()
+        )
+        finding.region = "eu-west-1"
+        finding.status = "FAIL"
+        finding.resource_id = "resource-0"
+
+        with mock.patch(
+            "prowler.lib.outputs.outputs.generate_provider_output_model",
+            wraps=generate_provider_output_model,
+        ) as generate_output_model:
+            report([finding], output_options, audit_info)
+        close_output_session(output_options)
+
+        # The CSV row is generated once for both outputs
+        generate_output_model.assert_called_once()
+        with open(f"{tmp_path}/prowler-output.csv") as csv_file:
+            csv_rows = list(csv.DictReader(csv_file, delimiter=";"))
+        findings = pyarrow_parquet.read_table(
+            f"{tmp_path}/prowler-output.parquet"
+        ).to_pydict()
+        assert [row["RESOURCE_ID"] for row in csv_rows] == ["resource-0"]
+        assert findings["resource_id"] == ["resource-0"]
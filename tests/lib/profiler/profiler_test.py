@@ -0,0 +1,82 @@
+import json
+from unittest import mock
+
+from boto3 import session
+from moto import mock_ec2
+
+from prowler.lib.profiler.profiler import Scan_Profiler
+
+AWS_REGION = "eu-west-1"
+
+
+def new_session() -> session.Session:
+    return session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=AWS_REGION,
+    )
+
+
+class Test_Scan_Profiler:
+    @mock_ec2
+    def test_api_calls(self):
+        profiler = Scan_Profiler()
+        profiler.enable()
+        aws_session = new_session()
+        profiler.register(aws_session)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        ec2_client.describe_vpcs()
+        ec2_client.describe_vpcs()
+        ec2_client.describe_security_groups()
+
+        report = profiler.generate_report()
+        api_calls = {
+            (stats["service"], stats["operation"], stats["region"]): stats
+            for stats in report["api_calls"]
+        }
+        assert api_calls[("ec2", "DescribeVpcs", AWS_REGION)]["calls"] == 2
+        assert api_calls[("ec2", "DescribeSecurityGroups", AWS_REGION)]["calls"] == 1
+        assert report["api_calls_by_service"][0]["service"] == "ec2"
+        assert report["api_calls_by_service"][0]["calls"] == 3
+        assert report["api_calls_by_region"][0]["region"] == AWS_REGION
+
+    def test_throttles(self):
+        profiler = Scan_Profiler()
+        operation = mock.MagicMock()
+        operation.name = "DescribeVpcs"
+        operation.service_model.service_name = "ec2"
+        request_dict = {"context": {"client_region": AWS_REGION}}
+        for error_code in ("RequestLimitExceeded", "InvalidVpcID.NotFound"):
+            profiler.__needs_retry__(
+                response=(None, {"Error": {"Code": error_code}}),
+                operation=operation,
+                request_dict=request_dict,
+            )
+        # Successful attempts are not throttled
+        profiler.__needs_retry__(
+            response=(None, {}), operation=operation, request_dict=request_dict
+        )
+
+        assert profiler.generate_report()["api_calls"][0]["throttles"] == 1
+
+    def test_measure(self):
+        profiler = Scan_Profiler()
+        # Nothing is measured until it is enabled
+        assert profiler.measure("checks", "check_disabled", sum, [1, 2]) == 3
+        profiler.enable()
+        assert profiler.measure("checks", "check_enabled", sum, [1, 2]) == 3
+        profiler.measure("services", "ec2_client", lambda: None)
+
+        report = profiler.generate_report()
+        assert [check["name"] for check in report["checks"]] == ["check_enabled"]
+        assert [service["name"] for service in report["services"]] == ["ec2_client"]
+
+    def test_write_report(self, tmp_path):
+        profiler = Scan_Profiler()
+        profiler.enable()
+        profiler.measure("checks", "check_slow", lambda: None)
+
+        report_file = profiler.write_report(str(tmp_path), "prowler-output")
+        assert report_file == f"{tmp_path}/prowler-output.profiling.json"
+        with open(report_file) as f:
+            assert json.load(f)["checks"][0]["name"] == "check_slow"
@@ -1,4 +1,7 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    Resource_Filter,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -15,3 +18,65 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_resource_filter(self):
+        audit_resources = Resource_Filter(
+            [
+                "arn:aws:iam::123456789012:role/path/test_role",
+                "arn:aws:s3:::test_bucket",
+                "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group",
+                "arn:aws:ec2:eu-west-1:123456789012:vpc/vpc-12345678",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:role/path/test_role", audit_resources
+        )
+        # Resources inside an ARN
+        assert is_resource_filtered(
+            "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group:*",
+            audit_resources,
+        )
+        assert is_resource_filtered("arn:aws:s3:::test_bucket/object", audit_resources)
+        # Names and IDs
+        assert is_resource_filtered("test_bucket", audit_resources)
+        assert is_resource_filtered("test_role", audit_resources)
+        assert is_resource_filtered("vpc-12345678", audit_resources)
+        # ARN prefixes and partial names are not filtered
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:role/path/test", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group_2:*",
+            audit_resources,
+        )
+        assert not is_resource_filtered("test", audit_resources)
+        assert not is_resource_filtered("vpc-1234", audit_resources)
+
+    def test_is_resource_filtered_arn_wildcard(self):
+        audit_resources = Resource_Filter(
+            ["arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group:*"]
+        )
+        assert is_resource_filtered(
+            "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group",
+            audit_resources,
+        )
+        assert is_resource_filtered(
+            "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group:*",
+            audit_resources,
+        )
+        assert is_resource_filtered(
+            "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group:log-stream:stream",
+            audit_resources,
+        )
+        assert is_resource_filtered("test_log_group", audit_resources)
+        assert not is_resource_filtered(
+            "arn:aws:logs:eu-west-1:123456789012:log-group:test_log_group_2",
+            audit_resources,
+        )
+        assert not is_resource_filtered("*", audit_resources)
+
+    def test_resource_filter_is_list(self):
+        audit_resources = ["arn:aws:s3:::test_bucket"]
+        resource_filter = Resource_Filter(audit_resources)
+        assert resource_filter == audit_resources
+        assert not Resource_Filter()
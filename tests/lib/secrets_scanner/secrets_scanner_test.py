@@ -0,0 +1,78 @@
+from unittest import mock
+
+from prowler.lib.secrets_scanner import secrets_scanner as secrets_scanner_module
+from prowler.lib.secrets_scanner.secrets_scanner import (
+    Secrets_Scanner,
+    is_filtered_payload,
+    scan_payload,
+)
+
+secret_data = "DB_PASSWORD=foobar123"
+no_secret_data = "echo hello world"
+
+
+class Test_Secrets_Scanner:
+    def test_scan_payload(self):
+        secrets = scan_payload(secret_data)
+        assert len(secrets) == 1
+        assert secrets[0]["type"] == "Secret Keyword"
+        assert secrets[0]["line_number"] == 1
+        assert secrets[0]["filename"] == "payload"
+        assert scan_payload(no_secret_data) is None
+
+    def test_scan_payload_eager_transformers(self):
+        # The INI files are parsed when nothing is found by lines
+        secrets = scan_payload("[credentials]\npassword = hunter2hunter2\n")
+        assert secrets
+        assert secrets[0]["line_number"] == 2
+
+    def test_is_filtered_payload(self):
+        assert is_filtered_payload("package-lock.json")
+        assert is_filtered_payload("image.png")
+        assert not is_filtered_payload("lambda_function.py")
+        assert scan_payload(secret_data, "image.png") is None
+
+    def test_scan_batch(self):
+        secrets_scanner = Secrets_Scanner(processes=1)
+        results = secrets_scanner.scan_batch([secret_data, no_secret_data, secret_data])
+        assert results[0] == scan_payload(secret_data)
+        assert results[1] is None
+        assert results[2] == results[0]
+        # The identical payloads are scanned once
+        assert len(secrets_scanner.results) == 2
+        with mock.patch.object(
+            secrets_scanner_module, "scan_payloads"
+        ) as scan_payloads:
+            assert secrets_scanner.scan(secret_data) == results[0]
+            scan_payloads.assert_not_called()
+
+    def test_scan_named_batch(self):
+        secrets_scanner = Secrets_Scanner(processes=1)
+        results = secrets_scanner.scan_named_batch(
+            [
+                ('DB_PASSWORD = "foobar123"', "config.py"),
+                ('DB_PASSWORD = "foobar123"', "package-lock.json"),
+            ]
+        )
+        assert results[0][0]["filename"] == "config.py"
+        assert results[1] is None
+
+    def test_scan_batch_pool(self):
+        secrets_scanner = Secrets_Scanner(processes=2, pool_min_payloads=1)
+        try:
+            payloads = [f"{secret_data}{index}" for index in range(10)] + [
+                no_secret_data
+            ]
+            with mock.patch.object(secrets_scanner_module, "atexit") as atexit_mock:
+                results = secrets_scanner.scan_batch(payloads)
+                assert secrets_scanner._pool
+                # The workers are not forked from a process running other threads
+                assert secrets_scanner._pool._ctx.get_start_method() != "fork"
+                # The workers are stopped even if the scan exits before closing the scanner
+                atexit_mock.register.assert_called_once_with(secrets_scanner.close)
+                assert results == [scan_payload(payload) for payload in payloads]
+                secrets_scanner.close()
+                atexit_mock.unregister.assert_called_once_with(secrets_scanner.close)
+        finally:
+            secrets_scanner.close()
+        assert not secrets_scanner._pool
@@ -6,8 +6,11 @@ from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     generate_regional_clients,
+    get_required_client_attributes,
+    is_required_attribute,
 )
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.common.models import Audit_Metadata
 
 ACCOUNT_ID = 123456789012
 
@@ -179,3 +182,45 @@ class Test_AWS_Provider:
 
         # Shield does not exist in China
         assert generate_regional_clients_response == {}
+
+    def test_get_required_client_attributes(self):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=None,
+            audited_account=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+            audit_metadata=Audit_Metadata(
+                services_scanned=0,
+                expected_checks=[
+                    "ec2_ebs_default_encryption",
+                    "vpc_peering_routing_tables_with_least_privilege",
+                ],
+                completed_checks=0,
+                audit_progress=0,
+            ),
+        )
+        required_attributes = get_required_client_attributes("ec2_client", audit_info)
+        assert required_attributes == {"ebs_encryption_by_default"}
+        assert is_required_attribute("ebs_encryption_by_default", required_attributes)
+        assert not is_required_attribute("instances", required_attributes)
+        # Services not used by the checks do not need any attribute
+        assert get_required_client_attributes("iam_client", audit_info) == set()
+
+        # Every attribute is required if any check is unknown
+        audit_info.audit_metadata.expected_checks.append("nonexistent_check")
+        assert get_required_client_attributes("ec2_client", audit_info) is None
+        assert is_required_attribute("instances", None)
+
+        # Or if the checks to execute are not known
+        audit_info.audit_metadata = None
+        assert get_required_client_attributes("ec2_client", audit_info) is None
@@ -1,8 +1,13 @@
+import random
+import time
+
 import yaml
 from boto3 import resource, session
 from moto import mock_dynamodb, mock_s3
 
 from prowler.providers.aws.lib.allowlist.allowlist import (
+    Allowlist_Index,
+    compile_allowlist,
     is_allowlisted,
     is_allowlisted_in_check,
     is_allowlisted_in_region,
@@ -15,6 +20,60 @@ AWS_ACCOUNT_NUMBER = "123456789012"
 AWS_REGION = "us-east-1"
 
 
+def generate_allowlist(entries: int) -> dict:
+    """generate_allowlist returns a synthetic allowlist with exact, regex and wildcard entries"""
+    allowlist = {"Accounts": {AWS_ACCOUNT_NUMBER: {"Checks": {}}, "*": {"Checks": {}}}}
+    for index in range(entries):
+        account = AWS_ACCOUNT_NUMBER if index % 2 else "*"
+        check_allowlist = {
+            "Regions": ["*"] if index % 5 == 0 else [AWS_REGION, "eu-west-1"],
+            "Resources": [f"resource-{index}", f"^bucket-{index}$"],
+        }
+        if index % 7 == 0:
+            check_allowlist["Tags"] = ["environment=dev", "project=.*"]
+        allowlist["Accounts"][account]["Checks"][
+            f"service{index}_check"
+        ] = check_allowlist
+    allowlist["Accounts"]["*"]["Checks"]["s3_*"] = {
+        "Regions": ["eu-west-1"],
+        "Resources": ["*"],
+    }
+    allowlist["Accounts"][AWS_ACCOUNT_NUMBER]["Checks"]["*"] = {
+        "Regions": [AWS_REGION],
+        "Resources": ["allowlisted-everywhere"],
+    }
+    return allowlist
+
+
+def generate_findings(entries: int, count: int) -> list:
+    """generate_findings returns synthetic findings, some of them allowlisted"""
+    random.seed(entries)
+    findings = []
+    for _ in range(count):
+        index = random.randrange(entries)
+        findings.append(
+            (
+                random.choice([AWS_ACCOUNT_NUMBER, "111111111111"]),
+                random.choice(
+                    [f"service{index}_check", "s3_bucket_public_access", "iam_check"]
+                ),
+                random.choice([AWS_REGION, "eu-west-1", "ap-south-1"]),
+                random.choice(
+                    [
+                        f"resource-{index}",
+                        f"bucket-{index}",
+                        f"bucket-{index}-logs",
+                        "allowlisted-everywhere",
+                    ]
+                ),
+                random.choice(
+                    [[], ["environment=dev"], ["environment=dev", "project=prowler"]]
+                ),
+            )
+        )
+    return findings
+
+
 class Test_Allowlist:
     # Mocked Audit Info
     def set_mocked_audit_info(self):
@@ -480,3 +539,112 @@ class Test_Allowlist:
             "prowler-test",
             ["environment=prod", "project=myproj"],
         )
+
+    def test_compile_allowlist(self):
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "s3_*": {
+                            "Regions": ["us-east-1"],
+                            "Resources": ["*"],
+                        },
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["prowler"],
+                            "Tags": ["environment=dev"],
+                        },
+                    }
+                }
+            }
+        }
+        allowlist_index = compile_allowlist(allowlist)
+        assert isinstance(allowlist_index, Allowlist_Index)
+
+        assert is_allowlisted(
+            allowlist_index,
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            AWS_REGION,
+            "prowler",
+            [],
+        )
+        assert not is_allowlisted(
+            allowlist_index,
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            "eu-west-1",
+            "prowler",
+            [],
+        )
+        assert is_allowlisted(
+            allowlist_index,
+            AWS_ACCOUNT_NUMBER,
+            "check_test",
+            "eu-west-1",
+            "prowler-test",
+            ["environment=dev"],
+        )
+        assert not is_allowlisted(
+            allowlist_index,
+            AWS_ACCOUNT_NUMBER,
+            "check_test",
+            "eu-west-1",
+            "prowler-test",
+            [],
+        )
+
+    def test_is_allowlisted_in_check_after_asterisk(self):
+        # The checks after a * must still be matched with the finding's check
+        allowlist = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["test"],
+                        },
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["prowler"],
+                        },
+                    }
+                }
+            }
+        }
+        for allowlist_format in (allowlist, compile_allowlist(allowlist)):
+            assert is_allowlisted(
+                allowlist_format,
+                AWS_ACCOUNT_NUMBER,
+                "check_test",
+                AWS_REGION,
+                "prowler",
+                [],
+            )
+
+    def test_compile_allowlist_equivalence(self):
+        entries = 500
+        allowlist = generate_allowlist(entries)
+        allowlist_index = compile_allowlist(allowlist)
+        for finding in generate_findings(entries, 2000):
+            assert bool(is_allowlisted(allowlist, *finding)) == is_allowlisted(
+                allowlist_index, *finding
+            )
+
+    def test_compile_allowlist_benchmark(self):
+        entries = 3000
+        allowlist = generate_allowlist(entries)
+        findings = generate_findings(entries, 20)
+
+        start = time.perf_counter()
+        expected = [bool(is_allowlisted(allowlist, *finding)) for finding in findings]
+        allowlist_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        allowlist_index = compile_allowlist(allowlist)
+        results = [is_allowlisted(allowlist_index, *finding) for finding in findings]
+        allowlist_index_time = time.perf_counter() - start
+
+        assert results == expected
+        # Even including its compilation the index is faster
+        assert allowlist_index_time < allowlist_time
@@ -0,0 +1,148 @@
+import os
+from unittest import mock
+
+import pytest
+from boto3 import session
+from botocore.exceptions import ClientError
+from moto import mock_ec2, mock_sts
+
+from prowler.providers.aws.lib.api_cache.api_cache import (
+    AWS_API_Cache,
+    is_cacheable_operation,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "eu-west-1"
+
+
+def set_mocked_audit_info():
+    audit_info = mock.MagicMock()
+    audit_info.audited_account = AWS_ACCOUNT_NUMBER
+    audit_info.profile = None
+    return audit_info
+
+
+def new_session() -> session.Session:
+    return session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=AWS_REGION,
+    )
+
+
+class Test_AWS_API_Cache:
+    @mock_ec2
+    def test_api_cache(self, tmp_path):
+        api_cache = AWS_API_Cache(str(tmp_path))
+        aws_session = new_session()
+        api_cache.register(aws_session, set_mocked_audit_info())
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        ec2_client.create_security_group(GroupName="test", Description="test")
+
+        first_response = ec2_client.describe_security_groups()
+        assert api_cache.misses == 1
+        assert api_cache.hits == 0
+        # The response is keyed by account, region, service and operation
+        cache_directory = f"{tmp_path}/{AWS_ACCOUNT_NUMBER}/{AWS_REGION}/ec2"
+        assert len(os.listdir(cache_directory)) == 1
+        assert os.listdir(cache_directory)[0].startswith("DescribeSecurityGroups-")
+
+        # The security group created later is not in the cached response
+        ec2_client.create_security_group(GroupName="test2", Description="test2")
+        second_response = ec2_client.describe_security_groups()
+        assert api_cache.hits == 1
+        assert second_response["SecurityGroups"] == first_response["SecurityGroups"]
+
+        # Different parameters are a different response
+        ec2_client.describe_security_groups(GroupNames=["test2"])
+        assert api_cache.misses == 2
+
+    @mock_ec2
+    def test_api_cache_expired(self, tmp_path):
+        api_cache = AWS_API_Cache(str(tmp_path), ttl=0)
+        aws_session = new_session()
+        api_cache.register(aws_session, set_mocked_audit_info())
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+
+        ec2_client.describe_vpcs()
+        ec2_client.describe_vpcs()
+        assert api_cache.hits == 0
+        assert api_cache.misses == 2
+
+    @mock_ec2
+    def test_api_cache_replay(self, tmp_path):
+        audit_info = set_mocked_audit_info()
+        api_cache = AWS_API_Cache(str(tmp_path))
+        aws_session = new_session()
+        api_cache.register(aws_session, audit_info)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        ec2_client.create_security_group(GroupName="test", Description="test")
+        security_groups = ec2_client.describe_security_groups()["SecurityGroups"]
+
+        # Without AWS the stored responses are replayed
+        api_cache = AWS_API_Cache(str(tmp_path), replay=True)
+        aws_session = new_session()
+        api_cache.register(aws_session, audit_info)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        with mock.patch(
+            "botocore.endpoint.Endpoint.make_request",
+            side_effect=AssertionError("AWS must not be called"),
+        ):
+            assert (
+                ec2_client.describe_security_groups()["SecurityGroups"]
+                == security_groups
+            )
+            assert api_cache.hits == 1
+
+            # Missing responses are errors
+            with pytest.raises(ClientError) as error:
+                ec2_client.describe_vpcs()
+            assert error.value.response["Error"]["Code"] == "APICacheMiss"
+
+    @mock_sts
+    def test_api_cache_identity_not_cached(self, tmp_path):
+        audit_info = set_mocked_audit_info()
+        api_cache = AWS_API_Cache(str(tmp_path))
+        aws_session = new_session()
+        api_cache.register(aws_session, audit_info)
+        sts_client = aws_session.client("sts", region_name=AWS_REGION)
+        sts_client.get_caller_identity()
+        sts_client.get_caller_identity()
+        # Other credentials must not get the cached identity
+        assert api_cache.hits == 0
+        assert api_cache.misses == 0
+        assert not os.listdir(tmp_path)
+
+        # The identity is always requested to AWS, even in replay mode
+        api_cache = AWS_API_Cache(str(tmp_path), replay=True)
+        aws_session = new_session()
+        api_cache.register(aws_session, audit_info)
+        sts_client = aws_session.client("sts", region_name=AWS_REGION)
+        assert sts_client.get_caller_identity()["Account"] == AWS_ACCOUNT_NUMBER
+
+    @mock_ec2
+    def test_api_cache_unknown_account(self, tmp_path):
+        audit_info = set_mocked_audit_info()
+        audit_info.audited_account = None
+        api_cache = AWS_API_Cache(str(tmp_path))
+        aws_session = new_session()
+        api_cache.register(aws_session, audit_info)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        ec2_client.describe_vpcs()
+        # Nothing is stored until the account is known
+        assert api_cache.misses == 0
+        assert not os.listdir(tmp_path)
+
+        audit_info.audited_account = AWS_ACCOUNT_NUMBER
+        ec2_client.describe_vpcs()
+        assert api_cache.misses == 1
+        assert os.listdir(tmp_path) == [AWS_ACCOUNT_NUMBER]
+
+    def test_is_cacheable_operation(self):
+        assert is_cacheable_operation("ec2", "DescribeInstances")
+        assert is_cacheable_operation("iam", "GetCredentialReport")
+        assert not is_cacheable_operation("sts", "GetCallerIdentity")
+        assert not is_cacheable_operation("iam", "GenerateCredentialReport")
+        assert not is_cacheable_operation("kms", "GenerateDataKey")
+        assert not is_cacheable_operation("lambda", "GetFunction")
+        assert not is_cacheable_operation("ec2", "CreateSecurityGroup")
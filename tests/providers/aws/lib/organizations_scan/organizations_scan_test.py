@@ -0,0 +1,126 @@
+import json
+import os
+import sys
+
+import boto3
+from boto3 import session
+from mock import MagicMock
+from moto import mock_organizations, mock_sts
+
+from prowler.providers.aws.lib.organizations_scan.organizations_scan import (
+    get_organization_account_role_arn,
+    get_organization_accounts,
+    merge_organization_outputs,
+    scan_organization_accounts,
+)
+
+AWS_REGION = "us-east-1"
+
+
+def mock_scanner(account: dict) -> tuple:
+    if account["Id"] == "222222222222":
+        # Prowler exits on critical errors
+        sys.exit(1)
+    # Every account is scanned in its own process
+    return {"total_pass": 1, "total_fail": 2, "pid": os.getpid()}, account["Id"]
+
+
+class Test_AWS_Organizations_Scan:
+    @mock_organizations
+    @mock_sts
+    def test_get_organization_accounts(self):
+        organizations_client = boto3.client("organizations", region_name=AWS_REGION)
+        organizations_client.create_organization(FeatureSet="ALL")
+        account_id = organizations_client.create_account(
+            AccountName="test", Email="test@example.org"
+        )["CreateAccountStatus"]["AccountId"]
+        audit_info = MagicMock()
+        audit_info.original_session = session.Session(region_name=AWS_REGION)
+
+        accounts = get_organization_accounts(audit_info)
+        # The management account and the created one
+        assert len(accounts) == 2
+        assert account_id in [account["Id"] for account in accounts]
+
+    def test_get_organization_account_role_arn(self):
+        assert (
+            get_organization_account_role_arn("aws", "123456789012", "ProwlerRole")
+            == "arn:aws:iam::123456789012:role/ProwlerRole"
+        )
+
+    def test_scan_organization_accounts(self):
+        accounts = [
+            {"Id": "111111111111", "Name": "first"},
+            {"Id": "222222222222", "Name": "second"},
+            {"Id": "333333333333", "Name": "third"},
+        ]
+        results = {
+            result["account"]: result
+            for result in scan_organization_accounts(accounts, mock_scanner, 2)
+        }
+
+        assert results["111111111111"]["stats"]["total_fail"] == 2
+        assert results["111111111111"]["output_filename"] == "111111111111"
+        assert results["111111111111"]["name"] == "first"
+        assert not results["111111111111"]["error"]
+        assert results["222222222222"]["error"] == "Scan exited with code 1"
+        assert not results["222222222222"]["stats"]
+        assert (
+            results["111111111111"]["stats"]["pid"]
+            != results["333333333333"]["stats"]["pid"]
+        )
+
+    def test_merge_organization_outputs(self, tmp_path):
+        for account in ("111111111111", "222222222222"):
+            with open(f"{tmp_path}/prowler-output-{account}.csv", "w") as f:
+                f.write(f"ACCOUNT_ID;STATUS\n{account};PASS\n")
+            with open(f"{tmp_path}/prowler-output-{account}_cis_1.5_aws.csv", "w") as f:
+                f.write(f"ACCOUNTID;STATUS\n{account};FAIL\n")
+            with open(f"{tmp_path}/prowler-output-{account}.json", "w") as f:
+                f.write(f'[{{"AccountId": "{account}"}}]')
+            with open(f"{tmp_path}/prowler-output-{account}.asff.ndjson", "w") as f:
+                f.write(f'{{"AwsAccountId":"{account}"}}\n')
+            with open(f"{tmp_path}/prowler-output-{account}.html", "w") as f:
+                f.write("<html></html>")
+        # Accounts without findings
+        with open(f"{tmp_path}/prowler-output-333333333333.json", "w") as f:
+            f.write("[]")
+
+        merged_files = merge_organization_outputs(
+            str(tmp_path),
+            [
+                "prowler-output-111111111111",
+                "prowler-output-222222222222",
+                "prowler-output-333333333333",
+            ],
+            "prowler-output-organization",
+        )
+
+        assert sorted(merged_files) == [
+            f"{tmp_path}/prowler-output-organization.asff.ndjson",
+            f"{tmp_path}/prowler-output-organization.csv",
+            f"{tmp_path}/prowler-output-organization.json",
+            f"{tmp_path}/prowler-output-organization_cis_1.5_aws.csv",
+        ]
+        with open(f"{tmp_path}/prowler-output-organization.csv") as f:
+            assert (
+                f.read() == "ACCOUNT_ID;STATUS\n111111111111;PASS\n222222222222;PASS\n"
+            )
+        with open(f"{tmp_path}/prowler-output-organization.json") as f:
+            assert json.load(f) == [
+                {"AccountId": "111111111111"},
+                {"AccountId": "222222222222"},
+            ]
+        with open(f"{tmp_path}/prowler-output-organization.asff.ndjson") as f:
+            assert f.read() == (
+                '{"AwsAccountId":"111111111111"}\n{"AwsAccountId":"222222222222"}\n'
+            )
+        # The HTML reports are kept per account
+        assert sorted(os.listdir(tmp_path)) == [
+            "prowler-output-111111111111.html",
+            "prowler-output-222222222222.html",
+            "prowler-output-organization.asff.ndjson",
+            "prowler-output-organization.csv",
+            "prowler-output-organization.json",
+            "prowler-output-organization_cis_1.5_aws.csv",
+        ]
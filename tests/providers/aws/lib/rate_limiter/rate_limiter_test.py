@@ -0,0 +1,123 @@
+import time
+from unittest import mock
+
+from boto3 import session
+from moto import mock_ec2
+
+from prowler.providers.aws.lib.rate_limiter.rate_limiter import (
+    AWS_Rate_Limiter,
+    Token_Bucket,
+    default_throttled_rate,
+)
+
+AWS_REGION = "eu-west-1"
+
+
+def new_session() -> session.Session:
+    return session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name=AWS_REGION,
+    )
+
+
+class Test_Token_Bucket:
+    def test_acquire(self):
+        bucket = Token_Bucket(rate=100, burst=2)
+        # The burst is not limited
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        # The next token is refilled in 1/rate seconds
+        assert 0 < bucket.acquire() <= 0.01
+
+    def test_acquire_unlimited(self):
+        bucket = Token_Bucket()
+        for _ in range(1000):
+            assert bucket.acquire() == 0
+
+    def test_throttle(self):
+        bucket = Token_Bucket(rate=20, burst=100)
+        sent = time.monotonic()
+        bucket.throttle(sent)
+        assert bucket.rate == 10
+        assert bucket.capacity == 10
+        # The requests sent before the decrease are throttled by the same rate
+        bucket.throttle(sent)
+        assert bucket.rate == 10
+        assert bucket.throttles == 2
+        bucket.throttle(time.monotonic())
+        assert bucket.rate == 5
+
+    def test_throttle_unlimited(self):
+        bucket = Token_Bucket()
+        bucket.throttle(time.monotonic())
+        assert bucket.rate == default_throttled_rate
+        assert bucket.acquire() > 0
+
+    def test_succeed(self):
+        bucket = Token_Bucket(rate=10, burst=10)
+        # The rate does not increase while it is not the bottleneck
+        bucket.succeed()
+        assert bucket.rate == 10
+        for _ in range(10):
+            bucket.acquire()
+        bucket.succeed()
+        assert bucket.rate == 10.1
+        assert bucket.capacity == 10.1
+
+
+class Test_AWS_Rate_Limiter:
+    def test_get_bucket(self):
+        rate_limiter = AWS_Rate_Limiter()
+        # Published limits of the service and the operation
+        assert rate_limiter.get_bucket("ec2", AWS_REGION, "DescribeVpcs").rate == 20
+        assert (
+            rate_limiter.get_bucket("cloudtrail", AWS_REGION, "LookupEvents").rate == 2
+        )
+        assert not rate_limiter.get_bucket("iam", "global", "ListUsers").rate
+        # The buckets are per service, region and operation
+        assert rate_limiter.get_bucket(
+            "ec2", AWS_REGION, "DescribeVpcs"
+        ) is rate_limiter.get_bucket("ec2", AWS_REGION, "DescribeVpcs")
+        assert rate_limiter.get_bucket(
+            "ec2", AWS_REGION, "DescribeVpcs"
+        ) is not rate_limiter.get_bucket("ec2", "us-east-1", "DescribeVpcs")
+
+    @mock_ec2
+    def test_register(self):
+        rate_limiter = AWS_Rate_Limiter()
+        aws_session = new_session()
+        rate_limiter.register(aws_session)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        with mock.patch.object(
+            Token_Bucket, "acquire", side_effect=Token_Bucket.acquire, autospec=True
+        ) as acquire:
+            ec2_client.describe_vpcs()
+            ec2_client.describe_vpcs()
+
+        bucket = rate_limiter.buckets[("ec2", AWS_REGION, "DescribeVpcs")]
+        assert acquire.call_count == 2
+        assert acquire.call_args.args[0] is bucket
+        assert not bucket.throttles
+
+    def test_register_throttled(self):
+        rate_limiter = AWS_Rate_Limiter()
+        aws_session = new_session()
+        rate_limiter.register(aws_session)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION)
+        operation = ec2_client.meta.service_model.operation_model("DescribeVpcs")
+        request_dict = {"context": {"client_region": AWS_REGION}}
+        rate_limiter.__request_created__(
+            mock.MagicMock(context=request_dict["context"]),
+            "DescribeVpcs",
+            "request-created.ec2.DescribeVpcs",
+        )
+        rate_limiter.__needs_retry__(
+            (None, {"Error": {"Code": "RequestLimitExceeded"}}),
+            operation,
+            request_dict,
+        )
+
+        bucket = rate_limiter.buckets[("ec2", AWS_REGION, "DescribeVpcs")]
+        assert bucket.throttles == 1
+        assert bucket.rate == 10
@@ -0,0 +1,43 @@
+import json
+
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    get_security_hub_current_findings_ids,
+)
+
+AWS_ACCOUNT_ID = "123456789012"
+
+asff_findings = [
+    {
+        "Id": "prowler-check-1-eu-west-1",
+        "ProductArn": "arn:aws:securityhub:eu-west-1::product/prowler/prowler",
+    },
+    {
+        "Id": "prowler-check-1-us-east-1",
+        "ProductArn": "arn:aws:securityhub:us-east-1::product/prowler/prowler",
+    },
+    {
+        "Id": "prowler-check-2-eu-west-1",
+        "ProductArn": "arn:aws:securityhub:eu-west-1::product/prowler/prowler",
+    },
+]
+expected_findings_ids = {
+    "eu-west-1": {"prowler-check-1-eu-west-1", "prowler-check-2-eu-west-1"},
+    "us-east-1": {"prowler-check-1-us-east-1"},
+}
+
+
+class Test_Security_Hub:
+    def test_get_security_hub_current_findings_ids_json_asff(self, tmp_path):
+        filename = f"{tmp_path}/prowler-output-{AWS_ACCOUNT_ID}.asff.json"
+        with open(filename, "w") as f:
+            json.dump(asff_findings, f, indent=4)
+
+        assert get_security_hub_current_findings_ids(filename) == expected_findings_ids
+
+    def test_get_security_hub_current_findings_ids_ndjson_asff(self, tmp_path):
+        filename = f"{tmp_path}/prowler-output-{AWS_ACCOUNT_ID}.asff.ndjson"
+        with open(filename, "w") as f:
+            for finding in asff_findings:
+                f.write(json.dumps(finding) + "\n")
+
+        assert get_security_hub_current_findings_ids(filename) == expected_findings_ids
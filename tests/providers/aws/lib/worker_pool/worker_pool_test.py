@@ -0,0 +1,100 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from prowler.providers.aws.lib.worker_pool.worker_pool import AWS_Worker_Pool
+
+
+@dataclass
+class Regional_Item:
+    region: str
+    name: str
+
+
+class Test_AWS_Worker_Pool:
+    def test_map(self):
+        worker_pool = AWS_Worker_Pool(max_workers=4, max_workers_per_region=2)
+        items = [Regional_Item(region="eu-west-1", name=str(i)) for i in range(10)]
+        processed = []
+        lock = threading.Lock()
+
+        def call(item):
+            with lock:
+                processed.append(item.name)
+
+        worker_pool.map(call, items)
+        worker_pool.shutdown()
+        assert sorted(processed) == sorted(item.name for item in items)
+
+    def test_map_empty(self):
+        worker_pool = AWS_Worker_Pool()
+        worker_pool.map(lambda item: None, [])
+        # The threads are not started if there is nothing to do
+        assert worker_pool._executor is None
+
+    def test_map_limits(self):
+        max_workers = 4
+        max_workers_per_region = 2
+        worker_pool = AWS_Worker_Pool(max_workers, max_workers_per_region)
+        items = [
+            Regional_Item(region=region, name=str(i))
+            for region in ("eu-west-1", "us-east-1", "ap-south-1")
+            for i in range(5)
+        ]
+        running = {"total": 0}
+        max_running = {"total": 0}
+        lock = threading.Lock()
+
+        def call(item):
+            with lock:
+                running["total"] += 1
+                running[item.region] = running.get(item.region, 0) + 1
+                for key in ("total", item.region):
+                    max_running[key] = max(max_running.get(key, 0), running[key])
+            time.sleep(0.01)
+            with lock:
+                running["total"] -= 1
+                running[item.region] -= 1
+
+        worker_pool.map(call, items)
+        worker_pool.shutdown()
+        assert max_running["total"] <= max_workers
+        for region in ("eu-west-1", "us-east-1", "ap-south-1"):
+            assert max_running[region] <= max_workers_per_region
+
+    def test_map_nested(self):
+        # A single worker would deadlock if nested calls were submitted to the pool
+        worker_pool = AWS_Worker_Pool(max_workers=1)
+        processed = []
+
+        def inner_call(item):
+            processed.append(item)
+
+        def outer_call(item):
+            worker_pool.map(inner_call, [f"{item}-1", f"{item}-2"])
+
+        worker_pool.map(outer_call, ["a", "b"])
+        worker_pool.shutdown()
+        assert processed == ["a-1", "a-2", "b-1", "b-2"]
+
+    def test_map_error(self):
+        worker_pool = AWS_Worker_Pool(max_workers=2)
+        processed = []
+
+        def call(item):
+            if item == "error":
+                raise Exception("API error")
+            processed.append(item)
+
+        worker_pool.map(call, ["error", "ok"])
+        worker_pool.shutdown()
+        assert processed == ["ok"]
+
+    def test_configure(self):
+        worker_pool = AWS_Worker_Pool()
+        worker_pool.configure(max_workers=5)
+        assert worker_pool.max_workers == 5
+        assert worker_pool.max_workers_per_region == 10
+        worker_pool.configure(max_workers_per_region=3)
+        assert worker_pool.max_workers == 5
+        assert worker_pool.max_workers_per_region == 3
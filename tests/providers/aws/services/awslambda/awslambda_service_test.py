@@ -1,6 +1,4 @@
 import io
-import os
-import tempfile
 import zipfile
 from re import search
 from unittest.mock import patch
@@ -12,6 +10,10 @@ from moto.core import DEFAULT_ACCOUNT_ID
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.awslambda.awslambda_service import AuthType, Lambda
+from prowler.providers.aws.services.awslambda.lib.code_fetcher import (
+    Lambda_Code_Fetcher,
+    lambda_code_fetcher,
+)
 from prowler.providers.common.models import Audit_Metadata
 
 # Mock Test Region
@@ -37,11 +39,16 @@ def create_zip_file(code: str = "") -> io.BytesIO:
     return zip_output
 
 
-def mock_request_get(_):
-    """Mock requests.get() to get the Lambda Code in Zip Format"""
-    mock_resp = mock.MagicMock
+LAMBDA_CODE_ZIP = create_zip_file().read()
+
+
+def mock_session_get(*_, **__):
+    """Mock requests.Session.get() to stream the Lambda Code in Zip Format"""
+    mock_resp = mock.MagicMock()
+    mock_resp.__enter__.return_value = mock_resp
     mock_resp.status_code = 200
-    mock_resp.content = create_zip_file().read()
+    mock_resp.headers = {"Content-Length": str(len(LAMBDA_CODE_ZIP))}
+    mock_resp.iter_content.return_value = [LAMBDA_CODE_ZIP]
     return mock_resp
 
 
@@ -104,7 +111,7 @@ class Test_Lambda_Service:
     @mock_lambda
     @mock_iam
     @mock_s3
-    def test__list_functions__(self):
+    def test__list_functions__(self, tmp_path):
         # Create IAM Lambda Role
         iam_client = client("iam", region_name=AWS_REGION)
         iam_role = iam_client.create_role(
@@ -126,7 +133,7 @@ class Test_Lambda_Service:
             Runtime="python3.7",
             Role=iam_role,
             Handler="lambda_function.lambda_handler",
-            Code={"ZipFile": create_zip_file().read()},
+            Code={"ZipFile": LAMBDA_CODE_ZIP},
             Description="test lambda function",
             Timeout=3,
             MemorySize=128,
@@ -182,10 +189,11 @@ class Test_Lambda_Service:
         )
 
         lambda_arn = resp["FunctionArn"]
-        with mock.patch(
-            "prowler.providers.aws.services.awslambda.awslambda_service.requests.get",
-            new=mock_request_get,
-        ):
+        with mock.patch.object(
+            Lambda_Code_Fetcher,
+            "__get_session__",
+            return_value=mock.MagicMock(get=mock_session_get),
+        ), mock.patch.object(lambda_code_fetcher, "directory", str(tmp_path)):
             awslambda = Lambda(self.set_mocked_audit_info())
 
             assert awslambda.functions
@@ -221,19 +229,13 @@ class Test_Lambda_Service:
 
             assert awslambda.functions[lambda_name].tags == [{"test": "test"}]
 
-            # Pending ZipFile tests
-            with tempfile.TemporaryDirectory() as tmp_dir_name:
-                awslambda.functions[lambda_name].code.code_zip.extractall(tmp_dir_name)
-                files_in_zip = next(os.walk(tmp_dir_name))[2]
-                assert len(files_in_zip) == 1
-                assert files_in_zip[0] == "lambda_function.py"
-                with open(f"{tmp_dir_name}/{files_in_zip[0]}", "r") as lambda_code_file:
-                    _ = lambda_code_file
-                    # assert (
-                    #     lambda_code_file.read()
-                    #     == """
-                    # def lambda_handler(event, context):
-                    # print("custom log event")
-                    # return event
-                    # """
-                    # )
+            # The code is stored on disk by its SHA-256
+            assert (
+                awslambda.functions[lambda_name].code.code_sha256 == resp["CodeSha256"]
+            )
+            assert awslambda.functions[lambda_name].code.path.startswith(str(tmp_path))
+            assert not awslambda.functions[lambda_name].code.code_zip
+            code_zip = awslambda.functions[lambda_name].code.open()
+            assert code_zip.namelist() == ["lambda_function.py"]
+            awslambda.functions[lambda_name].code.release()
+            assert not awslambda.functions[lambda_name].code.code_zip
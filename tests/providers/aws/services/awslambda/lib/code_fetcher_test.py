@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import os
+from unittest import mock
+
+from prowler.providers.aws.services.awslambda.lib import (
+    code_fetcher as code_fetcher_module,
+)
+from prowler.providers.aws.services.awslambda.lib.code_fetcher import (
+    Lambda_Code_Fetcher,
+    get_code_file_name,
+    lambda_code_temporary_directory_prefix,
+)
+
+CODE_ZIP = b"PK\x05\x06" + b"\x00" * 18
+CODE_SHA256 = base64.b64encode(hashlib.sha256(CODE_ZIP).digest()).decode()
+CODE_LOCATION = "https://awslambda-eu-west-1-tasks.s3.eu-west-1.amazonaws.com/code"
+
+
+def mock_session(content: bytes, content_length: bool = True) -> mock.MagicMock:
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {"Content-Length": str(len(content))} if content_length else {}
+    response.iter_content.return_value = [content[:10], content[10:]]
+    return mock.MagicMock(**{"get.return_value": response})
+
+
+class Test_Lambda_Code_Fetcher:
+    def test_get_code_file_name(self):
+        assert (
+            get_code_file_name(CODE_SHA256)
+            == f"{hashlib.sha256(CODE_ZIP).hexdigest()}.zip"
+        )
+        # Not a base64 SHA-256
+        assert get_code_file_name("unknown!").endswith(".zip")
+
+    def test_fetch(self, tmp_path):
+        code_fetcher = Lambda_Code_Fetcher(directory=str(tmp_path))
+        session = mock_session(CODE_ZIP)
+        with mock.patch.object(
+            Lambda_Code_Fetcher, "__get_session__", return_value=session
+        ):
+            code_path = code_fetcher.fetch(CODE_LOCATION, CODE_SHA256).result()
+            # The functions with the same code share the download
+            assert code_fetcher.fetch(CODE_LOCATION, CODE_SHA256).result() == code_path
+        code_fetcher.shutdown()
+
+        assert code_path == f"{tmp_path}/{get_code_file_name(CODE_SHA256)}"
+        with open(code_path, "rb") as code_file:
+            assert code_file.read() == CODE_ZIP
+        assert session.get.call_count == 1
+        assert os.listdir(tmp_path) == [get_code_file_name(CODE_SHA256)]
+
+    def test_fetch_cached(self, tmp_path):
+        code_path = f"{tmp_path}/{get_code_file_name(CODE_SHA256)}"
+        with open(code_path, "wb") as code_file:
+            code_file.write(CODE_ZIP)
+        code_fetcher = Lambda_Code_Fetcher(directory=str(tmp_path))
+        session = mock_session(CODE_ZIP)
+        with mock.patch.object(
+            Lambda_Code_Fetcher, "__get_session__", return_value=session
+        ):
+            assert code_fetcher.fetch(CODE_LOCATION, CODE_SHA256).result() == code_path
+        code_fetcher.shutdown()
+        session.get.assert_not_called()
+
+    def test_fetch_too_large(self, tmp_path):
+        code_fetcher = Lambda_Code_Fetcher(directory=str(tmp_path))
+        code_fetcher.max_code_size = len(CODE_ZIP) - 1
+        # Skipped by its Content-Length and while it is streamed
+        for content_length in (True, False):
+            code_fetcher.configure(directory=str(tmp_path))
+            with mock.patch.object(
+                Lambda_Code_Fetcher,
+                "__get_session__",
+                return_value=mock_session(CODE_ZIP, content_length),
+            ):
+                assert not code_fetcher.fetch(CODE_LOCATION, CODE_SHA256).result()
+        code_fetcher.shutdown()
+        assert not os.listdir(tmp_path)
+
+    def test_fetch_sha256_mismatch(self, tmp_path):
+        code_fetcher = Lambda_Code_Fetcher(directory=str(tmp_path))
+        with mock.patch.object(
+            Lambda_Code_Fetcher,
+            "__get_session__",
+            return_value=mock_session(CODE_ZIP + b"\x00"),
+        ):
+            assert not code_fetcher.fetch(CODE_LOCATION, CODE_SHA256).result()
+        code_fetcher.shutdown()
+        assert not os.listdir(tmp_path)
+
+    def test_fetch_temporary_directory(self):
+        code_fetcher = Lambda_Code_Fetcher()
+        session = mock_session(CODE_ZIP)
+        with mock.patch.object(
+            Lambda_Code_Fetcher, "__get_session__", return_value=session
+        ), mock.patch.object(code_fetcher_module, "atexit") as atexit_mock:
+            code_path = code_fetcher.fetch(CODE_LOCATION, CODE_SHA256).result()
+            # The code packages are removed even if the scan exits before the shutdown
+            atexit_mock.register.assert_called_once_with(code_fetcher.shutdown)
+            assert os.path.basename(os.path.dirname(code_path)).startswith(
+                lambda_code_temporary_directory_prefix
+            )
+            # Only the user can read the code packages
+            assert os.stat(os.path.dirname(code_path)).st_mode & 0o777 == 0o700
+            assert os.path.isfile(code_path)
+            code_fetcher.shutdown()
+            atexit_mock.unregister.assert_called_once_with(code_fetcher.shutdown)
+
+        # The code packages are not kept after the scan
+        assert not os.path.exists(os.path.dirname(code_path))
@@ -53,7 +53,7 @@ class Test_cloudwatch_changes_to_network_gateways_alarm_configured:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_changes_to_network_gateways_alarm_configured"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -112,7 +112,7 @@ class Test_cloudwatch_changes_to_network_gateways_alarm_configured:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_changes_to_network_gateways_alarm_configured"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -177,7 +177,7 @@ class Test_cloudwatch_changes_to_network_gateways_alarm_configured:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_changes_to_network_gateways_alarm_configured"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -254,7 +254,7 @@ class Test_cloudwatch_changes_to_network_gateways_alarm_configured:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_changes_to_network_gateways_alarm_configured"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -343,7 +343,7 @@ class Test_cloudwatch_changes_to_network_gateways_alarm_configured:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_changes_to_network_gateways_alarm_configured"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -432,7 +432,7 @@ class Test_cloudwatch_changes_to_network_gateways_alarm_configured:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_changes_to_network_gateways_alarm_configured"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -44,7 +44,7 @@ class Test_cloudwatch_cross_account_sharing_disabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_cross_account_sharing_disabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -89,7 +89,7 @@ class Test_cloudwatch_cross_account_sharing_disabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_cross_account_sharing_disabled"],
             completed_checks=0,
             audit_progress=0,
         )
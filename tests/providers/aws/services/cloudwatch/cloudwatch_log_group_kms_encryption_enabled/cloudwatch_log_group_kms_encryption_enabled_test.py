@@ -43,7 +43,7 @@ class Test_cloudwatch_log_group_kms_encryption_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_kms_encryption_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -83,7 +83,7 @@ class Test_cloudwatch_log_group_kms_encryption_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_kms_encryption_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -127,7 +127,7 @@ class Test_cloudwatch_log_group_kms_encryption_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_kms_encryption_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
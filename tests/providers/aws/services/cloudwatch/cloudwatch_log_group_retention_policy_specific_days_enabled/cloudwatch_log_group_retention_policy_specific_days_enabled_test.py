@@ -43,7 +43,7 @@ class Test_cloudwatch_log_group_retention_policy_specific_days_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_retention_policy_specific_days_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -82,7 +82,7 @@ class Test_cloudwatch_log_group_retention_policy_specific_days_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_retention_policy_specific_days_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -133,7 +133,7 @@ class Test_cloudwatch_log_group_retention_policy_specific_days_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_retention_policy_specific_days_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -184,7 +184,7 @@ class Test_cloudwatch_log_group_retention_policy_specific_days_enabled:
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_group_retention_policy_specific_days_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
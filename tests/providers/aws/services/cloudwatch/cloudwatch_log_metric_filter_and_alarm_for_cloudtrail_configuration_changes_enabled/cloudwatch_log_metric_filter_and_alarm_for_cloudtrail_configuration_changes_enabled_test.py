@@ -53,7 +53,7 @@ class Test_cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_c
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_changes_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -114,7 +114,7 @@ class Test_cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_c
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_changes_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -181,7 +181,7 @@ class Test_cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_c
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_changes_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -260,7 +260,7 @@ class Test_cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_c
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_changes_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -351,7 +351,7 @@ class Test_cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_c
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_changes_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
@@ -442,7 +442,7 @@ class Test_cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_c
         current_audit_info.audit_metadata = Audit_Metadata(
             services_scanned=0,
             # We need to set this check to call __describe_log_groups__
-            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            expected_checks=["cloudwatch_log_metric_filter_and_alarm_for_cloudtrail_configuration_changes_enabled"],
             completed_checks=0,
             audit_progress=0,
         )
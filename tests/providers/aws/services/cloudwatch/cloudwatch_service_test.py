@@ -35,8 +35,11 @@ class Test_CloudWatch_Service:
             audit_resources=None,
             audit_metadata=Audit_Metadata(
                 services_scanned=0,
-                # We need to set this check to call __describe_log_groups__
-                expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+                # We need to set these checks to gather the log groups and the metric filters
+                expected_checks=[
+                    "cloudwatch_log_group_no_secrets_in_logs",
+                    "cloudwatch_log_metric_filter_root_usage",
+                ],
                 completed_checks=0,
                 audit_progress=0,
             ),
@@ -6,6 +6,7 @@ from moto import mock_glue
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.glue.glue_service import Glue
+from prowler.providers.common.models import Audit_Metadata
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 AWS_REGION = "us-east-1"
@@ -248,3 +249,21 @@ class Test_Glue_Service:
             "--enable-job-insights": "false",
         }
         assert glue.jobs[0].region == AWS_REGION
+
+    # Test Glue gathers only the resources of the checks to execute
+    @mock_glue
+    def test_required_attributes(self):
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=["glue_etl_jobs_amazon_s3_encryption_enabled"],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        glue = Glue(audit_info)
+        assert len(glue.jobs) == 1
+        assert len(glue.security_configs) == 1
+        assert glue.connections == []
+        assert glue.tables == []
+        assert glue.catalog_encryption_settings == []
+        assert glue.dev_endpoints == []
@@ -1,15 +1,25 @@
 from json import dumps
+from unittest import mock
 
+import botocore
 from boto3 import client, session
 from freezegun import freeze_time
 from moto import mock_iam
 
+from prowler.lib.incremental_scan.incremental_scan import Incremental_Scan
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.iam.iam_service import IAM, is_service_role
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 TEST_DATETIME = "2023-01-01T12:01:01+00:00"
 
+make_api_call = botocore.client.BaseClient._make_api_call
+
+
+def make_api_call_without_get_policy_version(self, operation_name, kwarg):
+    assert operation_name != "GetPolicyVersion"
+    return make_api_call(self, operation_name, kwarg)
+
 
 class Test_IAM_Service:
     # Mocked Audit Info
@@ -701,6 +711,82 @@ class Test_IAM_Service:
                 assert policy.document["Statement"][0]["Resource"] == "*"
         assert custom_policies == 1
 
+    @mock_iam
+    def test__list_policies_version__incremental(self, tmp_path):
+        iam_client = client("iam")
+        policy_document = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {"Effect": "Allow", "Action": "*", "Resource": "*"},
+            ],
+        }
+        policy_arn = iam_client.create_policy(
+            PolicyName="policy2", PolicyDocument=dumps(policy_document)
+        )["Policy"]["Arn"]
+        audit_info = self.set_mocked_audit_info()
+        incremental_scan = Incremental_Scan()
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        with mock.patch(
+            "prowler.providers.aws.services.iam.iam_service.incremental_scan",
+            new=incremental_scan,
+        ):
+            IAM(audit_info)
+            incremental_scan.write()
+            # The documents of the policy versions are reused by the next scan
+            incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+            with mock.patch(
+                "botocore.client.BaseClient._make_api_call",
+                side_effect=make_api_call_without_get_policy_version,
+                autospec=True,
+            ):
+                iam = IAM(audit_info)
+
+        policies_documents = {policy.arn: policy.document for policy in iam.policies}
+        assert policies_documents[policy_arn] == policy_document
+
+    @mock_iam
+    def test__list_policies_version__incremental_recreated_policy(self, tmp_path):
+        iam_client = client("iam")
+        policy_arn = iam_client.create_policy(
+            PolicyName="policy2",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Deny", "Action": "*", "Resource": "*"},
+                    ],
+                }
+            ),
+        )["Policy"]["Arn"]
+        audit_info = self.set_mocked_audit_info()
+        incremental_scan = Incremental_Scan()
+        incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+        with mock.patch(
+            "prowler.providers.aws.services.iam.iam_service.incremental_scan",
+            new=incremental_scan,
+        ):
+            IAM(audit_info)
+            incremental_scan.write()
+            # The policy is recreated with the same name, ARN and version ID
+            iam_client.delete_policy(PolicyArn=policy_arn)
+            policy_document = {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "*", "Resource": "*"},
+                ],
+            }
+            assert (
+                iam_client.create_policy(
+                    PolicyName="policy2", PolicyDocument=dumps(policy_document)
+                )["Policy"]["Arn"]
+                == policy_arn
+            )
+            incremental_scan.enable(str(tmp_path), "aws", AWS_ACCOUNT_NUMBER)
+            iam = IAM(audit_info)
+
+        policies_documents = {policy.arn: policy.document for policy in iam.policies}
+        assert policies_documents[policy_arn] == policy_document
+
     # Test IAM List SAML Providers
     @mock_iam
     def test__list_saml_providers__(self):
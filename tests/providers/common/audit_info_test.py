@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 import boto3
 import botocore
 import sure  # noqa
@@ -5,7 +7,7 @@ from boto3 import session
 from mock import patch
 from moto import mock_ec2, mock_resourcegroupstaggingapi
 
-from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 from prowler.providers.azure.azure_provider import Azure_Provider
 from prowler.providers.azure.lib.audit_info.models import (
     Azure_Audit_Info,
@@ -139,6 +141,53 @@ class Test_Set_Audit_Info:
             audit_info = set_provider_audit_info(provider, arguments)
             assert isinstance(audit_info, AWS_Audit_Info)
 
+    @patch(
+        "prowler.providers.common.audit_info.validate_aws_credentials",
+        new=mock_validate_credentials,
+    )
+    @patch(
+        "prowler.providers.common.audit_info.print_aws_credentials",
+        new=mock_print_audit_credentials,
+    )
+    def test_set_audit_info_aws_organizations_role_with_role(self):
+        audited_account = "111111111111"
+        mocked_audit_info = self.set_mocked_audit_info()
+        mocked_audit_info.assumed_role_info = AWS_Assume_Role(
+            role_arn=None, session_duration=None, external_id=None
+        )
+        assumed_credentials = {
+            "Credentials": {
+                "AccessKeyId": "ASIA",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc),
+            }
+        }
+        with patch(
+            "prowler.providers.common.audit_info.current_audit_info",
+            new=mocked_audit_info,
+        ), patch(
+            "prowler.providers.common.audit_info.assume_role",
+            return_value=assumed_credentials,
+        ), patch(
+            "prowler.providers.common.audit_info.get_organizations_metadata"
+        ) as get_organizations_metadata:
+            arguments = {
+                "profile": None,
+                "role": f"arn:aws:iam::{audited_account}:role/ProwlerScan",
+                "session_duration": 3600,
+                "external_id": None,
+                "regions": None,
+                "organizations_role": f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/OrganizationsRole",
+            }
+
+            audit_info = set_provider_audit_info("aws", arguments)
+            # The account details are of the audited account, not the one of the credentials
+            assert audit_info.audited_account == audited_account
+            get_organizations_metadata.assert_called_once_with(
+                audited_account, assumed_credentials
+            )
+
     @patch(
         "prowler.providers.common.audit_info.azure_audit_info",
         new=mock_azure_audit_info,
@@ -165,6 +165,31 @@ class Test_Common_Output_Options:
             == f"prowler-output-{AWS_ACCOUNT_NUMBER}-{DATETIME}"
         )
 
+    def test_set_provider_output_options_aws_security_hub_ndjson_asff(self):
+        #  Set the cloud provider
+        provider = "aws"
+        # Set the arguments passed
+        arguments = Namespace()
+        arguments.quiet = True
+        arguments.output_modes = ["csv", "ndjson-asff"]
+        arguments.output_directory = "output_test_directory"
+        arguments.verbose = True
+        arguments.security_hub = True
+        arguments.shodan = "test-api-key"
+        arguments.only_logs = False
+
+        # Mock AWS Audit Info
+        audit_info = self.set_mocked_aws_audit_info()
+
+        allowlist_file = ""
+        bulk_checks_metadata = {}
+        output_options = set_provider_output_options(
+            provider, arguments, audit_info, allowlist_file, bulk_checks_metadata
+        )
+        assert output_options.security_hub_enabled
+        # The NDJSON-ASFF output is enough to resolve the previous findings
+        assert output_options.output_modes == ["csv", "ndjson-asff"]
+
     def test_set_provider_output_options_azure_domain(self):
         #  Set the cloud provider
         provider = "azure"